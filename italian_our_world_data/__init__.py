@@ -1,6 +1,23 @@
 """Easy DataFrame access to public data sources relevant to Italy."""
 
-from ._common import DataSourceError
+from ._common import (
+    DataSourceError,
+    ParseEvent,
+    RequestEvent,
+    RetryPolicy,
+    add_event_listener,
+    bypass_http_cache,
+    clear_http_cache,
+    close_connection_pool,
+    configure_connection_pool,
+    configure_default_retry,
+    configure_host,
+    configure_http_cache,
+    default_session,
+    record_events,
+    remove_event_listener,
+)
+from .aio import async_discover_data, async_fetch_data
 from .geo import (
     attach_administrative_boundaries,
     fetch_administrative_boundaries,
@@ -8,8 +25,14 @@ from .geo import (
     list_administrative_boundary_divisions,
 )
 from .gateway import (
+    CallSummary,
+    FetchResult,
+    clear_result_cache,
+    configure_result_cache,
+    configure_source,
     discover_data,
     fetch_data,
+    fetch_many,
     get_source_info,
     list_indicators,
     list_source_items,
@@ -35,6 +58,7 @@ from .sources import (
     fetch_pnrr_data,
     fetch_socrata_data,
     fetch_un_population_data,
+    fetch_world_bank_batch,
     fetch_world_bank_data,
     get_bdap_dataset_metadata,
     get_ckan_dataset_metadata,
@@ -44,6 +68,11 @@ from .sources import (
     get_italian_open_data_dataset_metadata,
     get_lombardy_dataset_metadata,
     get_socrata_dataset_metadata,
+    iter_ckan_datastore,
+    iter_lombardy_data,
+    iter_opencoesione_data,
+    iter_pnrr_data,
+    iter_socrata_data,
     list_ameco_variables,
     list_bankitalia_bds_catalogue,
     list_bankitalia_bds_cubes,
@@ -71,8 +100,30 @@ from .sources import (
 
 __all__ = [
     "DataSourceError",
+    "ParseEvent",
+    "RequestEvent",
+    "RetryPolicy",
+    "add_event_listener",
+    "bypass_http_cache",
+    "clear_http_cache",
+    "close_connection_pool",
+    "configure_connection_pool",
+    "configure_default_retry",
+    "configure_host",
+    "configure_http_cache",
+    "default_session",
+    "record_events",
+    "remove_event_listener",
+    "CallSummary",
+    "FetchResult",
+    "async_discover_data",
+    "async_fetch_data",
+    "clear_result_cache",
+    "configure_result_cache",
+    "configure_source",
     "discover_data",
     "fetch_data",
+    "fetch_many",
     "get_source_info",
     "list_indicators",
     "list_source_items",
@@ -96,6 +147,7 @@ __all__ = [
     "fetch_pnrr_data",
     "fetch_socrata_data",
     "fetch_un_population_data",
+    "fetch_world_bank_batch",
     "fetch_world_bank_data",
     "attach_administrative_boundaries",
     "fetch_administrative_boundaries",
@@ -108,6 +160,11 @@ __all__ = [
     "get_italian_open_data_dataset_metadata",
     "get_lombardy_dataset_metadata",
     "get_socrata_dataset_metadata",
+    "iter_ckan_datastore",
+    "iter_lombardy_data",
+    "iter_opencoesione_data",
+    "iter_pnrr_data",
+    "iter_socrata_data",
     "list_administrative_boundary_divisions",
     "list_ameco_variables",
     "list_bankitalia_bds_catalogue",
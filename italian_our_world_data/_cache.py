@@ -0,0 +1,301 @@
+"""Persistent on-disk cache for HTTP response bodies."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pandas as pd
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024**3
+DEFAULT_RESULT_TTL = 15 * 60
+DEFAULT_RESULT_MAX_BYTES = 256 * 1024**2
+CHUNK_SIZE = 1024 * 1024
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+def canonical_url(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Return ``url`` with ``params`` merged into a sorted query string."""
+    prepared = requests.Request("GET", url, params=params).prepare().url or url
+    parts = urlsplit(prepared)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def cache_key(
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Hash the canonical URL and the request headers that shape the body."""
+    relevant = sorted(
+        (str(name).lower(), str(value))
+        for name, value in (headers or {}).items()
+        if str(name).lower() not in CONDITIONAL_HEADERS
+    )
+    material = json.dumps([canonical_url(url, params), relevant])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class _BodyFile(io.FileIO):
+    """Stored body that closes itself once read to the end.
+
+    ``Response.close`` releases it through ``release_conn`` as it would a
+    pooled connection, so partly read bodies are closed as well.
+    """
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        if not data:
+            self.close()
+        return data
+
+    def release_conn(self) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Body and metadata of one cached response."""
+
+    key: str
+    url: str
+    path: Path
+    headers: Mapping[str, str]
+    encoding: Optional[str]
+    stored_at: float
+
+    @property
+    def cache_stamp(self) -> Optional[str]:
+        headers = CaseInsensitiveDict(self.headers)
+        return headers.get("ETag") or headers.get("Last-Modified")
+
+    def validators(self) -> dict[str, str]:
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if headers.get("ETag"):
+            conditional["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def response(self, *, stream: bool = False) -> requests.Response:
+        """Return a response carrying the stored body.
+
+        The body is read into memory and the file closed straight away, unless
+        ``stream`` is set; then it is read lazily from a file that closes once
+        exhausted or when the caller calls ``response.close()``.
+        """
+        response = requests.Response()
+        if stream:
+            response.raw = _BodyFile(self.path)
+        else:
+            response._content = self.path.read_bytes()
+            response._content_consumed = True
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.url = self.url
+        response.from_cache = True
+        response.cache_key = self.key
+        response.cache_stamp = self.cache_stamp
+        return response
+
+
+class HTTPCache:
+    """Store response bodies on disk with TTL and total-size eviction.
+
+    Entries younger than ``ttl`` seconds are served without contacting the
+    provider. Older entries are revalidated with ``If-None-Match`` and
+    ``If-Modified-Since``; a ``304 Not Modified`` reuses the stored body.
+    When the stored bodies exceed ``max_bytes``, the least recently used
+    entries are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Any,
+        *,
+        ttl: float = 0,
+        max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def _write(self, path: Path, chunks: Iterable[bytes]) -> int:
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        size = 0
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                for chunk in chunks:
+                    stream.write(chunk)
+                    size += len(chunk)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        return size
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        body_path, meta_path = self._paths(key)
+        try:
+            metadata = json.loads(meta_path.read_text())
+            size = body_path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        if size != metadata.get("size"):
+            return None
+        os.utime(meta_path)
+        return CacheEntry(
+            key=key,
+            url=metadata["url"],
+            path=body_path,
+            headers=metadata.get("headers", {}),
+            encoding=metadata.get("encoding"),
+            stored_at=metadata["stored_at"],
+        )
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def store(self, key: str, url: str, response: Any) -> CacheEntry:
+        """Write a response body to disk, streaming it when it is not loaded."""
+        headers = CaseInsensitiveDict(getattr(response, "headers", None) or {})
+        if hasattr(response, "iter_content"):
+            chunks: Iterable[bytes] = response.iter_content(CHUNK_SIZE)
+        else:
+            chunks = [response.content]
+        body_path, meta_path = self._paths(key)
+        metadata = {
+            "url": url,
+            "size": self._write(body_path, chunks),
+            "stored_at": time.time(),
+            "encoding": getattr(response, "encoding", None),
+            "headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+        }
+        self._write(meta_path, [json.dumps(metadata).encode()])
+        self.evict(keep=key)
+        return CacheEntry(
+            key=key,
+            url=url,
+            path=body_path,
+            headers=metadata["headers"],
+            encoding=metadata["encoding"],
+            stored_at=metadata["stored_at"],
+        )
+
+    def refresh(self, key: str) -> None:
+        """Restart the TTL of an entry after a successful revalidation."""
+        _, meta_path = self._paths(key)
+        try:
+            metadata = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return
+        metadata["stored_at"] = time.time()
+        self._write(meta_path, [json.dumps(metadata).encode()])
+
+    def evict(self, *, keep: Optional[str] = None) -> None:
+        if self.max_bytes is None:
+            return
+        entries = []
+        total = 0
+        for meta_path in self.directory.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                size = body_path.stat().st_size
+                used = meta_path.stat().st_mtime
+            except OSError:
+                continue
+            total += size
+            if meta_path.stem != keep:
+                entries.append((used, size, body_path, meta_path))
+        for _, size, body_path, meta_path in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.iterdir():
+            if path.suffix in {".body", ".json", ".tmp"}:
+                path.unlink(missing_ok=True)
+
+
+class ResultCache:
+    """In-memory LRU cache of parsed ``DataFrame`` results.
+
+    Entries expire ``ttl`` seconds after they are stored, and the least
+    recently used entries are dropped once the frames' deep memory usage
+    exceeds ``max_bytes``. Frames are copied on the way in and out, so
+    callers can modify what they receive without affecting the cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_RESULT_TTL,
+        max_bytes: int = DEFAULT_RESULT_MAX_BYTES,
+    ) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, int, pd.DataFrame]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, size, frame = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                self.size -= size
+                return None
+            self._entries.move_to_end(key)
+        return frame.copy()
+
+    def put(self, key: Hashable, frame: pd.DataFrame) -> None:
+        if self.ttl <= 0 or not isinstance(frame, pd.DataFrame):
+            return
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        stored = (time.monotonic(), size, frame.copy())
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = stored
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -2,20 +2,731 @@
 
 from __future__ import annotations
 
-from io import BytesIO, StringIO
-from typing import Any, Iterable, Mapping, Optional
+import codecs
+import copy
+import csv
+import random
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from io import BufferedReader, BytesIO, RawIOBase, StringIO
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, TypeVar
+from urllib.parse import urlsplit
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from ._cache import DEFAULT_CACHE_MAX_BYTES, HTTPCache, cache_key
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 
 DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 10
+STREAM_CHUNK_SIZE = 1024 * 1024
+CSV_SNIFF_BYTES = 64 * 1024
+CSV_DELIMITERS = ",;\t|"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class DataSourceError(RuntimeError):
     """Raised when a public data source cannot satisfy a request."""
 
 
+_POOL_LOCK = threading.Lock()
+_POOL_SETTINGS: dict[str, Any] = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "pool_block": False,
+    "host_pool_sizes": {},
+}
+_POOL_ADAPTERS: Optional[list[tuple[str, HTTPAdapter]]] = None
+_POOL_GENERATION = 0
+_THREAD_SESSIONS = threading.local()
+
+
+def _pool_adapters() -> list[tuple[str, HTTPAdapter]]:
+    global _POOL_ADAPTERS
+    with _POOL_LOCK:
+        if _POOL_ADAPTERS is None:
+            settings = dict(_POOL_SETTINGS)
+            shared = HTTPAdapter(
+                pool_connections=settings["pool_connections"],
+                pool_maxsize=settings["pool_maxsize"],
+                pool_block=settings["pool_block"],
+            )
+            adapters = [("https://", shared), ("http://", shared)]
+            for host, size in settings["host_pool_sizes"].items():
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=size,
+                    pool_block=settings["pool_block"],
+                )
+                adapters.append((f"https://{host}", adapter))
+                adapters.append((f"http://{host}", adapter))
+            _POOL_ADAPTERS = adapters
+        return _POOL_ADAPTERS
+
+
+def configure_connection_pool(
+    *,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    pool_block: Optional[bool] = None,
+    host_pool_sizes: Optional[Mapping[str, int]] = None,
+) -> None:
+    """Configure the shared keep-alive pool used when no ``session`` is passed.
+
+    ``pool_connections`` is the number of hosts whose pools are kept open and
+    ``pool_maxsize`` the number of idle connections kept per host.
+    ``host_pool_sizes`` overrides the per-host size for selected hosts, for
+    example ``{"esploradati.istat.it": 4}``. With ``pool_block=True`` callers
+    wait for a free connection instead of opening extra unpooled ones.
+    Existing connections are closed and the pool is rebuilt on next use.
+    """
+    global _POOL_ADAPTERS, _POOL_GENERATION
+    with _POOL_LOCK:
+        if pool_connections is not None:
+            _POOL_SETTINGS["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            _POOL_SETTINGS["pool_maxsize"] = pool_maxsize
+        if pool_block is not None:
+            _POOL_SETTINGS["pool_block"] = pool_block
+        if host_pool_sizes is not None:
+            _POOL_SETTINGS["host_pool_sizes"] = dict(host_pool_sizes)
+        adapters, _POOL_ADAPTERS = _POOL_ADAPTERS, None
+        _POOL_GENERATION += 1
+    for _, adapter in adapters or []:
+        adapter.close()
+
+
+def close_connection_pool() -> None:
+    """Close every pooled connection; the pool reopens lazily when needed."""
+    configure_connection_pool()
+
+
+def default_session() -> requests.Session:
+    """Return this thread's session bound to the shared connection pool.
+
+    Each thread gets its own :class:`requests.Session`, so cookies and other
+    session state are never shared, while the underlying per-host connection
+    pools are shared by every thread in the process. Compressed bodies are
+    decompressed as they are read.
+    """
+    session = getattr(_THREAD_SESSIONS, "session", None)
+    if session is not None and _THREAD_SESSIONS.generation == _POOL_GENERATION:
+        return session
+    generation = _POOL_GENERATION
+    session = requests.Session()
+    for prefix, adapter in _pool_adapters():
+        session.mount(prefix, adapter)
+    _THREAD_SESSIONS.session = session
+    _THREAD_SESSIONS.generation = generation
+    return session
+
+
+def map_concurrently(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+) -> list[R]:
+    """Apply ``function`` to ``items`` on a bounded thread pool, keeping order.
+
+    Each call runs in a copy of the caller's context, so per-call transport
+    settings such as a batch's host limits follow the work into the pool.
+    The first exception is re-raised and calls that have not started yet are
+    cancelled.
+    """
+    work = list(items)
+    if max_workers <= 1 or len(work) <= 1:
+        return [function(item) for item in work]
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(work)))
+    try:
+        futures = [executor.submit(copy_context().run, function, item) for item in work]
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_concurrently(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+) -> Iterator[R]:
+    """Yield ``function(item)`` for each item in order, running calls ahead.
+
+    Like :func:`map_concurrently`, but results are handed out as soon as
+    they are next in line, and at most ``max_workers`` calls are in flight
+    or waiting, so memory stays bounded however many items there are.
+    """
+    work = iter(items)
+    if max_workers <= 1:
+        for item in work:
+            yield function(item)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = deque(
+            executor.submit(copy_context().run, function, item) for item in islice(work, max_workers)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(work, 1):
+                pending.append(executor.submit(copy_context().run, function, item))
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_prefetched(
+    fetch: Callable[[T], R],
+    first: T,
+    following: Callable[[R], Optional[T]],
+) -> Iterator[R]:
+    """Yield ``fetch(first)``, then ``fetch(following(previous))`` until ``None``.
+
+    Each next call starts on a background thread as soon as the previous
+    result is known, so the following page downloads while the caller works
+    on the current one. Closing the generator abandons the call in flight.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(copy_context().run, fetch, first)
+        while True:
+            result = future.result()
+            upcoming = following(result)
+            if upcoming is not None:
+                future = executor.submit(copy_context().run, fetch, upcoming)
+            yield result
+            if upcoming is None:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def url_host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class HostLimiter:
+    """Cap the number of concurrent requests sent to each host."""
+
+    def __init__(self, max_per_host: int) -> None:
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = url_host(url)
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+
+_HOST_LIMITER: ContextVar[Optional[HostLimiter]] = ContextVar(
+    "italian_our_world_data_host_limiter", default=None
+)
+
+
+@contextmanager
+def limit_hosts(limiter: Optional[HostLimiter]) -> Iterator[None]:
+    """Apply ``limiter`` to every request made inside the ``with`` block."""
+    token = _HOST_LIMITER.set(limiter)
+    try:
+        yield
+    finally:
+        _HOST_LIMITER.reset(token)
+
+
+def _host_slot(url: str) -> Any:
+    limiter = _HOST_LIMITER.get()
+    return limiter.slot(url) if limiter is not None else nullcontext()
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    Nothing is remembered once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Any, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, function: Callable[[], T]) -> tuple[T, bool]:
+        """Return ``(result, leader)``; ``leader`` is false for shared results."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, False
+        try:
+            flight.result = function()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, True
+
+
+_IN_FLIGHT = SingleFlight()
+
+
+def _flight_key(kind: str, url: str, kwargs: Mapping[str, Any]) -> tuple[Any, ...]:
+    session = kwargs.get("session")
+    return (
+        kind,
+        cache_key(url, kwargs.get("params"), kwargs.get("headers")),
+        None if session is None else id(session),
+        kwargs.get("cache"),
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How transient HTTP failures are retried.
+
+    Responses with a status in ``statuses`` and connection errors or
+    timeouts are retried up to ``attempts`` times in total, waiting
+    ``backoff * 2 ** (attempt - 1)`` seconds (capped at ``max_backoff``) plus
+    up to ``jitter`` times that delay at random. A ``Retry-After`` header is
+    honoured when it is not longer than ``max_retry_after`` seconds;
+    otherwise the response is returned as a failure straight away.
+    """
+
+    attempts: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.5
+    max_retry_after: float = 120.0
+    statuses: tuple[int, ...] = (429, 502, 503, 504)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        wait = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        wait += random.uniform(0, wait * self.jitter)
+        if retry_after is None:
+            return wait
+        if retry_after > self.max_retry_after:
+            return None
+        return max(retry_after, wait)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second."""
+
+    def __init__(self, rate: float, burst: float = 1) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one request slot and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+
+    def acquire(self) -> None:
+        """Reserve one request slot, sleeping until it is available."""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for ``seconds``, for example after a 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@dataclass(frozen=True)
+class _HostPolicy:
+    bucket: Optional[TokenBucket] = None
+    retry: Optional[RetryPolicy] = None
+    unlimited: bool = False
+
+
+_DEFAULT_RETRY = RetryPolicy()
+# Limits providers publish, registered from the source registry.
+_HOST_DEFAULTS: dict[str, _HostPolicy] = {}
+# Settings made with configure_host(), layered over the defaults.
+_HOST_POLICIES: dict[str, _HostPolicy] = {}
+
+
+def set_host_defaults(
+    host: str,
+    *,
+    requests_per_second: float,
+    burst: float = 1,
+    retry: Optional[RetryPolicy] = None,
+) -> None:
+    """Record a provider's own limits for ``host``.
+
+    Defaults apply until :func:`configure_host` overrides them and survive
+    when user settings are cleared.
+    """
+    bucket = TokenBucket(requests_per_second, burst)
+    _HOST_DEFAULTS[host.lower()] = _HostPolicy(bucket=bucket, retry=retry)
+
+
+def configure_host(
+    host: str,
+    *,
+    requests_per_second: Optional[float] = None,
+    burst: float = 1,
+    retry: Optional[RetryPolicy] = None,
+) -> None:
+    """Set the rate limit and retry policy for every request to ``host``.
+
+    ``requests_per_second`` is enforced with a token bucket shared by all
+    threads; ``burst`` requests may be sent back to back before the rate
+    applies. ``retry`` replaces the default :class:`RetryPolicy` for this
+    host. Settings left as ``None`` keep the host's built-in default, such as
+    ISTAT's 5 requests per minute; ``requests_per_second=0`` lifts any limit.
+    The call replaces earlier ``configure_host`` settings for ``host``.
+    """
+    bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+    _HOST_POLICIES[host.lower()] = _HostPolicy(
+        bucket=bucket, retry=retry, unlimited=requests_per_second == 0
+    )
+
+
+def _host_policy(url: str) -> _HostPolicy:
+    host = url_host(url)
+    default = _HOST_DEFAULTS.get(host, _HostPolicy())
+    policy = _HOST_POLICIES.get(host)
+    if policy is None:
+        return default
+    bucket = policy.bucket or (None if policy.unlimited else default.bucket)
+    return _HostPolicy(bucket=bucket, retry=policy.retry or default.retry)
+
+
+def configure_default_retry(policy: RetryPolicy) -> None:
+    """Replace the retry policy used for hosts without their own policy."""
+    global _DEFAULT_RETRY
+    _DEFAULT_RETRY = policy
+
+
+def retry_after(response: Any) -> Optional[float]:
+    """Return the seconds a ``Retry-After`` header asks to wait, if any."""
+    value = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def host_limits(url: str) -> tuple[Optional[TokenBucket], RetryPolicy]:
+    """Return the token bucket (if any) and retry policy applying to ``url``."""
+    policy = _host_policy(url)
+    return policy.bucket, policy.retry or _DEFAULT_RETRY
+
+
+def _send(send: Callable[..., Any], url: str, options: Mapping[str, Any]) -> Any:
+    """Send one request through the host's rate limit and retry policy."""
+    bucket, retry = host_limits(url)
+    attempt = 1
+    while True:
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            with _host_slot(url):
+                response = send(url, **options)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retry.attempts:
+                raise
+            delay = retry.delay(attempt)
+        else:
+            if response.status_code not in retry.statuses or attempt >= retry.attempts:
+                return response
+            delay = retry.delay(attempt, retry_after(response))
+            if delay is None:
+                return response
+            if response.status_code == 429 and bucket is not None:
+                bucket.pause(delay)
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+        time.sleep(delay)
+        attempt += 1
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """Timing of one HTTP request, reported to event listeners.
+
+    ``time_to_first_byte`` is the time until the response headers arrived
+    (``None`` for cached bodies); ``download_time`` runs until the body was
+    fully read, which for streamed responses includes incremental parsing.
+    ``bytes`` counts the decompressed body and ``transfer_bytes`` what came
+    over the wire, as sent with ``content_encoding``.
+    """
+
+    url: str
+    method: str
+    source: Optional[str]
+    status: Optional[int]
+    time_to_first_byte: Optional[float]
+    download_time: float
+    bytes: Optional[int]
+    transfer_bytes: Optional[int] = None
+    content_encoding: Optional[str] = None
+    from_cache: bool = False
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ParseEvent:
+    """Time spent turning a downloaded body into Python objects."""
+
+    parser: str
+    source: Optional[str]
+    url: Optional[str]
+    rows: Optional[int]
+    parse_time: float
+
+
+_LISTENERS: list[Callable[[Any], None]] = []
+_RECORDERS: ContextVar[tuple[list[Any], ...]] = ContextVar(
+    "italian_our_world_data_recorders", default=()
+)
+_SOURCE: ContextVar[Optional[str]] = ContextVar("italian_our_world_data_source", default=None)
+
+
+def add_event_listener(listener: Callable[[Any], None]) -> None:
+    """Call ``listener`` with every :class:`RequestEvent` and :class:`ParseEvent`.
+
+    Listeners run synchronously in the thread that made the request, so they
+    should be quick and must not raise.
+    """
+    _LISTENERS.append(listener)
+
+
+def remove_event_listener(listener: Callable[[Any], None]) -> None:
+    """Stop calling a listener registered with :func:`add_event_listener`."""
+    _LISTENERS.remove(listener)
+
+
+@contextmanager
+def record_events() -> Iterator[list[Any]]:
+    """Collect the events emitted inside the ``with`` block into a list.
+
+    Work started inside the block on other threads by this library, such as
+    concurrent page downloads, is recorded as well.
+    """
+    events: list[Any] = []
+    token = _RECORDERS.set((*_RECORDERS.get(), events))
+    try:
+        yield events
+    finally:
+        _RECORDERS.reset(token)
+
+
+@contextmanager
+def source_scope(source: Optional[str]) -> Iterator[None]:
+    """Attribute the events emitted inside the ``with`` block to ``source``."""
+    token = _SOURCE.set(source)
+    try:
+        yield
+    finally:
+        _SOURCE.reset(token)
+
+
+def instrumented() -> bool:
+    return bool(_LISTENERS) or bool(_RECORDERS.get())
+
+
+def emit_event(event: Any) -> None:
+    for events in _RECORDERS.get():
+        events.append(event)
+    for listener in list(_LISTENERS):
+        listener(event)
+
+
+def _row_count(result: Any) -> Optional[int]:
+    if isinstance(result, (pd.DataFrame, list)):
+        return len(result)
+    return getattr(result, "num_rows", None)
+
+
+def timed_parse(
+    parser: str,
+    function: Callable[..., R],
+    *args: Any,
+    url: Optional[str] = None,
+    **kwargs: Any,
+) -> R:
+    """Call a parser and report a :class:`ParseEvent` when instrumented."""
+    if not instrumented():
+        return function(*args, **kwargs)
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    emit_event(
+        ParseEvent(
+            parser=parser,
+            source=_SOURCE.get(),
+            url=url,
+            rows=_row_count(result),
+            parse_time=time.perf_counter() - start,
+        )
+    )
+    return result
+
+
+def _time_to_first_byte(response: Any) -> Optional[float]:
+    elapsed = getattr(response, "elapsed", None)
+    if elapsed is None or getattr(response, "from_cache", False):
+        return None
+    return elapsed.total_seconds()
+
+
+def _transfer_size(response: Any) -> Optional[int]:
+    if response is None or getattr(response, "from_cache", False):
+        return None
+    tell = getattr(getattr(response, "raw", None), "tell", None)
+    if tell is None:
+        return None
+    try:
+        return int(tell())  # urllib3 counts the bytes read before decoding
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def request_event(
+    url: str,
+    method: str,
+    started: float,
+    response: Any = None,
+    *,
+    size: Optional[int] = None,
+    source: Optional[str] = None,
+    error: Optional[Exception] = None,
+) -> RequestEvent:
+    """Describe one finished (or failed) request for event listeners."""
+    return RequestEvent(
+        url=url,
+        method=method,
+        source=source if source is not None else _SOURCE.get(),
+        status=getattr(response, "status_code", None),
+        time_to_first_byte=_time_to_first_byte(response),
+        download_time=time.perf_counter() - started,
+        bytes=size,
+        transfer_bytes=_transfer_size(response),
+        content_encoding=(getattr(response, "headers", None) or {}).get("Content-Encoding"),
+        from_cache=bool(getattr(response, "from_cache", False)),
+        error=None if error is None else str(error),
+    )
+
+
+_HTTP_CACHE: Optional[HTTPCache] = None
+_CACHE_BYPASS: ContextVar[bool] = ContextVar("italian_our_world_data_cache_bypass", default=False)
+_PARSED_JSON: "OrderedDict[tuple[str, str], Any]" = OrderedDict()
+_PARSED_JSON_LOCK = threading.Lock()
+_PARSED_JSON_ENTRIES = 8
+
+
+def configure_http_cache(
+    directory: Any = None,
+    *,
+    ttl: float = 0,
+    max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+) -> Optional[HTTPCache]:
+    """Enable, reconfigure, or disable the persistent HTTP response cache.
+
+    Pass a ``directory`` to store successful GET response bodies on disk,
+    keyed by URL, normalised query parameters, and request headers. Entries
+    younger than ``ttl`` seconds are reused without a request; older entries
+    are revalidated with ``ETag``/``Last-Modified`` so an unchanged payload
+    costs one ``304`` round-trip. ``max_bytes`` bounds the stored bodies, and
+    ``None`` as ``directory`` disables the cache.
+    """
+    global _HTTP_CACHE
+    _HTTP_CACHE = HTTPCache(directory, ttl=ttl, max_bytes=max_bytes) if directory else None
+    with _PARSED_JSON_LOCK:
+        _PARSED_JSON.clear()
+    return _HTTP_CACHE
+
+
+def clear_http_cache() -> None:
+    """Remove every stored response from the configured HTTP cache."""
+    if _HTTP_CACHE is not None:
+        _HTTP_CACHE.clear()
+    with _PARSED_JSON_LOCK:
+        _PARSED_JSON.clear()
+
+
+@contextmanager
+def bypass_http_cache() -> Iterator[None]:
+    """Skip the HTTP and parsed-result caches inside the ``with`` block."""
+    token = _CACHE_BYPASS.set(True)
+    try:
+        yield
+    finally:
+        _CACHE_BYPASS.reset(token)
+
+
+def caches_bypassed() -> bool:
+    """Return whether the caller is inside :func:`bypass_http_cache`."""
+    return _CACHE_BYPASS.get()
+
+
+def _active_cache(cache: Optional[bool]) -> Optional[HTTPCache]:
+    if cache is False or (cache is None and _CACHE_BYPASS.get()):
+        return None
+    return _HTTP_CACHE
+
+
 def get_response(
     url: str,
     *,
@@ -23,48 +734,501 @@ def get_response(
     headers: Optional[Mapping[str, str]] = None,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
+    cache: Optional[bool] = None,
+    stream: bool = False,
+) -> Any:
+    """Return an HTTP response or raise a source-oriented error.
+
+    Without ``session`` the request goes through :func:`default_session`, so
+    repeated and paginated calls reuse open connections to each host. Every
+    request honours the host's rate limit and retries transient failures
+    (see :func:`configure_host`). When :func:`configure_http_cache` is
+    active, pass ``cache=False`` to bypass it for this request. With
+    ``stream=True`` the body is left unread so it can be consumed
+    incrementally; a cached body is then written to disk chunk by chunk and
+    served back from the cache file.
+
+    Identical non-streaming requests issued concurrently, for example by
+    several threads listing the same catalogue, share one download.
+    """
+    request = {"params": params, "headers": headers, "session": session, "cache": cache}
+    started = time.perf_counter()
+    if stream:
+        try:
+            response = _get_response(url, timeout=timeout, stream=True, **request)
+        except DataSourceError as exc:
+            if instrumented():
+                emit_event(request_event(url, "GET", started, error=exc))
+            raise
+        if instrumented():
+            response.instrumentation = (started, _SOURCE.get())
+        return response
+
+    def download() -> Any:
+        try:
+            response = _get_response(url, timeout=timeout, **request)
+            size = len(response.content)  # load the body once so waiting callers can share it
+        except DataSourceError as exc:
+            if instrumented():
+                emit_event(request_event(url, "GET", started, error=exc))
+            raise
+        if instrumented():
+            emit_event(request_event(url, "GET", started, response, size=size))
+        return response
+
+    return _IN_FLIGHT.do(_flight_key("response", url, request), download)[0]
+
+
+def _cached_response(entry: Any, stream: bool) -> Any:
+    try:
+        return entry.response(stream=stream)
+    except OSError:
+        return None  # evicted by another thread since it was looked up
+
+
+def _get_response(
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]],
+    headers: Optional[Mapping[str, str]],
+    session: Any,
+    timeout: int,
+    cache: Optional[bool],
+    stream: bool = False,
 ) -> Any:
-    """Return an HTTP response or raise a source-oriented error."""
-    client = session or requests
+    client = session or default_session()
+    options: dict[str, Any] = {"params": params, "headers": headers, "timeout": timeout}
+    if stream:
+        options["stream"] = True
+    store = _active_cache(cache)
+    entry = None
+    if store is not None:
+        key = cache_key(url, params, headers)
+        entry = store.load(key)
+        if entry is not None and store.is_fresh(entry):
+            cached = _cached_response(entry, stream)
+            if cached is not None:
+                return cached
+            entry = None
+        if entry is not None:
+            options["headers"] = {**(headers or {}), **entry.validators()}
     try:
-        response = client.get(url, params=params, headers=headers, timeout=timeout)
+        response = _send(client.get, url, options)
+        if entry is not None and response.status_code == 304:
+            store.refresh(key)
+            cached = _cached_response(entry, stream)
+            if cached is not None:
+                return cached
+            # The body went between the lookup and the 304: ask for it in full.
+            response = _send(client.get, url, {**options, "headers": headers})
         response.raise_for_status()
-        return response
+        if store is not None and response.status_code == 200:
+            stored = store.store(key, url, response)
+            if stream:
+                cached = _cached_response(stored, True)
+                if cached is not None:
+                    return cached
+                response = _send(client.get, url, {**options, "headers": headers})
+                response.raise_for_status()
+                return response
+            response.cache_key = key
+            response.cache_stamp = stored.cache_stamp
+    except requests.RequestException as exc:
+        raise DataSourceError(f"Request failed for {url}: {exc}") from exc
+    return response
+
+
+def post_response(
+    url: str,
+    *,
+    data: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Any:
+    """POST form ``data`` with the same pooling, limits, and retries as GETs."""
+    client = session or default_session()
+    options = {"data": dict(data or {}), "headers": headers, "timeout": timeout}
+    started = time.perf_counter()
+    try:
+        response = _send(client.post, url, options)
+        response.raise_for_status()
+        size = len(response.content)
     except requests.RequestException as exc:
+        if instrumented():
+            emit_event(request_event(url, "POST", started, error=exc))
         raise DataSourceError(f"Request failed for {url}: {exc}") from exc
+    if instrumented():
+        emit_event(request_event(url, "POST", started, response, size=size))
+    return response
+
+
+def _decode_json(response: Any) -> Any:
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if content:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # not UTF-8 or not JSON: let the standard decoder decide
+    return response.json()
+
+
+def response_json(response: Any, *, url: Optional[str] = None) -> Any:
+    """Decode a JSON response body, using orjson on the raw bytes when installed.
+
+    Invalid payloads raise ``ValueError`` exactly as ``response.json()``
+    does; bodies orjson rejects, such as UTF-16 JSON, are retried with the
+    standard decoder.
+    """
+    return timed_parse("json", _decode_json, response, url=url)
 
 
 def get_json(url: str, **kwargs: Any) -> Any:
-    """Retrieve a JSON response with a useful error for invalid payloads."""
+    """Retrieve a JSON response with a useful error for invalid payloads.
+
+    Payloads served from the HTTP cache after a ``304`` revalidation reuse
+    the already decoded object when it is still held in memory, and
+    concurrent identical requests share one download and decode. Every
+    caller receives its own copy, so mutating a result never affects another.
+    """
+    key = _flight_key("json", url, kwargs)
+    payload, leader = _IN_FLIGHT.do(key, lambda: _get_json(url, **kwargs))
+    return payload if leader else copy.deepcopy(payload)
+
+
+def _get_json(url: str, **kwargs: Any) -> Any:
     response = get_response(url, **kwargs)
+    memo_key = None
+    if getattr(response, "cache_stamp", None):
+        memo_key = (response.cache_key, response.cache_stamp)
+        with _PARSED_JSON_LOCK:
+            memo = _PARSED_JSON.get(memo_key)
+            if memo is not None:
+                _PARSED_JSON.move_to_end(memo_key)
+        if memo is not None:
+            return copy.deepcopy(memo)
     try:
-        return response.json()
+        payload = response_json(response, url=url)
     except ValueError as exc:
         raise DataSourceError(f"Invalid JSON returned by {url}") from exc
+    if memo_key is not None:
+        memo = copy.deepcopy(payload)
+        with _PARSED_JSON_LOCK:
+            _PARSED_JSON[memo_key] = memo
+            while len(_PARSED_JSON) > _PARSED_JSON_ENTRIES:
+                _PARSED_JSON.popitem(last=False)
+    return payload
+
+
+def _gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress chunks holding one or more concatenated gzip members."""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        while chunk:
+            yield decompressor.decompress(chunk)
+            chunk = decompressor.unused_data
+            if decompressor.eof:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    yield decompressor.flush()
+
+
+def _decoded_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Pass chunks through, decompressing bodies that are themselves gzip files.
+
+    ``Content-Encoding`` is already undone by urllib3; this covers downloads
+    such as ``.csv.gz`` resources and ``compressed=true`` API variants.
+    """
+    for first in chunks:
+        if not first:
+            continue
+        if first.startswith(_GZIP_MAGIC):
+            yield from _gunzip(chain([first], chunks))
+        else:
+            yield first
+            yield from chunks
+        return
 
 
-def csv_frame(response: Any, **kwargs: Any) -> pd.DataFrame:
-    """Load text or binary CSV response content into a DataFrame."""
+def decompressed(content: bytes) -> bytes:
+    """Return ``content``, decompressed when it is a gzip file."""
+    if not content.startswith(_GZIP_MAGIC):
+        return content
+    try:
+        return b"".join(_gunzip([content]))
+    except zlib.error as exc:
+        raise DataSourceError(f"Invalid gzip data: {exc}") from exc
+
+
+class _ResponseReader(RawIOBase):
+    """Expose ``response.iter_content`` as a binary file for the CSV parser."""
+
+    def __init__(self, response: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+        self._url = getattr(response, "url", None)
+        self._response = response
+        self._chunks = _decoded_chunks(response.iter_content(chunk_size))
+        self._pending = b""
+        self._size = 0
+
+    def _finished(self) -> None:
+        instrumentation = getattr(self._response, "instrumentation", None)
+        if instrumentation is None:
+            return
+        self._response.instrumentation = None
+        started, source = instrumentation
+        emit_event(
+            request_event(
+                self._url, "GET", started, self._response, size=self._size, source=source
+            )
+        )
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                self._finished()
+                return 0
+            except (requests.RequestException, zlib.error) as exc:
+                raise DataSourceError(f"Download interrupted for {self._url}: {exc}") from exc
+            self._size += len(self._pending)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def response_stream(response: Any) -> BufferedReader:
+    """Return a buffered binary stream over a (possibly streamed) response.
+
+    Gzip-file bodies are decompressed block by block as they are read.
+    """
+    return BufferedReader(_ResponseReader(response), buffer_size=STREAM_CHUNK_SIZE)
+
+
+def csv_frame(response: Any, *, chunksize: Optional[int] = None, **kwargs: Any) -> Any:
+    """Load CSV response content into a DataFrame.
+
+    Responses exposing ``iter_content`` are parsed straight from their byte
+    stream without decoding the body into one string first; combine with
+    ``get_response(..., stream=True)`` to keep memory bounded. With
+    ``chunksize`` an iterator of DataFrame chunks is returned instead.
+    """
     kwargs.setdefault("dtype", str)
-    text = getattr(response, "text", None)
-    if text is not None:
-        return pd.read_csv(StringIO(text), **kwargs)
-    return pd.read_csv(BytesIO(response.content), **kwargs)
-
-
-def observations_frame(frame: pd.DataFrame) -> pd.DataFrame:
-    """Use common names for observation period and value columns."""
-    names = {column: str(column).lower() for column in frame.columns}
-    frame = frame.rename(columns=names)
-    frame = frame.rename(
-        columns={
-            "obs_value": "value",
-            "date": "time_period",
-            "time": "time_period",
-        }
+    kwargs["chunksize"] = chunksize
+    url = getattr(response, "url", None)
+    if hasattr(response, "iter_content"):
+        kwargs.setdefault("encoding", getattr(response, "encoding", None) or "utf-8")
+        source: Any = response_stream(response)
+    elif (text := getattr(response, "text", None)) is not None:
+        source = StringIO(text)
+    else:
+        source = BytesIO(response.content)
+    if chunksize is not None:
+        return pd.read_csv(source, **kwargs)
+    return timed_parse("csv_frame", pd.read_csv, source, url=url, **kwargs)
+
+
+def _sample_encoding(sample: bytes) -> str:
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        decoder.decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "cp1252"
+    return "utf-8"
+
+
+def sniff_csv(sample: bytes) -> dict[str, Any]:
+    """Detect encoding, delimiter, and quoting from the start of a CSV file.
+
+    Returns ``read_csv`` options. ``sep`` is omitted when the dialect cannot
+    be recognised from ``sample``.
+    """
+    encoding = _sample_encoding(sample)
+    options: dict[str, Any] = {"encoding": encoding}
+    text = sample.decode(encoding, errors="ignore")
+    if len(sample) >= CSV_SNIFF_BYTES and "\n" in text:
+        text = text[: text.rindex("\n")]
+    try:
+        dialect = csv.Sniffer().sniff(text, delimiters=CSV_DELIMITERS)
+    except csv.Error:
+        return options
+    options.update(
+        sep=dialect.delimiter,
+        quotechar=dialect.quotechar,
+        doublequote=dialect.doublequote,
     )
+    if dialect.escapechar:
+        options["escapechar"] = dialect.escapechar
+    return options
+
+
+def delimited_frame(content: bytes, *, url: Optional[str] = None, **kwargs: Any) -> pd.DataFrame:
+    """Parse a downloaded CSV/TSV body of unknown dialect.
+
+    The dialect and encoding are detected from the first
+    :data:`CSV_SNIFF_BYTES` so the whole body can be read by pandas' C
+    parser; pass ``engine="pyarrow"`` to use pyarrow instead. Explicit
+    ``read_csv`` keyword arguments override what was detected. Bodies whose
+    dialect cannot be detected fall back to the slower Python sniffing
+    parser, and bodies that are not valid UTF-8 past the sample are re-read
+    as Latin-1. Gzip-compressed files are decompressed first.
+    """
+    content = decompressed(content)
+    options = sniff_csv(content[:CSV_SNIFF_BYTES])
+    explicit_encoding = "encoding" in kwargs
+    options.update(kwargs)
+    if options.get("sep") is None:
+        options.update(sep=None, engine="python")
+    options.setdefault("engine", "c")
+    try:
+        return timed_parse("read_csv", pd.read_csv, BytesIO(content), url=url, **options)
+    except UnicodeDecodeError:
+        if explicit_encoding:
+            raise
+        options["encoding"] = "latin-1"
+        return timed_parse("read_csv", pd.read_csv, BytesIO(content), url=url, **options)
+
+
+DEFAULT_CATEGORY_RATIO = 0.5
+RESULT_FORMATS = ("pandas", "arrow", "pandas_arrow")
+_OBSERVATION_NAMES = {"obs_value": "value", "date": "time_period", "time": "time_period"}
+
+
+def _observation_name(column: Any) -> str:
+    name = str(column).lower()
+    return _OBSERVATION_NAMES.get(name, name)
+
+
+def check_result_format(result_format: str) -> str:
+    if result_format not in RESULT_FORMATS:
+        choices = ", ".join(RESULT_FORMATS)
+        raise ValueError(f"Unknown result_format {result_format!r}. Choose one of: {choices}")
+    return result_format
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.csv  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Arrow results require pyarrow; install italian-our-world-data[arrow]"
+        ) from exc
+    return pyarrow
+
+
+def arrow_result(table: Any, result_format: str) -> Any:
+    """Return a ``pyarrow.Table`` in the requested result format."""
+    if result_format == "arrow":
+        return table
+    if result_format == "pandas_arrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+def to_result_format(frame: Any, result_format: str) -> Any:
+    """Convert a parsed ``DataFrame`` to ``result_format``.
+
+    ``"pandas"`` returns the frame unchanged, ``"arrow"`` a
+    ``pyarrow.Table``, and ``"pandas_arrow"`` a DataFrame whose columns use
+    ``pandas.ArrowDtype``. Geometry columns of a GeoDataFrame are encoded as
+    WKB binary. Other results, such as metadata dictionaries, are returned
+    unchanged.
+    """
+    if check_result_format(result_format) == "pandas" or not isinstance(frame, pd.DataFrame):
+        return frame
+    if hasattr(frame, "to_wkb"):
+        frame = frame.to_wkb()
+    table = _pyarrow().Table.from_pandas(pd.DataFrame(frame), preserve_index=False)
+    return arrow_result(table, result_format)
+
+
+def csv_table(
+    response: Any,
+    *,
+    value_column: Optional[str] = "OBS_VALUE",
+    compact: bool = True,
+    value_dtype: Any = "float64",
+) -> Any:
+    """Parse a CSV body straight into a ``pyarrow.Table`` of observations.
+
+    Every column is read as text, dictionary-encoded when ``compact``, except
+    ``value_column``, which is read as ``value_dtype``. Column names follow
+    :func:`observations_frame`.
+    """
+    pa = _pyarrow()
+    if hasattr(response, "iter_content"):
+        stream: Any = response_stream(response)
+        head = stream.peek(CSV_SNIFF_BYTES)
+    else:
+        content = response.content
+        stream = BytesIO(content)
+        head = content[:CSV_SNIFF_BYTES]
+    first_line = head.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r")
+    names = next(csv.reader([first_line]), [])
+    text = pa.dictionary(pa.int32(), pa.string()) if compact else pa.string()
+    types = {name: text for name in names}
+    if value_column in types:
+        types[value_column] = pa.from_numpy_dtype(np.dtype(value_dtype))
+    options = pa.csv.ConvertOptions(column_types=types, strings_can_be_null=True)
+    url = getattr(response, "url", None)
+    table = timed_parse("csv_table", pa.csv.read_csv, stream, convert_options=options, url=url)
+    return table.rename_columns([_observation_name(name) for name in table.column_names])
+
+
+def _is_text(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return False
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def compact_frame(
+    frame: pd.DataFrame,
+    *,
+    value_dtype: Any = "float64",
+    max_category_ratio: float = DEFAULT_CATEGORY_RATIO,
+) -> pd.DataFrame:
+    """Store repeated codes as categories and ``value`` as ``value_dtype``.
+
+    Text columns whose distinct values number at most ``max_category_ratio``
+    times the row count become ``category``, as does ``time_period`` so that
+    periods of any frequency keep their published string form while each
+    distinct period is stored once.
+    """
+    rows = len(frame)
+    for column in frame.columns:
+        series = frame[column]
+        if column == "value":
+            frame[column] = series.astype(value_dtype)
+        elif _is_text(series) and (
+            column == "time_period" or series.nunique(dropna=True) <= rows * max_category_ratio
+        ):
+            frame[column] = series.astype("category")
+    return frame
+
+
+def observations_frame(
+    frame: pd.DataFrame,
+    *,
+    compact: bool = False,
+    value_dtype: Any = "float64",
+) -> pd.DataFrame:
+    """Use common names for observation period and value columns.
+
+    With ``compact=True`` the frame is passed through :func:`compact_frame`.
+    """
+    frame = frame.rename(columns={column: _observation_name(column) for column in frame.columns})
     if "value" in frame:
         frame["value"] = pd.to_numeric(frame["value"], errors="coerce")
+    if compact:
+        frame = compact_frame(frame, value_dtype=value_dtype)
     return frame
 
 
@@ -76,38 +1240,124 @@ def _codes_by_position(dimension: Mapping[str, Any]) -> list[str]:
     return list(index)
 
 
-def _coordinates(position: int, sizes: Iterable[int]) -> list[int]:
-    coordinates: list[int] = []
-    remaining = position
-    sizes_list = list(sizes)
-    for size in reversed(sizes_list):
-        coordinates.append(remaining % size)
-        remaining //= size
-    return list(reversed(coordinates))
+def _jsonstat_numbers(values: list[Any]) -> np.ndarray:
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def jsonstat_observations(raw_values: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Return the flat positions and values of the observations present."""
+    if isinstance(raw_values, list):
+        values = _jsonstat_numbers(raw_values)
+        present = ~pd.isna(values)
+        positions = np.flatnonzero(present)
+        return positions, values[positions]
+    if not raw_values:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    positions = np.fromiter(map(int, raw_values.keys()), dtype=np.int64, count=len(raw_values))
+    return positions, _jsonstat_numbers(list(raw_values.values()))
 
 
-def jsonstat_frame(payload: Mapping[str, Any]) -> pd.DataFrame:
-    """Convert the JSON-stat2 dataset representation used by Eurostat."""
+def jsonstat_frame(
+    payload: Mapping[str, Any],
+    *,
+    compact: bool = True,
+    value_dtype: Any = "float64",
+) -> pd.DataFrame:
+    """Convert the JSON-stat2 dataset representation used by Eurostat.
+
+    Flat value positions are unravelled for every observation at once and
+    each dimension becomes a categorical column built from its code list;
+    ``compact=False`` returns plain string columns instead. Both the dense
+    list and the sparse ``{"position": value}`` layouts of ``value`` are
+    accepted.
+    """
+    return timed_parse(
+        "jsonstat_frame", _jsonstat_frame, payload, compact=compact, value_dtype=value_dtype
+    )
+
+
+def jsonstat_table(
+    payload: Mapping[str, Any],
+    *,
+    compact: bool = True,
+    value_dtype: Any = "float64",
+) -> Any:
+    """Convert a JSON-stat2 dataset straight into a ``pyarrow.Table``.
+
+    Dimensions become dictionary-encoded columns sharing the code lists, or
+    plain string columns with ``compact=False``.
+    """
+    pa = _pyarrow()
+    names, coordinates, codes, values = timed_parse("jsonstat_table", _jsonstat_cube, payload)
+    columns = []
+    for coordinate, categories in zip(coordinates, codes):
+        column = pa.DictionaryArray.from_arrays(
+            pa.array(coordinate.astype(np.int32)), pa.array(categories, type=pa.string())
+        )
+        columns.append(column if compact else column.cast(pa.string()))
+    numbers = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=value_dtype)
+    columns.append(pa.array(numbers))
+    return pa.table(columns, names=[*(_observation_name(name) for name in names), "value"])
+
+
+def jsonstat_layout(
+    payload: Mapping[str, Any],
+) -> tuple[list[str], list[int], list[list[str]]]:
+    """Return the dimension ids, sizes, and ordered category codes of a cube."""
     dimension_ids = list(payload.get("id", []))
-    sizes = list(payload.get("size", []))
+    sizes = [int(size) for size in payload.get("size", [])]
     dimensions = payload.get("dimension", {})
     if not dimension_ids or len(dimension_ids) != len(sizes):
         raise DataSourceError("JSON-stat response does not describe its dimensions")
 
     codes = [_codes_by_position(dimensions[name]) for name in dimension_ids]
-    raw_values = payload.get("value", {})
-    if isinstance(raw_values, list):
-        values = {index: value for index, value in enumerate(raw_values) if value is not None}
-    else:
-        values = {int(index): value for index, value in raw_values.items()}
-
-    rows = []
-    for position, value in values.items():
-        coordinate = _coordinates(position, sizes)
-        row = {
-            name: codes[index][coordinate[index]]
-            for index, name in enumerate(dimension_ids)
-        }
-        row["value"] = value
-        rows.append(row)
-    return observations_frame(pd.DataFrame(rows, columns=[*dimension_ids, "value"]))
+    if any(len(categories) != size for categories, size in zip(codes, sizes)):
+        raise DataSourceError("JSON-stat dimension categories do not match their sizes")
+    return dimension_ids, sizes, codes
+
+
+def _jsonstat_coordinates(positions: np.ndarray, sizes: list[int]) -> tuple[np.ndarray, ...]:
+    try:
+        return np.unravel_index(positions, sizes)
+    except ValueError as exc:
+        raise DataSourceError("JSON-stat value positions fall outside the cube") from exc
+
+
+def _jsonstat_cube(
+    payload: Mapping[str, Any],
+) -> tuple[list[str], tuple[np.ndarray, ...], list[list[str]], np.ndarray]:
+    dimension_ids, sizes, codes = jsonstat_layout(payload)
+    positions, values = jsonstat_observations(payload.get("value", {}))
+    return dimension_ids, _jsonstat_coordinates(positions, sizes), codes, values
+
+
+def jsonstat_rows(
+    layout: tuple[list[str], list[int], list[list[str]]],
+    positions: np.ndarray,
+    values: np.ndarray,
+    *,
+    compact: bool = True,
+    value_dtype: Any = "float64",
+) -> pd.DataFrame:
+    """Build observation rows for the given flat ``positions`` of a cube."""
+    dimension_ids, sizes, codes = layout
+    coordinates = _jsonstat_coordinates(positions, sizes)
+    columns: dict[str, Any] = {
+        name: pd.Categorical.from_codes(coordinate, categories=categories)
+        for name, coordinate, categories in zip(dimension_ids, coordinates, codes)
+    }
+    columns["value"] = values
+    frame = observations_frame(pd.DataFrame(columns, columns=[*dimension_ids, "value"]))
+    frame["value"] = frame["value"].astype(value_dtype)
+    if not compact:
+        for column in frame.columns[:-1]:
+            frame[column] = frame[column].astype(str)
+    return frame
+
+
+def _jsonstat_frame(payload: Mapping[str, Any], **options: Any) -> pd.DataFrame:
+    positions, values = jsonstat_observations(payload.get("value", {}))
+    return jsonstat_rows(jsonstat_layout(payload), positions, values, **options)
@@ -0,0 +1,187 @@
+"""Incremental JSON-stat parsing for datasets too large to decode at once."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from ._common import DataSourceError, jsonstat_layout, jsonstat_observations, jsonstat_rows
+
+
+READ_SIZE = 1024 * 1024
+_WHITESPACE = re.compile(r"\s*")
+_DECODER = json.JSONDecoder()
+
+
+class _Scanner:
+    """Read a JSON document from a byte stream a block at a time."""
+
+    def __init__(self, stream: BinaryIO, read_size: int = READ_SIZE) -> None:
+        self._stream = stream
+        self._read_size = read_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: Optional[int] = None) -> bool:
+        """Append the next block to the buffer; return ``False`` at the end."""
+        if self.eof:
+            return False
+        data = self._stream.read(size or self._read_size)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos:] + self._decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise DataSourceError("Malformed JSON-stat response")
+        self.pos += 1
+        return character
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more input as needed."""
+        self.peek()
+        size = self._read_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                end = None
+            # A number or literal ending at the buffer edge may continue in the next block.
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.pos = end
+                return value
+            # Grow the reads so a large dimension is re-parsed a bounded number of times.
+            if not self.fill(size) and end is None:
+                raise DataSourceError("Malformed JSON-stat response")
+            size *= 2
+
+    def items(self, closing: str) -> Iterator[str]:
+        """Yield comma-separated runs of a flat array or object body.
+
+        Only valid for containers of numbers, ``null``, and short strings
+        without ``,`` or the closing bracket, as used by ``value`` and
+        ``status``.
+        """
+        while True:
+            end = self.buffer.find(closing, self.pos)
+            if end != -1:
+                items = self.buffer[self.pos : end]
+                self.pos = end + 1
+                if items.strip():
+                    yield items
+                return
+            cut = self.buffer.rfind(",", self.pos)
+            if cut > self.pos:
+                yield self.buffer[self.pos : cut]
+                self.pos = cut + 1
+            if not self.fill():
+                raise DataSourceError("JSON-stat response ended inside a value list")
+
+
+class _Observations:
+    """Buffer observation positions and values as compact NumPy arrays."""
+
+    def __init__(self) -> None:
+        self.positions: list[np.ndarray] = []
+        self.values: list[np.ndarray] = []
+        self.count = 0
+        self.dense_offset = 0
+
+    def add_items(self, items: str, dense: bool) -> None:
+        if dense:
+            raw = json.loads(f"[{items}]")
+            positions, values = jsonstat_observations(raw)
+            positions = positions + self.dense_offset
+            self.dense_offset += len(raw)
+        else:
+            positions, values = jsonstat_observations(json.loads(f"{{{items}}}"))
+        self.positions.append(positions)
+        self.values.append(values)
+        self.count += len(positions)
+
+    def frames(
+        self,
+        layout: Any,
+        chunksize: int,
+        *,
+        final: bool,
+        **options: Any,
+    ) -> Iterator[pd.DataFrame]:
+        if self.count < chunksize and not (final and self.count):
+            return
+        positions = np.concatenate(self.positions)
+        values = np.concatenate(self.values)
+        self.positions, self.values = [], []
+        start = 0
+        while len(positions) - start >= chunksize or (final and start < len(positions)):
+            stop = start + chunksize
+            yield jsonstat_rows(layout, positions[start:stop], values[start:stop], **options)
+            start = stop
+        if start < len(positions):
+            self.positions, self.values = [positions[start:]], [values[start:]]
+        self.count = len(positions) - start
+
+
+def iter_jsonstat_frames(
+    stream: BinaryIO,
+    *,
+    chunksize: int,
+    compact: bool = True,
+    value_dtype: Any = "float64",
+) -> Iterator[pd.DataFrame]:
+    """Parse a JSON-stat2 dataset from ``stream`` into DataFrame chunks.
+
+    ``id``, ``size``, and ``dimension`` are decoded normally, while
+    ``value`` is read in blocks into NumPy arrays and ``status`` is skipped
+    without being materialised. When the provider sends ``value`` after
+    ``dimension``, chunks of ``chunksize`` rows are produced while reading;
+    when it comes first, as on Eurostat, observations are held as 16 bytes
+    each until the dimensions arrive instead of as a Python dictionary.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    scanner = _Scanner(stream)
+    observations = _Observations()
+    header: dict[str, Any] = {}
+    layout: Optional[Any] = None
+    options = {"compact": compact, "value_dtype": value_dtype}
+
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        raise DataSourceError("JSON-stat response does not describe its dimensions")
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+        container = scanner.peek()
+        if key in ("value", "status") and container in ("{", "["):
+            scanner.pos += 1
+            closing = "]" if container == "[" else "}"
+            for items in scanner.items(closing):
+                if key == "value":
+                    observations.add_items(items, dense=container == "[")
+                    if layout is not None:
+                        yield from observations.frames(layout, chunksize, final=False, **options)
+        else:
+            header[key] = scanner.value()
+            if layout is None and {"id", "size", "dimension"} <= header.keys():
+                layout = jsonstat_layout(header)
+        if scanner.expect(",}") == "}":
+            break
+    if layout is None:
+        layout = jsonstat_layout(header)
+    yield from observations.frames(layout, chunksize, final=True, **options)
@@ -0,0 +1,266 @@
+"""Asyncio entry points: a non-blocking HTTP transport and provider coroutines.
+
+:func:`async_get_response` and :func:`async_get_json` send requests on the
+event loop through a shared ``httpx.AsyncClient`` connection pool (install
+the ``async`` extra), with the same per-host rate limits, retry policy, and
+events as the blocking transport; no thread is held while they wait.
+
+The provider coroutines are a thread-offload convenience: every provider
+performs blocking HTTP through the shared connection pool, and each
+coroutine runs one provider call on a dedicated, bounded worker thread.
+Callers beyond ``max_concurrency`` wait on an ``asyncio.Semaphore`` without
+holding a thread, which gives the event loop backpressure and a fixed thread
+budget. Cancelling a coroutine stops the wait, but the call already running
+in its thread finishes on its own; use the providers' ``timeout`` to bound
+it. An ``async_<function>`` coroutine is generated from ``SOURCE_SPECS`` for
+every fetch and discovery function, for example ``async_fetch_istat_data``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Mapping, Optional
+
+import pandas as pd
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - installed with the "async" extra
+    httpx = None
+
+from ._common import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    DataSourceError,
+    HostLimiter,
+    emit_event,
+    host_limits,
+    instrumented,
+    limit_hosts,
+    request_event,
+    response_json,
+    retry_after,
+    url_host,
+)
+from .gateway import SOURCE_SPECS, discover_data, fetch_data
+
+
+DEFAULT_ASYNC_CONCURRENCY = 16
+DEFAULT_ASYNC_PER_HOST = 4
+
+_SETTINGS = {"max_concurrency": DEFAULT_ASYNC_CONCURRENCY, "max_per_host": DEFAULT_ASYNC_PER_HOST}
+_LOCK = threading.Lock()
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_HOST_LIMITER = HostLimiter(DEFAULT_ASYNC_PER_HOST)
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_HOST_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def configure_async(
+    *,
+    max_concurrency: Optional[int] = None,
+    max_per_host: Optional[int] = None,
+) -> None:
+    """Set the worker-thread budget and the HTTP requests allowed per host.
+
+    ``max_concurrency`` is the number of worker threads, and so of provider
+    calls in flight; further calls wait on the event loop without holding a
+    thread. Changes apply to calls started after reconfiguration.
+    """
+    global _EXECUTOR, _HOST_LIMITER
+    with _LOCK:
+        if max_concurrency is not None:
+            _SETTINGS["max_concurrency"] = max_concurrency
+        if max_per_host is not None:
+            _SETTINGS["max_per_host"] = max_per_host
+        executor, _EXECUTOR = _EXECUTOR, None
+        _HOST_LIMITER = HostLimiter(_SETTINGS["max_per_host"])
+        _SEMAPHORES.clear()
+        _HOST_SEMAPHORES.clear()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_SETTINGS["max_concurrency"],
+                thread_name_prefix="italian_our_world_data",
+            )
+        return _EXECUTOR
+
+
+def _semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    with _LOCK:
+        semaphore = _SEMAPHORES.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_SETTINGS["max_concurrency"])
+            _SEMAPHORES[loop] = semaphore
+        return semaphore
+
+
+def _with_host_limits(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    with limit_hosts(_HOST_LIMITER):
+        return function(*args, **kwargs)
+
+
+async def to_thread(function: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking library function on a bounded worker thread and await it.
+
+    Like :func:`asyncio.to_thread`, but on the module's own executor, with
+    the per-host request caps set by :func:`configure_async`.
+    """
+    loop = asyncio.get_running_loop()
+    async with _semaphore(loop):
+        call = functools.partial(copy_context().run, _with_host_limits, function, *args, **kwargs)
+        return await loop.run_in_executor(_executor(), call)
+
+
+def _async_client() -> Any:
+    if httpx is None:
+        raise ImportError(
+            'Non-blocking requests need httpx: pip install "italian-our-world-data[async]"'
+        )
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        client = _CLIENTS.get(loop)
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=_SETTINGS["max_concurrency"],
+                max_keepalive_connections=DEFAULT_POOL_MAXSIZE,
+            )
+            client = _CLIENTS[loop] = httpx.AsyncClient(limits=limits, follow_redirects=True)
+        return client
+
+
+def _host_semaphore(loop: asyncio.AbstractEventLoop, url: str) -> asyncio.Semaphore:
+    host = url_host(url)
+    with _LOCK:
+        semaphores = _HOST_SEMAPHORES.setdefault(loop, {})
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(_SETTINGS["max_per_host"])
+        return semaphore
+
+
+async def aclose() -> None:
+    """Close the shared ``httpx.AsyncClient`` of the running event loop."""
+    with _LOCK:
+        client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def async_get_response(
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    client: Any = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Any:
+    """GET ``url`` without blocking the event loop and return the response.
+
+    Requests share one ``httpx.AsyncClient`` per event loop unless a
+    ``client`` is passed, respect ``max_per_host`` and the host's rate limit,
+    and are retried under the host's :class:`RetryPolicy`; waits are
+    ``asyncio.sleep`` calls. Error statuses raise :class:`DataSourceError`.
+    Responses are not stored in the HTTP cache.
+    """
+    client = client or _async_client()
+    loop = asyncio.get_running_loop()
+    bucket, retry = host_limits(url)
+    transport_errors = (httpx.TransportError,) if httpx is not None else ()
+    attempt = 1
+    while True:
+        if bucket is not None:
+            await asyncio.sleep(bucket.reserve())
+        started = time.perf_counter()
+        try:
+            async with _host_semaphore(loop, url):
+                response = await client.get(url, params=params, headers=headers, timeout=timeout)
+        except transport_errors as exc:
+            if attempt >= retry.attempts:
+                if instrumented():
+                    emit_event(request_event(url, "GET", started, error=exc))
+                raise DataSourceError(f"Request failed for {url}: {exc}") from exc
+            delay = retry.delay(attempt)
+        else:
+            status = response.status_code
+            delay = None
+            if status in retry.statuses and attempt < retry.attempts:
+                delay = retry.delay(attempt, retry_after(response))
+            if delay is None:
+                if instrumented():
+                    emit_event(request_event(url, "GET", started, response, size=len(response.content)))
+                if status >= 400:
+                    raise DataSourceError(f"Request failed for {url}: HTTP {status}")
+                return response
+            if status == 429 and bucket is not None:
+                bucket.pause(delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def async_get_json(url: str, **kwargs: Any) -> Any:
+    """Non-blocking :func:`get_json`: GET ``url`` with :func:`async_get_response` and decode it."""
+    response = await async_get_response(url, **kwargs)
+    try:
+        return response_json(response, url=url)
+    except ValueError as exc:
+        raise DataSourceError(f"Invalid JSON returned by {url}") from exc
+
+
+async def async_fetch_data(source: str, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
+    """:func:`~italian_our_world_data.fetch_data` offloaded with :func:`to_thread`."""
+    return await to_thread(fetch_data, source, *args, **kwargs)
+
+
+async def async_discover_data(source: str, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
+    """:func:`~italian_our_world_data.discover_data` offloaded with :func:`to_thread`."""
+    return await to_thread(discover_data, source, *args, **kwargs)
+
+
+def _async_provider(function: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(function)
+    async def provider(*args: Any, **kwargs: Any) -> Any:
+        return await to_thread(function, *args, **kwargs)
+
+    provider.__name__ = provider.__qualname__ = f"async_{function.__name__}"
+    provider.__doc__ = (
+        f":func:`~italian_our_world_data.{function.__name__}` offloaded with :func:`to_thread`."
+    )
+    return provider
+
+
+ASYNC_PROVIDERS: dict[str, Callable[..., Any]] = {}
+for _spec in SOURCE_SPECS:
+    for _function in (_spec.fetch, _spec.discovery):
+        if _function is not None:
+            ASYNC_PROVIDERS[f"async_{_function.__name__}"] = _async_provider(_function)
+globals().update(ASYNC_PROVIDERS)
+
+__all__ = [
+    "ASYNC_PROVIDERS",
+    "aclose",
+    "async_discover_data",
+    "async_fetch_data",
+    "async_get_json",
+    "async_get_response",
+    "configure_async",
+    "to_thread",
+    *sorted(ASYNC_PROVIDERS),
+]
@@ -2,14 +2,61 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Optional
+import inspect
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 import pandas as pd
 
-from ._common import DataSourceError
-from .geo import fetch_administrative_boundaries, list_administrative_boundary_divisions
+from ._cache import DEFAULT_RESULT_MAX_BYTES, DEFAULT_RESULT_TTL, ResultCache
+from ._common import (
+    DataSourceError,
+    HostLimiter,
+    ParseEvent,
+    RequestEvent,
+    RetryPolicy,
+    SingleFlight,
+    caches_bypassed,
+    check_result_format,
+    configure_host,
+    emit_event,
+    instrumented,
+    limit_hosts,
+    map_concurrently,
+    record_events,
+    set_host_defaults,
+    source_scope,
+    to_result_format,
+    url_host,
+)
+from .geo import (
+    CONFINI_AMMINISTRATIVI_URL,
+    fetch_administrative_boundaries,
+    list_administrative_boundary_divisions,
+)
 from .sources import (
+    AMECO_URL,
+    AMECO_VARIABLES_URL,
+    BANKITALIA_BDS_URL,
+    BANKITALIA_EXCHANGE_URL,
+    BDAP_CKAN_URL,
+    BIS_URL,
+    DATI_GOV_IT_CKAN_URL,
+    ECB_URL,
+    EUROSTAT_URL,
+    FRED_API_URL,
+    FRED_DOWNLOAD_URL,
+    IMF_DATAMAPPER_URL,
+    INPS_URL,
+    ISTAT_URL,
+    LOMBARDY_SOCRATA_DOMAIN,
+    OECD_URL,
+    OPENCOESIONE_URL,
+    PNRR_URL,
+    UN_POPULATION_URL,
+    WORLD_BANK_URL,
     fetch_ameco_data,
     fetch_bankitalia_exchange_rates,
     fetch_bdap_data,
@@ -75,6 +122,9 @@ class SourceSpec:
     returns: str
     example: str
     aliases: tuple[str, ...] = ()
+    hosts: tuple[str, ...] = ()
+    # Published quota as (requests per second, burst), applied to ``hosts``.
+    rate_limit: Optional[tuple[float, float]] = None
 
     @property
     def fetch_function(self) -> Optional[str]:
@@ -85,6 +135,10 @@ class SourceSpec:
         return self.discovery.__name__ if self.discovery is not None else None
 
 
+def _hosts(*urls: str) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(url_host(url) for url in urls))
+
+
 def _normalise_source(source: str) -> str:
     return source.strip().lower().replace("-", "_").replace(" ", "_")
 
@@ -101,11 +155,22 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataflow_id",
         fetch_parameter="dataflow_id",
         required=("dataflow_id",),
-        optional=("key", "start_period", "end_period", "params"),
+        optional=(
+            "key",
+            "start_period",
+            "end_period",
+            "params",
+            "chunksize",
+            "compact",
+            "value_dtype",
+            "result_format",
+        ),
         discovery_required=(),
         discovery_optional=(),
         returns="Observation DataFrame with time_period and value when present.",
         example='fetch_data("istat", dataflow_id="150_915", key="A.IT.....", start_period="2023")',
+        hosts=_hosts(ISTAT_URL),
+        rate_limit=(5 / 60, 5),
     ),
     SourceSpec(
         source="oecd",
@@ -118,7 +183,16 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataflow_id",
         fetch_parameter="dataflow",
         required=("dataflow",),
-        optional=("key", "start_period", "end_period", "params"),
+        optional=(
+            "key",
+            "start_period",
+            "end_period",
+            "params",
+            "chunksize",
+            "compact",
+            "value_dtype",
+            "result_format",
+        ),
         discovery_required=(),
         discovery_optional=("agency_id",),
         returns="Observation DataFrame with time_period and value when present.",
@@ -126,6 +200,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
             'fetch_data("oecd", dataflow="OECD.SDD.STES,DSD_STES@DF_FINMARK,", '
             'key="............", start_period="2024-01")'
         ),
+        hosts=_hosts(OECD_URL),
     ),
     SourceSpec(
         source="eurostat",
@@ -138,7 +213,16 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataflow_id",
         fetch_parameter="dataset",
         required=("dataset",),
-        optional=("filters", "start_period", "end_period", "params"),
+        optional=(
+            "filters",
+            "start_period",
+            "end_period",
+            "params",
+            "chunksize",
+            "compact",
+            "value_dtype",
+            "result_format",
+        ),
         discovery_required=(),
         discovery_optional=("dataflow_id",),
         returns="Observation DataFrame decoded from JSON-stat.",
@@ -146,6 +230,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
             'fetch_data("eurostat", dataset="nama_10_gdp", '
             'filters={"geo": "IT", "unit": "CP_MEUR", "na_item": "B1GQ"})'
         ),
+        hosts=_hosts(EUROSTAT_URL),
     ),
     SourceSpec(
         source="ecb",
@@ -158,11 +243,21 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataflow_id",
         fetch_parameter="dataset",
         required=("dataset",),
-        optional=("key", "start_period", "end_period", "params"),
+        optional=(
+            "key",
+            "start_period",
+            "end_period",
+            "params",
+            "chunksize",
+            "compact",
+            "value_dtype",
+            "result_format",
+        ),
         discovery_required=(),
         discovery_optional=(),
         returns="Observation DataFrame with time_period and value when present.",
         example='fetch_data("ecb", dataset="EXR", key="D.USD.EUR.SP00.A")',
+        hosts=_hosts(ECB_URL),
     ),
     SourceSpec(
         source="ameco",
@@ -181,6 +276,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="Annual AMECO observations with country, indicator, unit, time_period, and value.",
         example='fetch_data("ameco", full_variable="1.0.0.0.NPTD", countries="ITA", years=[2022, 2023])',
         aliases=("ecfin", "dg_ecfin"),
+        hosts=_hosts(AMECO_URL, AMECO_VARIABLES_URL),
     ),
     SourceSpec(
         source="world_bank",
@@ -193,12 +289,13 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="indicator_id",
         fetch_parameter="indicator",
         required=("indicator",),
-        optional=("country", "start_year", "end_year", "fetch_all_pages"),
+        optional=("country", "start_year", "end_year", "fetch_all_pages", "max_workers"),
         discovery_required=(),
         discovery_optional=("page", "per_page"),
         returns="Indicator DataFrame with country, time_period, and value.",
         example='fetch_data("world_bank", indicator="NY.GDP.MKTP.CD", country="ITA")',
         aliases=("worldbank", "wb"),
+        hosts=_hosts(WORLD_BANK_URL),
     ),
     SourceSpec(
         source="imf",
@@ -217,6 +314,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="Indicator DataFrame with country_id, time_period, and value.",
         example='fetch_data("imf", indicator="NGDP_RPCH", countries="ITA", periods=[2022, 2023])',
         aliases=("imf_datamapper", "weo"),
+        hosts=_hosts(IMF_DATAMAPPER_URL),
     ),
     SourceSpec(
         source="un_population",
@@ -229,12 +327,22 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="indicator_id",
         fetch_parameter="indicator_id",
         required=("indicator_id",),
-        optional=("location_id", "start_year", "end_year", "auth_token", "params"),
+        optional=(
+            "location_id",
+            "start_year",
+            "end_year",
+            "auth_token",
+            "params",
+            "page_size",
+            "fetch_all_pages",
+            "max_workers",
+        ),
         discovery_required=(),
-        discovery_optional=("page_size", "page_number", "fetch_all_pages"),
+        discovery_optional=("page_size", "page_number", "fetch_all_pages", "max_workers"),
         returns="UN population rows with time_period and value when the data endpoint is authorised.",
         example='fetch_data("un_population", indicator_id=46, location_id=380, start_year=2020, end_year=2023, auth_token="...")',
         aliases=("undesa", "wpp", "un_wpp"),
+        hosts=_hosts(UN_POPULATION_URL),
     ),
     SourceSpec(
         source="fred",
@@ -252,6 +360,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         discovery_optional=("api_key", "limit"),
         returns="Series DataFrame with time_period and value.",
         example='fetch_data("fred", series_id="GDP", start_period="2023-01-01")',
+        hosts=_hosts(FRED_API_URL, FRED_DOWNLOAD_URL),
     ),
     SourceSpec(
         source="bis",
@@ -264,11 +373,21 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataflow",
         fetch_parameter="dataflow",
         required=("dataflow",),
-        optional=("key", "start_period", "end_period", "params"),
+        optional=(
+            "key",
+            "start_period",
+            "end_period",
+            "params",
+            "chunksize",
+            "compact",
+            "value_dtype",
+            "result_format",
+        ),
         discovery_required=(),
         discovery_optional=("provider",),
         returns="Observation DataFrame with time_period and value when present.",
         example='fetch_data("bis", dataflow="BIS,WS_EER,1.0", key="M.N.B.IT", start_period="2023-01")',
+        hosts=_hosts(BIS_URL),
     ),
     SourceSpec(
         source="inps",
@@ -286,6 +405,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         discovery_optional=("limit", "offset"),
         returns="Downloaded tabular resource as a DataFrame.",
         example='fetch_data("inps", dataset_id="known-dataset-id")',
+        hosts=_hosts(INPS_URL),
     ),
     SourceSpec(
         source="pnrr",
@@ -304,6 +424,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="JSON-normalized API resource rows.",
         example='fetch_data("pnrr", resource="missioni", params={"page_size": 2})',
         aliases=("openpnrr",),
+        hosts=_hosts(PNRR_URL),
     ),
     SourceSpec(
         source="opencoesione",
@@ -322,6 +443,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="JSON-normalized API resource rows.",
         example='fetch_data("opencoesione", resource="temi", params={"page_size": 2})',
         aliases=("open_coesione",),
+        hosts=_hosts(OPENCOESIONE_URL),
     ),
     SourceSpec(
         source="bankitalia",
@@ -339,10 +461,11 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         required=(),
         optional=(),
         discovery_required=(),
-        discovery_optional=("max_depth", "query", "limit"),
+        discovery_optional=("max_depth", "query", "limit", "max_workers", "checkpoint"),
         returns="Catalogue rows for BDS statistical cubes and their metadata.",
         example='list_indicators("bankitalia", max_depth=3, limit=20)',
         aliases=("bank_of_italy", "bancaditalia", "banca_ditalia", "bds"),
+        hosts=_hosts(BANKITALIA_BDS_URL),
     ),
     SourceSpec(
         source="bankitalia_exchange_rates",
@@ -364,6 +487,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
             'base_currency="EUR", target_currency="USD")'
         ),
         aliases=("bankitalia_fx", "bank_of_italy_fx", "bancaditalia_fx"),
+        hosts=_hosts(BANKITALIA_EXCHANGE_URL),
     ),
     SourceSpec(
         source="italian_open_data",
@@ -382,6 +506,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="Downloaded CKAN resource as a DataFrame.",
         example='fetch_data("italian_open_data", resource_url="https://example.gov.it/data.csv")',
         aliases=("dati_gov_it", "dati.gov.it", "national_open_data"),
+        hosts=_hosts(DATI_GOV_IT_CKAN_URL),
     ),
     SourceSpec(
         source="bdap",
@@ -403,12 +528,15 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
             "datastore",
             "limit",
             "offset",
+            "fetch_all_rows",
+            "max_workers",
         ),
         discovery_required=(),
         discovery_optional=("query", "rows", "start", "params"),
         returns="Downloaded OpenBDAP resource as a DataFrame.",
         example='fetch_data("bdap", dataset_id="known-dataset-id")',
         aliases=("openbdap",),
+        hosts=_hosts(BDAP_CKAN_URL),
     ),
     SourceSpec(
         source="lombardy",
@@ -421,12 +549,13 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataset_id",
         fetch_parameter="dataset_id",
         required=("dataset_id",),
-        optional=("limit", "offset", "params"),
+        optional=("limit", "offset", "params", "fetch_all_rows", "max_workers"),
         discovery_required=(),
         discovery_optional=("limit", "offset", "params"),
         returns="Socrata resource rows as a DataFrame.",
         example='fetch_data("lombardy", dataset_id="y856-h426", limit=10)',
         aliases=("regione_lombardia", "lombardia"),
+        hosts=_hosts(LOMBARDY_SOCRATA_DOMAIN),
     ),
     SourceSpec(
         source="ckan",
@@ -456,7 +585,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         identifier_column="dataset_id",
         fetch_parameter="dataset_id",
         required=("domain", "dataset_id"),
-        optional=("limit", "offset", "params"),
+        optional=("limit", "offset", "params", "fetch_all_rows", "max_workers"),
         discovery_required=("domain",),
         discovery_optional=("limit", "offset", "params"),
         returns="Socrata resource rows as a DataFrame.",
@@ -479,6 +608,7 @@ SOURCE_SPECS: tuple[SourceSpec, ...] = (
         returns="GeoPandas GeoDataFrame with EPSG:4326 geometries.",
         example='fetch_data("administrative_boundaries", division="regioni")',
         aliases=("boundaries", "geo"),
+        hosts=_hosts(CONFINI_AMMINISTRATIVI_URL),
     ),
 )
 
@@ -488,6 +618,10 @@ for _spec in SOURCE_SPECS:
     _SOURCE_LOOKUP[_normalise_source(_spec.source)] = _spec
     for _alias in _spec.aliases:
         _SOURCE_LOOKUP[_normalise_source(_alias)] = _spec
+    if _spec.rate_limit is not None:
+        _rate, _burst = _spec.rate_limit
+        for _host in _spec.hosts:
+            set_host_defaults(_host, requests_per_second=_rate, burst=_burst)
 
 
 def _source_spec(source: str) -> SourceSpec:
@@ -498,6 +632,163 @@ def _source_spec(source: str) -> SourceSpec:
         raise ValueError(f"Unknown source {source!r}. Available sources: {choices}") from exc
 
 
+_IN_FLIGHT = SingleFlight()
+_RESULTS = ResultCache()
+
+
+def _request_key(
+    function: Callable[..., Any], args: tuple[Any, ...], kwargs: Mapping[str, Any]
+) -> Optional[str]:
+    """Return a canonical key for a provider call, or ``None`` if it cannot be shared.
+
+    Arguments are bound to parameter names with defaults applied, so
+    positional and keyword spellings of one request produce the same key.
+    Calls with a caller-supplied ``session``, chunked results, or arguments
+    that are not plain JSON-like values are never shared.
+    """
+    try:
+        bound = inspect.signature(function).bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    arguments = bound.arguments
+    if arguments.get("session") is not None or arguments.get("chunksize") is not None:
+        return None
+
+    def reject(value: Any) -> Any:
+        raise TypeError(type(value).__name__)
+
+    try:
+        return json.dumps(
+            [function.__module__, function.__qualname__, arguments],
+            sort_keys=True,
+            default=reject,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _shared(result: Any) -> Any:
+    return result.copy() if isinstance(result, pd.DataFrame) else result
+
+
+@dataclass(frozen=True)
+class CallSummary:
+    """Totals for one :func:`fetch_data` or :func:`discover_data` call.
+
+    Reported to event listeners after the call returns or fails.
+    ``download_time`` and ``parse_time`` add up the individual
+    :class:`RequestEvent` and :class:`ParseEvent` durations, so they can
+    exceed ``elapsed`` when pages were fetched concurrently.
+    """
+
+    source: str
+    function: str
+    elapsed: float
+    requests: int
+    bytes: int
+    transfer_bytes: int
+    download_time: float
+    parse_time: float
+    http_cache_hits: int
+    result_cache_hit: bool
+    error: Optional[str] = None
+
+
+def _summarise(
+    source: str,
+    function: Callable[..., Any],
+    started: float,
+    events: list[Any],
+    result_cache_hit: bool,
+    error: Optional[Exception],
+) -> CallSummary:
+    requests = [event for event in events if isinstance(event, RequestEvent)]
+    return CallSummary(
+        source=source,
+        function=function.__name__,
+        elapsed=time.perf_counter() - started,
+        requests=len(requests),
+        bytes=sum(event.bytes or 0 for event in requests),
+        transfer_bytes=sum(event.transfer_bytes or 0 for event in requests),
+        download_time=sum(event.download_time for event in requests),
+        parse_time=sum(event.parse_time for event in events if isinstance(event, ParseEvent)),
+        http_cache_hits=sum(event.from_cache for event in requests),
+        result_cache_hit=result_cache_hit,
+        error=None if error is None else str(error),
+    )
+
+
+def _call_provider(
+    source: str,
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    use_cache: bool,
+) -> Any:
+    with source_scope(source):
+        if not instrumented():
+            return _run_provider(function, args, kwargs, use_cache)[0]
+        started = time.perf_counter()
+        result_cache_hit = False
+        error = None
+        try:
+            with record_events() as events:
+                result, result_cache_hit = _run_provider(function, args, kwargs, use_cache)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            emit_event(_summarise(source, function, started, events, result_cache_hit, error))
+    return result
+
+
+def _run_provider(
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    use_cache: bool,
+) -> tuple[Any, bool]:
+    key = _request_key(function, args, kwargs)
+    if key is None:
+        return function(*args, **kwargs), False
+    use_cache = use_cache and not caches_bypassed()
+    if use_cache:
+        cached = _RESULTS.get(key)
+        if cached is not None:
+            return cached, True
+
+    def call() -> Any:
+        result = function(*args, **kwargs)
+        if use_cache:
+            _RESULTS.put(key, result)
+        return result
+
+    result, leader = _IN_FLIGHT.do(key, call)
+    return (result if leader else _shared(result)), False
+
+
+def configure_result_cache(
+    *,
+    ttl: float = DEFAULT_RESULT_TTL,
+    max_bytes: int = DEFAULT_RESULT_MAX_BYTES,
+) -> None:
+    """Configure the in-memory cache of parsed gateway results.
+
+    :func:`fetch_data` and :func:`discover_data` reuse a parsed ``DataFrame``
+    for ``ttl`` seconds when called again with equivalent arguments; the
+    cached frames are bounded by ``max_bytes`` of deep memory usage. A
+    ``ttl`` of ``0`` disables the cache. Reconfiguring empties it.
+    """
+    global _RESULTS
+    _RESULTS = ResultCache(ttl=ttl, max_bytes=max_bytes)
+
+
+def clear_result_cache() -> None:
+    """Drop every parsed result held by the gateway cache."""
+    _RESULTS.clear()
+
+
 def list_sources(*, category: Optional[str] = None) -> pd.DataFrame:
     """List supported sources and their unified gateway functions."""
     rows = []
@@ -550,16 +841,46 @@ def source_info(source: Optional[str] = None) -> Any:
         "returns": spec.returns,
         "example": spec.example,
         "aliases": list(spec.aliases),
+        "hosts": list(spec.hosts),
+        "rate_limit": spec.rate_limit,
     }
 
 
+def configure_source(
+    source: str,
+    *,
+    requests_per_second: Optional[float] = None,
+    burst: float = 1,
+    retry: Optional[RetryPolicy] = None,
+) -> None:
+    """Apply a rate limit and retry policy to every host used by ``source``.
+
+    This is :func:`configure_host` for each entry of the source's ``hosts``.
+    Generic CKAN and Socrata sources have no fixed host; configure the
+    portal's host directly with :func:`configure_host`.
+    """
+    spec = _source_spec(source)
+    if not spec.hosts:
+        raise ValueError(
+            f"Source {spec.source!r} has no fixed host; use configure_host() for the portal"
+        )
+    for host in spec.hosts:
+        configure_host(host, requests_per_second=requests_per_second, burst=burst, retry=retry)
+
+
 def get_source_info(source: Optional[str] = None) -> Any:
     """Compatibility alias for :func:`source_info`."""
     return source_info(source)
 
 
-def discover_data(source: str, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
-    """Run the discovery/listing function for one source."""
+def discover_data(
+    source: str, /, *args: Any, use_cache: bool = True, **kwargs: Any
+) -> pd.DataFrame:
+    """Run the discovery/listing function for one source.
+
+    Results are kept in the in-memory result cache (see
+    :func:`configure_result_cache`); pass ``use_cache=False`` to refetch.
+    """
     spec = _source_spec(source)
     if spec.discovery is None:
         raise DataSourceError(f"Source {spec.source!r} does not expose a discovery function")
@@ -572,7 +893,7 @@ def discover_data(source: str, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
         raise ValueError(
             f"Source {spec.source!r} discovery requires: {', '.join(missing)}"
         )
-    return spec.discovery(*args, **kwargs)
+    return _call_provider(spec.source, spec.discovery, args, kwargs, use_cache)
 
 
 def list_source_items(source: Optional[str] = None, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
@@ -616,9 +937,71 @@ def list_indicators(source: Optional[str] = None, /, *args: Any, **kwargs: Any)
     return list_source_items(source, *args, **kwargs)
 
 
-def fetch_data(source: str, /, *args: Any, **kwargs: Any) -> pd.DataFrame:
-    """Fetch rows from any supported source using a unified entry point."""
+def fetch_data(
+    source: str,
+    /,
+    *args: Any,
+    use_cache: bool = True,
+    result_format: str = "pandas",
+    **kwargs: Any,
+) -> Any:
+    """Fetch rows from any supported source using a unified entry point.
+
+    Results are kept in the in-memory result cache (see
+    :func:`configure_result_cache`); pass ``use_cache=False`` to refetch.
+    ``result_format="arrow"`` returns a ``pyarrow.Table`` and
+    ``"pandas_arrow"`` a DataFrame backed by ``pandas.ArrowDtype``. Sources
+    that accept ``result_format`` themselves parse straight into Arrow; the
+    others are converted after parsing.
+    """
     spec = _source_spec(source)
     if spec.fetch is None:
         raise DataSourceError(f"Source {spec.source!r} does not expose a fetch function")
-    return spec.fetch(*args, **kwargs)
+    if check_result_format(result_format) != "pandas" and "result_format" in spec.optional:
+        kwargs["result_format"] = result_format
+        result_format = "pandas"
+    result = _call_provider(spec.source, spec.fetch, args, kwargs, use_cache)
+    return to_result_format(result, result_format)
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of one request in a :func:`fetch_many` batch."""
+
+    source: str
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    data: Optional[pd.DataFrame] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fetch_many(
+    requests: Iterable[tuple[str, Mapping[str, Any]]],
+    *,
+    max_workers: int = 8,
+    max_per_host: int = 4,
+) -> list[FetchResult]:
+    """Fetch several ``(source, kwargs)`` requests concurrently.
+
+    At most ``max_workers`` requests run at once and at most ``max_per_host``
+    HTTP requests are in flight to any one host, including the pages fetched
+    inside each request. Results are returned in input order; a failing
+    request is reported through :attr:`FetchResult.error` instead of
+    aborting the batch.
+    """
+    batch = [(source, dict(kwargs)) for source, kwargs in requests]
+    limiter = HostLimiter(max_per_host)
+
+    def run(item: tuple[str, dict[str, Any]]) -> FetchResult:
+        source, kwargs = item
+        try:
+            with limit_hosts(limiter):
+                data = fetch_data(source, **kwargs)
+        except Exception as exc:
+            return FetchResult(source=source, kwargs=kwargs, error=exc)
+        return FetchResult(source=source, kwargs=kwargs, data=data)
+
+    return map_concurrently(run, batch, max_workers=max_workers)
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import json
+import math
 import os
+import time
+from collections import deque
 from io import BytesIO, StringIO
-from typing import Any, Mapping, Optional
-from urllib.parse import quote
-from xml.etree import ElementTree
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Union
+from urllib.parse import quote, urlencode
 
+import numpy as np
 import pandas as pd
 import requests
+from lxml import etree as lxml_etree
+from lxml import html as lxml_html
 
 from ._common import (
     DEFAULT_TIMEOUT,
     DataSourceError,
+    arrow_result,
+    check_result_format,
     csv_frame,
+    csv_table,
+    delimited_frame,
     get_json,
     get_response,
+    host_limits,
+    iter_concurrently,
+    iter_prefetched,
     jsonstat_frame,
+    jsonstat_table,
+    map_concurrently,
     observations_frame,
+    post_response,
+    response_json,
+    response_stream,
+    timed_parse,
+    to_result_format,
 )
+from ._jsonstat import iter_jsonstat_frames
 
 
 ISTAT_URL = "https://esploradati.istat.it/SDMXWS/rest/data"
@@ -39,6 +61,14 @@ IMF_DATAMAPPER_URL = "https://www.imf.org/external/datamapper/api/v1"
 UN_POPULATION_URL = "https://population.un.org/dataportalapi/api/v1"
 BIS_URL = "https://stats.bis.org/api/v1"
 WORLD_BANK_URL = "https://api.worldbank.org/v2"
+CKAN_DATASTORE_PAGE_SIZE = 32_000  # CKAN's default ckan.datastore.search.rows_max
+CKAN_MAX_WORKERS = 4
+SOCRATA_PAGE_SIZE = 50_000
+UN_POPULATION_MAX_WORKERS = 4
+WORLD_BANK_MAX_WORKERS = 4
+WORLD_BANK_PAGE_ATTEMPTS = 3
+WORLD_BANK_MAX_URL_LENGTH = 2000
+WORLD_BANK_MAX_INDICATORS = 60
 FRED_API_URL = "https://api.stlouisfed.org/fred/series/observations"
 FRED_DOWNLOAD_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv"
 INPS_URL = "https://serviziweb2.inps.it/odapi"
@@ -48,10 +78,14 @@ BANKITALIA_EXCHANGE_URL = (
     "https://tassidicambio.bancaditalia.it/terzevalute-wf-web/rest/v1.0"
 )
 BANKITALIA_BDS_URL = "https://a2a.bancaditalia.it/infostat/dataservices"
+BANKITALIA_BDS_MAX_WORKERS = 4
+BANKITALIA_BDS_BATCH_SIZE = 64
 DATI_GOV_IT_CKAN_URL = "https://www.dati.gov.it/opendata/api/3/action"
 BDAP_CKAN_URL = "https://bdap-opendata.rgs.mef.gov.it/SpodCkanApi/api/3/action"
 LOMBARDY_SOCRATA_DOMAIN = "https://www.dati.lombardia.it"
 
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
 
 def _sdmx_json_dataflows(payload: Mapping[str, Any]) -> pd.DataFrame:
     flows = payload.get("data", {}).get("dataflows", [])
@@ -69,36 +103,125 @@ def _sdmx_json_dataflows(payload: Mapping[str, Any]) -> pd.DataFrame:
     )
 
 
+def _xml_local_name(tag: str, names: dict[str, str]) -> str:
+    local = names.get(tag)
+    if local is None:
+        local = names[tag] = tag.rsplit("}", 1)[-1]
+    return local
+
+
+def _iter_xml_elements(stream: Any, local_name: str) -> Iterator[Any]:
+    """Yield each completed element named ``local_name`` in any namespace.
+
+    Elements are cleared once the caller moves on, so memory stays bounded
+    by a single element rather than the whole document.
+    """
+    for _, element in lxml_etree.iterparse(
+        stream,
+        events=("end",),
+        tag=f"{{*}}{local_name}",
+        resolve_entities=False,
+        no_network=True,
+    ):
+        yield element
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
 def _sdmx_xml_dataflows(content: bytes) -> pd.DataFrame:
+    names: dict[str, str] = {}
+    rows = []
     try:
-        root = ElementTree.fromstring(content)
-    except ElementTree.ParseError as exc:
+        for flow in _iter_xml_elements(BytesIO(content), "Dataflow"):
+            name_elements = [
+                child for child in flow
+                if isinstance(child.tag, str)
+                and _xml_local_name(child.tag, names) == "Name"
+                and child.text
+            ]
+            english_names = [
+                child.text
+                for child in name_elements
+                if child.attrib.get(XML_LANG) == "en"
+            ]
+            names_found = english_names or [child.text for child in name_elements]
+            rows.append(
+                {
+                    "agency_id": flow.attrib.get("agencyID"),
+                    "dataflow_id": flow.attrib.get("id"),
+                    "version": flow.attrib.get("version"),
+                    "name": names_found[0] if names_found else None,
+                }
+            )
+    except lxml_etree.XMLSyntaxError as exc:
         raise DataSourceError("Invalid SDMX structure document returned") from exc
-    rows = []
-    for flow in root.iter():
-        if flow.tag.rsplit("}", 1)[-1] != "Dataflow":
-            continue
-        name_elements = [
-            child for child in flow
-            if child.tag.rsplit("}", 1)[-1] == "Name" and child.text
-        ]
-        english_names = [
-            child.text
-            for child in name_elements
-            if child.attrib.get("{http://www.w3.org/XML/1998/namespace}lang") == "en"
-        ]
-        names = english_names or [child.text for child in name_elements]
-        rows.append(
-            {
-                "agency_id": flow.attrib.get("agencyID"),
-                "dataflow_id": flow.attrib.get("id"),
-                "version": flow.attrib.get("version"),
-                "name": names[0] if names else None,
-            }
-        )
     return pd.DataFrame(rows)
 
 
+def _observation_chunks(
+    response: Any, chunksize: int, result_format: str, **frame_options: Any
+) -> Iterator[Any]:
+    try:
+        with csv_frame(response, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield to_result_format(observations_frame(chunk, **frame_options), result_format)
+    finally:
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+
+
+def _jsonstat_chunks(
+    response: Any, chunksize: int, result_format: str, **frame_options: Any
+) -> Iterator[Any]:
+    try:
+        stream = response_stream(response) if hasattr(response, "iter_content") else None
+        chunks = iter_jsonstat_frames(
+            stream or BytesIO(response.content), chunksize=chunksize, **frame_options
+        )
+        for chunk in chunks:
+            yield to_result_format(chunk, result_format)
+    finally:
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+
+
+def _sdmx_csv_observations(
+    url: str,
+    *,
+    params: Mapping[str, Any],
+    headers: Optional[Mapping[str, str]] = None,
+    chunksize: Optional[int],
+    compact: bool,
+    value_dtype: Any,
+    result_format: str,
+    session: Any,
+    timeout: int,
+) -> Any:
+    check_result_format(result_format)
+    response = get_response(
+        url,
+        params=params,
+        headers=headers,
+        session=session,
+        timeout=timeout,
+        stream=chunksize is not None or result_format != "pandas",
+    )
+    frame_options = {"compact": compact, "value_dtype": value_dtype}
+    if chunksize is not None:
+        return _observation_chunks(response, chunksize, result_format, **frame_options)
+    if result_format != "pandas":
+        try:
+            return arrow_result(csv_table(response, **frame_options), result_format)
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+    return observations_frame(csv_frame(response), **frame_options)
+
+
 def _ckan_action_url(base_url: str, action: str) -> str:
     base = base_url.rstrip("/")
     if base.endswith("/api/3/action"):
@@ -182,13 +305,117 @@ def _as_list(value: Any) -> list[Any]:
     return [value]
 
 
-def _normalise_portal_rows(payload: Mapping[str, Any]) -> pd.DataFrame:
-    rows = payload.get("data", [])
-    return pd.json_normalize(rows)
+def _un_population_rows(
+    url: str,
+    params: Mapping[str, Any],
+    *,
+    page_number: int = 1,
+    fetch_all_pages: bool,
+    max_workers: int,
+    headers: Optional[Mapping[str, str]] = None,
+    session: Any,
+    timeout: int,
+) -> list[Any]:
+    """Return the ``data`` records of a UN Population endpoint, page by page.
+
+    The first page reports the page count; the following pages are then
+    fetched on up to ``max_workers`` threads and kept in page order.
+    """
+
+    def fetch_page(number: int) -> Any:
+        return get_json(
+            url,
+            params={**params, "pageNumber": number},
+            headers=headers,
+            session=session,
+            timeout=timeout,
+        )
+
+    first = fetch_page(page_number)
+    if isinstance(first, list):
+        return first
+    if not isinstance(first, dict):
+        raise DataSourceError("UN Population Data Portal returned an unexpected payload")
+    rows = list(first.get("data") or [])
+    pages = int(first.get("pages") or page_number) if fetch_all_pages else page_number
+    following = range(page_number + 1, pages + 1)
+    for payload in map_concurrently(fetch_page, following, max_workers=max_workers):
+        rows.extend(payload.get("data") or [])
+    return rows
+
 
+AMECO_COLUMNS = {"Country": "country", "Label": "indicator", "Unit": "unit"}
 
-def _year_columns(frame: pd.DataFrame) -> list[str]:
-    return [column for column in frame.columns if str(column).isdigit()]
+
+def _is_year(name: Any) -> bool:
+    return len(str(name)) == 4 and str(name).isdigit()
+
+
+def _cell_text(cell: Any) -> str:
+    if len(cell):  # markup inside the cell
+        return cell.text_content().strip()
+    return (cell.text or "").strip()
+
+
+def _cell_texts(row: Any) -> list[str]:
+    return [_cell_text(cell) for cell in row.iterchildren("th", "td")]
+
+
+def _ameco_table_cells(content: bytes) -> tuple[list[str], list[list[str]]]:
+    """Return the header and body cells of the first table with year columns.
+
+    Only the first row of each table is read until the data table is found,
+    and no types are inferred. Pages without a year header fall back to
+    their first table.
+    """
+    try:
+        document = lxml_html.fromstring(content)
+    except (lxml_etree.ParserError, lxml_etree.XMLSyntaxError, ValueError) as exc:
+        raise DataSourceError("AMECO did not return a readable table") from exc
+    selected = None
+    for table in document.iter("table"):
+        rows = table.iter("tr")
+        header = next(rows, None)
+        if header is None:
+            continue
+        names = _cell_texts(header)
+        if any(_is_year(name) for name in names):
+            selected = (names, rows)
+            break
+        if selected is None:
+            selected = (names, rows)
+    if selected is None:
+        raise DataSourceError("AMECO did not return any data table")
+    names, rows = selected
+    width = len(names)
+    body = []
+    for row in rows:
+        cells = _cell_texts(row)
+        if cells:
+            body.append((cells + [""] * width)[:width])
+    return names, body
+
+
+def _ameco_frame(names: list[str], body: list[list[str]], full_variable: str) -> pd.DataFrame:
+    """Reshape the wide AMECO table to long observations in one step."""
+    cells = np.array(body, dtype=object).reshape(len(body), len(names))
+    years = [index for index, name in enumerate(names) if _is_year(name)]
+    # Year-major order, as DataFrame.melt would produce.
+    values = pd.Series(cells[:, years].T.ravel(), dtype=str).str.replace(",", "", regex=False)
+    columns = {
+        column: np.tile(cells[:, names.index(name)], len(years))
+        for name, column in AMECO_COLUMNS.items()
+        if name in names
+    }
+    frame = pd.DataFrame(
+        {
+            "full_variable": full_variable,
+            **columns,
+            "time_period": np.repeat([names[index] for index in years], len(cells)),
+            "value": pd.to_numeric(values, errors="coerce").to_numpy(),
+        }
+    )
+    return observations_frame(frame)
 
 
 def _select_ckan_resource(
@@ -251,21 +478,21 @@ def _bankitalia_bds_post(
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> Any:
-    client = session or requests
     try:
-        response = client.post(
+        response = post_response(
             _bankitalia_bds_home_url(service, calltype=calltype),
-            data=dict(data or {}),
+            data=data,
             headers={
                 "Accept": "application/json, text/plain, */*",
                 "X-Requested-With": "XMLHttpRequest",
             },
+            session=session,
             timeout=timeout,
         )
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as exc:
+    except DataSourceError as exc:
         raise DataSourceError(f"Bank of Italy BDS request failed: {exc}") from exc
+    try:
+        return response_json(response, url=BANKITALIA_BDS_URL)
     except ValueError as exc:
         raise DataSourceError("Bank of Italy BDS returned invalid JSON") from exc
 
@@ -317,6 +544,35 @@ def _bankitalia_bds_matches(row: Mapping[str, Any], query: Optional[str]) -> boo
     return needle in haystack
 
 
+def _bankitalia_bds_marker(node: Mapping[str, Any]) -> str:
+    return json.dumps([node.get("id"), node.get("nodePath") or node.get("parentAbsPath")])
+
+
+def _bankitalia_bds_load_checkpoint(path: Path) -> Optional[tuple[Any, dict[str, Any]]]:
+    """Return the roots and fetched subtrees journalled in ``path``, if any."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise DataSourceError(f"Cannot read Bank of Italy BDS checkpoint {path}: {exc}") from exc
+    lines = text.splitlines()
+    records = []
+    for number, line in enumerate(lines):
+        try:
+            records.append(json.loads(line))
+        except ValueError as exc:
+            if number == len(lines) - 1:
+                break  # a write cut short by the interruption
+            raise DataSourceError(f"{path} is not a Bank of Italy BDS checkpoint") from exc
+    if not records or not isinstance(records[0], dict) or "roots" not in records[0]:
+        raise DataSourceError(f"{path} is not a Bank of Italy BDS checkpoint")
+    if not text.endswith("\n"):
+        # Drop the unfinished record so new ones are appended on lines of their own.
+        path.write_text("".join(line + "\n" for line in lines[: len(records)]), encoding="utf-8")
+    return records[0]["roots"], {record["node"]: record["children"] for record in records[1:]}
+
+
 def _bankitalia_bds_catalogue_rows(
     *,
     max_depth: Optional[int],
@@ -324,56 +580,113 @@ def _bankitalia_bds_catalogue_rows(
     limit: Optional[int],
     include_roots: bool,
     node_type: Optional[str],
+    max_workers: int,
+    checkpoint: Any,
     session: Any,
     timeout: int,
 ) -> list[dict[str, Any]]:
-    roots = _bankitalia_bds_post(
-        "GETTAXOROOTS",
-        session=session,
-        timeout=timeout,
-    )
-    if not isinstance(roots, list):
-        raise DataSourceError("Bank of Italy BDS taxonomy roots were not returned")
-
-    rows: list[dict[str, Any]] = []
-    queue: list[tuple[Mapping[str, Any], tuple[str, ...], int]] = [
-        (root, (), 0) for root in roots
-    ]
-    seen: set[tuple[Optional[str], Optional[str]]] = set()
-
-    while queue:
-        node, path, depth = queue.pop(0)
-        marker = (node.get("id"), node.get("nodePath") or node.get("parentAbsPath"))
-        if marker in seen:
-            continue
-        seen.add(marker)
+    """Walk the taxonomy breadth first, expanding each level concurrently.
+
+    Rows are produced in the same order as a one-node-at-a-time traversal:
+    nodes of a level are visited in order, and the ``SUBTREENODES`` calls for
+    those with unlisted children run together on the pool. With
+    ``checkpoint``, the roots and every fetched subtree are appended to that
+    JSON-lines file as they arrive; a later call replays them instead of
+    asking the service again and only fetches what is missing. The file is
+    removed once the walk finishes.
+    """
+    path = Path(checkpoint).expanduser() if checkpoint is not None else None
+    saved = _bankitalia_bds_load_checkpoint(path) if path is not None else None
+    roots, fetched = saved if saved is not None else (None, {})
+    journal = None
+    if roots is None:
+        roots = _bankitalia_bds_post(
+            "GETTAXOROOTS",
+            session=session,
+            timeout=timeout,
+        )
+        if not isinstance(roots, list):
+            raise DataSourceError("Bank of Italy BDS taxonomy roots were not returned")
+    if path is not None:
+        journal = path.open("a" if saved is not None else "w", encoding="utf-8")
+        if saved is None:
+            journal.write(json.dumps({"roots": roots}) + "\n")
+            journal.flush()
+
+    def subtree(node: Mapping[str, Any]) -> Any:
+        return _bankitalia_bds_post(
+            "SUBTREENODES",
+            data=_bankitalia_bds_subtree_payload(node),
+            calltype="asin",
+            session=session,
+            timeout=timeout,
+        )
 
-        row = _bankitalia_bds_node_row(node, path=path, depth=depth)
-        should_include = include_roots or depth > 0
+    def included(row: Mapping[str, Any]) -> bool:
+        if not (include_roots or row["depth"] > 0):
+            return False
         if node_type is not None and row.get("node_type") != node_type:
-            should_include = False
-        if should_include and _bankitalia_bds_matches(row, query):
-            rows.append(row)
-            if limit is not None and len(rows) >= limit:
-                break
+            return False
+        return _bankitalia_bds_matches(row, query)
 
-        name = row.get("name")
-        child_path = path + ((str(name),) if name else ())
-        children = node.get("cubes") or []
-        if max_depth is not None and depth >= max_depth:
-            continue
-        if not children and int(node.get("childrenNumber") or 0) > 0:
-            children = _bankitalia_bds_post(
-                "SUBTREENODES",
-                data=_bankitalia_bds_subtree_payload(node),
-                calltype="asin",
-                session=session,
-                timeout=timeout,
-            )
-        if isinstance(children, list):
-            queue.extend((child, child_path, depth + 1) for child in children)
-
-    return rows
+    rows: list[dict[str, Any]] = []
+    queue: deque[tuple[Mapping[str, Any], tuple[str, ...], int]] = deque(
+        (root, (), 0) for root in roots
+    )
+    seen: set[str] = set()
+    matched = 0
+    try:
+        while queue and (limit is None or matched < limit):
+            # Visit one level, collecting the nodes whose children are needed.
+            expand: list[tuple[Mapping[str, Any], tuple[str, ...], int, Any]] = []
+            level = queue[0][2]
+            while queue and queue[0][2] == level:
+                node, parents, depth = queue.popleft()
+                marker = _bankitalia_bds_marker(node)
+                if marker in seen:
+                    continue
+                seen.add(marker)
+
+                row = _bankitalia_bds_node_row(node, path=parents, depth=depth)
+                rows.append(row)
+                if included(row):
+                    matched += 1
+                    if limit is not None and matched >= limit:
+                        break
+
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                name = row.get("name")
+                child_path = parents + ((str(name),) if name else ())
+                children = node.get("cubes") or fetched.get(marker)
+                if children is None and int(node.get("childrenNumber") or 0) <= 0:
+                    continue
+                expand.append((node, child_path, depth, children))
+            else:
+                missing = [entry[0] for entry in expand if entry[3] is None]
+                for start in range(0, len(missing), BANKITALIA_BDS_BATCH_SIZE):
+                    batch = missing[start : start + BANKITALIA_BDS_BATCH_SIZE]
+                    for node, children in zip(
+                        batch, map_concurrently(subtree, batch, max_workers=max_workers)
+                    ):
+                        marker = _bankitalia_bds_marker(node)
+                        fetched[marker] = children
+                        if journal is not None:
+                            journal.write(json.dumps({"node": marker, "children": children}) + "\n")
+                    if journal is not None:
+                        journal.flush()
+                for node, child_path, depth, children in expand:
+                    if children is None:
+                        children = fetched[_bankitalia_bds_marker(node)]
+                    if isinstance(children, list):
+                        queue.extend((child, child_path, depth + 1) for child in children)
+    finally:
+        if journal is not None:
+            journal.close()
+
+    if path is not None:
+        path.unlink(missing_ok=True)
+    return [row for row in rows if included(row)]
 
 
 def list_ckan_datasets(
@@ -457,6 +770,8 @@ def fetch_ckan_resource(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
     params: Optional[Mapping[str, Any]] = None,
+    fetch_all_rows: bool = False,
+    max_workers: int = CKAN_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
     **read_kwargs: Any,
@@ -465,7 +780,9 @@ def fetch_ckan_resource(
 
     Pass ``dataset_id`` to select a supported CSV/JSON/Excel resource by
     ``resource_index``. Pass ``resource_id`` with ``datastore=True`` to use
-    CKAN's DataStore API instead of downloading the resource URL.
+    CKAN's DataStore API instead of downloading the resource URL; add
+    ``fetch_all_rows=True`` to read the whole table, ignoring ``limit`` and
+    ``offset``, through :func:`iter_ckan_datastore`.
     """
     query = dict(params or {})
     if datastore:
@@ -476,6 +793,18 @@ def fetch_ckan_resource(
             query["limit"] = limit
         if offset is not None:
             query["offset"] = offset
+        if fetch_all_rows:
+            del query["resource_id"]
+            return _concat_pages(
+                iter_ckan_datastore(
+                    base_url,
+                    resource_id,
+                    params=query,
+                    max_workers=max_workers,
+                    session=session,
+                    timeout=timeout,
+                )
+            )
         payload = get_json(
             _ckan_action_url(base_url, "datastore_search"),
             params=query,
@@ -508,15 +837,170 @@ def fetch_ckan_resource(
     file_format = (resource_format or _resource_format(resource, resource_url)).lower()
     response = get_response(resource_url, params=query or None, session=session, timeout=timeout)
     if file_format in {"xlsx", "xls"}:
-        return pd.read_excel(BytesIO(response.content), **read_kwargs)
+        content = BytesIO(response.content)
+        return timed_parse("read_excel", pd.read_excel, content, url=resource_url, **read_kwargs)
     if file_format in {"json", "geojson"}:
         try:
-            return _normalise_json_table(response.json())
+            return _normalise_json_table(response_json(response, url=resource_url))
         except ValueError as exc:
             raise DataSourceError(f"Invalid JSON returned by {resource_url}") from exc
-    options = {"sep": "\t" if file_format == "tsv" else None, "engine": "python"}
-    options.update(read_kwargs)
-    return pd.read_csv(BytesIO(response.content), **options)
+    if file_format == "tsv":
+        read_kwargs.setdefault("sep", "\t")
+    return delimited_frame(response.content, url=resource_url, **read_kwargs)
+
+
+def _sql_identifier(name: Any) -> str:
+    return '"{}"'.format(str(name).replace('"', '""'))
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Cannot filter a DataStore column on {value!r}")
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+def _datastore_sql_where(filters: Optional[Mapping[str, Any]], where: Optional[str]) -> str:
+    conditions = []
+    for column, value in (filters or {}).items():
+        if isinstance(value, (list, tuple, set)):
+            values = ", ".join(_sql_literal(item) for item in value)
+            conditions.append(f"{_sql_identifier(column)} IN ({values})")
+        else:
+            conditions.append(f"{_sql_identifier(column)} = {_sql_literal(value)}")
+    if where:
+        conditions.append(f"({where})")
+    return f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+def iter_ckan_datastore(
+    base_url: str,
+    resource_id: str,
+    *,
+    columns: Optional[list[str]] = None,
+    filters: Optional[Mapping[str, Any]] = None,
+    where: Optional[str] = None,
+    sql: Optional[bool] = None,
+    chunksize: int = CKAN_DATASTORE_PAGE_SIZE,
+    max_workers: int = CKAN_MAX_WORKERS,
+    params: Optional[Mapping[str, Any]] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """Yield a whole CKAN DataStore table in windows of ``chunksize`` rows.
+
+    The first window reports the table's total; the remaining windows are
+    fetched on up to ``max_workers`` threads and yielded in ``_id`` order.
+    ``columns`` and ``filters`` (column to value or list of values) are
+    pushed down to the portal. When they are given, or with a raw SQL
+    ``where`` clause or ``sql=True``, ``datastore_search_sql`` is used;
+    portals that do not allow it fall back to ``datastore_search`` unless
+    ``where`` or ``sql=True`` requires SQL. Pass ``sql=False`` to always
+    use ``datastore_search``, whose extra arguments can go in ``params``.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    if where is not None and sql is False:
+        raise ValueError("where requires datastore_search_sql")
+    use_sql = sql if sql is not None else bool(where or ((columns or filters) and not params))
+    windows = {"chunksize": chunksize, "max_workers": max_workers, "session": session, "timeout": timeout}
+    search = {"resource_id": resource_id, "sort": "_id", **(params or {})}
+    if columns:
+        search["fields"] = ",".join(columns)
+    if filters:
+        search["filters"] = json.dumps(dict(filters))
+    if not use_sql:
+        return _datastore_search_windows(base_url, search, **windows)
+    select = ", ".join(_sql_identifier(column) for column in columns) if columns else "*"
+    source = f" FROM {_sql_identifier(resource_id)}{_datastore_sql_where(filters, where)}"
+    # Portals may disable datastore_search_sql; the plain search can still
+    # push down columns and filters.
+    fallback = None if sql or where is not None else search
+    return _datastore_sql_windows(base_url, select, source, fallback, **windows)
+
+
+def _datastore_page(
+    url: str, params: Mapping[str, Any], *, session: Any, timeout: int
+) -> tuple[pd.DataFrame, Optional[int]]:
+    payload = get_json(url, params=params, session=session, timeout=timeout)
+    result = _ckan_result(payload)
+    if not isinstance(result, dict):
+        raise DataSourceError("CKAN DataStore returned no result")
+    frame = pd.json_normalize(result.get("records") or [])
+    total = result.get("total")
+    # ``SELECT *`` also returns the DataStore's internal full-text index column.
+    return frame.drop(columns="_full_text", errors="ignore"), None if total is None else int(total)
+
+
+def _datastore_search_windows(
+    base_url: str,
+    query: Mapping[str, Any],
+    *,
+    chunksize: int,
+    max_workers: int,
+    session: Any,
+    timeout: int,
+) -> Iterator[pd.DataFrame]:
+    url = _ckan_action_url(base_url, "datastore_search")
+
+    def fetch(offset: int) -> tuple[pd.DataFrame, Optional[int]]:
+        params = {**query, "limit": chunksize, "offset": offset}
+        return _datastore_page(url, params, session=session, timeout=timeout)
+
+    frame, total = fetch(0)
+    if len(frame):
+        yield frame
+    if total is None:
+        raise DataSourceError("CKAN DataStore did not report the table total")
+    offsets = range(chunksize, total, chunksize)
+    for frame, _ in iter_concurrently(fetch, offsets, max_workers=max_workers):
+        if len(frame):
+            yield frame
+
+
+def _datastore_sql_windows(
+    base_url: str,
+    select: str,
+    source: str,
+    fallback: Optional[Mapping[str, Any]],
+    *,
+    chunksize: int,
+    max_workers: int,
+    session: Any,
+    timeout: int,
+) -> Iterator[pd.DataFrame]:
+    url = _ckan_action_url(base_url, "datastore_search_sql")
+    try:
+        counted, _ = _datastore_page(
+            url, {"sql": f"SELECT count(*) AS total{source}"}, session=session, timeout=timeout
+        )
+        total = int(counted["total"].iloc[0])
+    except (DataSourceError, KeyError, IndexError, ValueError) as exc:
+        if fallback is None:
+            if isinstance(exc, DataSourceError):
+                raise
+            raise DataSourceError("CKAN datastore_search_sql did not return a row count") from exc
+        yield from _datastore_search_windows(
+            base_url, fallback, chunksize=chunksize, max_workers=max_workers, session=session, timeout=timeout
+        )
+        return
+
+    def fetch(offset: int) -> pd.DataFrame:
+        sql = f'SELECT {select}{source} ORDER BY "_id" LIMIT {chunksize} OFFSET {offset}'
+        return _datastore_page(url, {"sql": sql}, session=session, timeout=timeout)[0]
+
+    offsets = range(0, total, chunksize)
+    for offset, frame in zip(offsets, iter_concurrently(fetch, offsets, max_workers=max_workers)):
+        expected = min(chunksize, total - offset)
+        if len(frame) < expected:
+            raise DataSourceError(
+                f"Socrata returned {len(frame)} of {expected} rows at offset {offset}; "
+                "the portal may cap $limit below chunksize or the data changed while reading"
+            )
+        yield frame
 
 
 def list_socrata_datasets(
@@ -578,10 +1062,27 @@ def fetch_socrata_data(
     limit: Optional[int] = 1000,
     offset: Optional[int] = None,
     params: Optional[Mapping[str, Any]] = None,
+    fetch_all_rows: bool = False,
+    max_workers: int = 1,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """Retrieve rows from a Socrata/SODA dataset resource."""
+    """Retrieve rows from a Socrata/SODA dataset resource.
+
+    With ``fetch_all_rows`` every row is retrieved through
+    :func:`iter_socrata_data` and ``limit``/``offset`` are ignored.
+    """
+    if fetch_all_rows:
+        return _concat_pages(
+            iter_socrata_data(
+                domain,
+                dataset_id,
+                max_workers=max_workers,
+                params=params,
+                session=session,
+                timeout=timeout,
+            )
+        )
     query = dict(params or {})
     if limit is not None:
         query.setdefault("$limit", limit)
@@ -596,6 +1097,135 @@ def fetch_socrata_data(
     return _normalise_json_table(payload)
 
 
+def _socrata_csv_page(
+    url: str, query: Mapping[str, Any], *, session: Any, timeout: int
+) -> pd.DataFrame:
+    response = get_response(url, params=query, session=session, timeout=timeout)
+    if not response.content.strip():
+        return pd.DataFrame()
+    return csv_frame(response)
+
+
+def _soql_and(*conditions: Optional[str]) -> Optional[str]:
+    present = [f"({condition})" for condition in conditions if condition]
+    return " AND ".join(present) or None
+
+
+def iter_socrata_data(
+    domain: str,
+    dataset_id: str,
+    *,
+    chunksize: int = SOCRATA_PAGE_SIZE,
+    max_workers: int = 1,
+    params: Optional[Mapping[str, Any]] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """Yield every row of a Socrata/SODA dataset in frames of ``chunksize`` rows.
+
+    Rows come from the CSV resource endpoint, as strings like the JSON API,
+    ordered by the ``:id`` row identifier; ``$order``, ``$limit``, and
+    ``$offset`` in ``params`` are replaced, while ``$where`` and
+    ``$select`` are honoured. With the default single worker the dataset
+    is walked by keyset (``:id > last``), which stays fast however deep the
+    sync goes, and the next page is prefetched; it ends at the first empty
+    page. With ``max_workers`` above one the matching rows are counted and
+    fetched as parallel ``$offset`` slices, handed out in order; a slice
+    shorter than expected raises :class:`DataSourceError` rather than
+    returning a truncated dataset.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    path = quote(dataset_id, safe="_-")
+    csv_url = _socrata_url(domain, f"/resource/{path}.csv")
+    base = {
+        key: value
+        for key, value in (params or {}).items()
+        if key not in {"$order", "$limit", "$offset", "$where"}
+    }
+    where = (params or {}).get("$where")
+    if max_workers > 1:
+        return _socrata_slices(
+            domain, path, csv_url, base, where, chunksize, max_workers, session, timeout
+        )
+    return _socrata_keyset(csv_url, base, where, chunksize, session, timeout)
+
+
+def _socrata_keyset(
+    csv_url: str,
+    base: Mapping[str, Any],
+    where: Optional[str],
+    chunksize: int,
+    session: Any,
+    timeout: int,
+) -> Iterator[pd.DataFrame]:
+    selected = base.get("$select")
+    query = {**base, "$select": f":id, {selected}" if selected else ":id, *"}
+    query.update({"$order": ":id", "$limit": chunksize})
+
+    def fetch(last_id: Optional[str]) -> pd.DataFrame:
+        after = None if last_id is None else ":id > '{}'".format(last_id.replace("'", "''"))
+        page_query = dict(query)
+        condition = _soql_and(where, after)
+        if condition:
+            page_query["$where"] = condition
+        return _socrata_csv_page(csv_url, page_query, session=session, timeout=timeout)
+
+    def following(frame: pd.DataFrame) -> Optional[str]:
+        # Only an empty page ends the walk: portals may cap $limit below chunksize.
+        return str(frame[":id"].iloc[-1]) if len(frame) else None
+
+    for frame in iter_prefetched(fetch, None, following):
+        if len(frame):
+            yield frame.drop(columns=":id")
+
+
+def _socrata_slices(
+    domain: str,
+    path: str,
+    csv_url: str,
+    base: Mapping[str, Any],
+    where: Optional[str],
+    chunksize: int,
+    max_workers: int,
+    session: Any,
+    timeout: int,
+) -> Iterator[pd.DataFrame]:
+    # Count with the same row filters ($q, column=value, ...) as the slices.
+    count_query = {key: value for key, value in base.items() if key != "$select"}
+    count_query["$select"] = "count(*) AS row_count"
+    if where:
+        count_query["$where"] = where
+    payload = get_json(
+        _socrata_url(domain, f"/resource/{path}.json"),
+        params=count_query,
+        session=session,
+        timeout=timeout,
+    )
+    try:
+        total = int(payload[0]["row_count"])
+    except (IndexError, KeyError, TypeError, ValueError) as exc:
+        raise DataSourceError("Socrata did not return a row count") from exc
+    query = {**base, "$order": ":id", "$limit": chunksize}
+    if where:
+        query["$where"] = where
+
+    def fetch(offset: int) -> pd.DataFrame:
+        return _socrata_csv_page(
+            csv_url, {**query, "$offset": offset}, session=session, timeout=timeout
+        )
+
+    offsets = range(0, total, chunksize)
+    for offset, frame in zip(offsets, iter_concurrently(fetch, offsets, max_workers=max_workers)):
+        expected = min(chunksize, total - offset)
+        if len(frame) < expected:
+            raise DataSourceError(
+                f"Socrata returned {len(frame)} of {expected} rows at offset {offset}; "
+                "the portal may cap $limit below chunksize or the data changed while reading"
+            )
+        yield frame
+
+
 def list_italian_open_data_datasets(
     *,
     query: Optional[str] = None,
@@ -700,6 +1330,8 @@ def fetch_bdap_data(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
     params: Optional[Mapping[str, Any]] = None,
+    fetch_all_rows: bool = False,
+    max_workers: int = CKAN_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
     **read_kwargs: Any,
@@ -716,6 +1348,8 @@ def fetch_bdap_data(
         limit=limit,
         offset=offset,
         params=params,
+        fetch_all_rows=fetch_all_rows,
+        max_workers=max_workers,
         session=session,
         timeout=timeout,
         **read_kwargs,
@@ -759,6 +1393,8 @@ def fetch_lombardy_data(
     limit: Optional[int] = 1000,
     offset: Optional[int] = None,
     params: Optional[Mapping[str, Any]] = None,
+    fetch_all_rows: bool = False,
+    max_workers: int = 1,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
@@ -769,11 +1405,86 @@ def fetch_lombardy_data(
         limit=limit,
         offset=offset,
         params=params,
+        fetch_all_rows=fetch_all_rows,
+        max_workers=max_workers,
         session=session,
         timeout=timeout,
     )
 
 
+def iter_lombardy_data(
+    dataset_id: str,
+    *,
+    chunksize: int = SOCRATA_PAGE_SIZE,
+    max_workers: int = 1,
+    params: Optional[Mapping[str, Any]] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """Yield every row of a Regione Lombardia Socrata dataset in chunks."""
+    return iter_socrata_data(
+        LOMBARDY_SOCRATA_DOMAIN,
+        dataset_id,
+        chunksize=chunksize,
+        max_workers=max_workers,
+        params=params,
+        session=session,
+        timeout=timeout,
+    )
+
+
+def _result_page(payload: Any) -> tuple[list[Any], Optional[str]]:
+    """Split a REST payload into its records and the ``next`` page URL."""
+    if isinstance(payload, dict) and "results" in payload:
+        return list(payload["results"] or []), payload.get("next")
+    if isinstance(payload, list):
+        return payload, None
+    return [payload], None
+
+
+def _iter_result_pages(
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]],
+    fetch_all_pages: bool,
+    chunksize: Optional[int],
+    session: Any,
+    timeout: int,
+) -> Iterator[pd.DataFrame]:
+    """Follow ``next`` links, prefetching one page ahead, and yield DataFrames.
+
+    Without ``chunksize`` each page becomes one frame; otherwise records are
+    regrouped into frames of ``chunksize`` rows.
+    """
+
+    def fetch(request: tuple[str, Mapping[str, Any]]) -> tuple[list[Any], Optional[str]]:
+        page_url, query = request
+        return _result_page(get_json(page_url, params=query, session=session, timeout=timeout))
+
+    def following(page: tuple[list[Any], Optional[str]]) -> Optional[tuple[str, Mapping[str, Any]]]:
+        # ``next`` links already carry the original query string.
+        return (page[1], {}) if fetch_all_pages and page[1] else None
+
+    pending: list[Any] = []
+    for records, _ in iter_prefetched(fetch, (url, dict(params or {})), following):
+        if chunksize is None:
+            yield pd.json_normalize(records)
+            continue
+        pending.extend(records)
+        while len(pending) >= chunksize:
+            yield pd.json_normalize(pending[:chunksize])
+            del pending[:chunksize]
+    if pending:
+        yield pd.json_normalize(pending)
+
+
+def _concat_pages(frames: Iterator[pd.DataFrame]) -> pd.DataFrame:
+    pages = [frame for frame in frames if len(frame.columns)]
+    if not pages:
+        return pd.DataFrame()
+    return pd.concat(pages, ignore_index=True)
+
+
 def list_opencoesione_resources(
     *,
     session: Any = None,
@@ -788,6 +1499,12 @@ def list_opencoesione_resources(
     )
 
 
+def _opencoesione_url(resource: str) -> str:
+    if "/" in resource:
+        raise ValueError("resource must be a resource name, such as 'temi'")
+    return f"{OPENCOESIONE_URL}/{quote(resource, safe='_-')}/"
+
+
 def fetch_opencoesione_data(
     resource: str,
     *,
@@ -796,25 +1513,47 @@ def fetch_opencoesione_data(
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """Retrieve one OpenCoesione API resource."""
-    if "/" in resource:
-        raise ValueError("resource must be a resource name, such as 'temi'")
-    url: Optional[str] = f"{OPENCOESIONE_URL}/{quote(resource, safe='_-')}/"
-    rows: list[Any] = []
-    query = dict(params or {})
-    while url:
-        payload = get_json(url, params=query, session=session, timeout=timeout)
-        if isinstance(payload, dict) and "results" in payload:
-            rows.extend(payload["results"])
-            url = payload.get("next") if fetch_all_pages else None
-            query = {}
-        elif isinstance(payload, list):
-            rows.extend(payload)
-            url = None
-        else:
-            rows.append(payload)
-            url = None
-    return pd.json_normalize(rows)
+    """Retrieve one OpenCoesione API resource.
+
+    With ``fetch_all_pages`` the pages are parsed as they arrive, while the
+    next one downloads, and concatenated once at the end.
+    """
+    return _concat_pages(
+        _iter_result_pages(
+            _opencoesione_url(resource),
+            params=params,
+            fetch_all_pages=fetch_all_pages,
+            chunksize=None,
+            session=session,
+            timeout=timeout,
+        )
+    )
+
+
+def iter_opencoesione_data(
+    resource: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """Yield an OpenCoesione resource one page, or ``chunksize`` rows, at a time.
+
+    Every ``next`` page is followed and the following page is downloaded
+    while the caller processes the current frame, so large resources such
+    as ``progetti`` never have to fit in memory at once.
+    """
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    return _iter_result_pages(
+        _opencoesione_url(resource),
+        params=params,
+        fetch_all_pages=True,
+        chunksize=chunksize,
+        session=session,
+        timeout=timeout,
+    )
 
 
 def list_bankitalia_currencies(
@@ -904,6 +1643,8 @@ def list_bankitalia_bds_catalogue(
     query: Optional[str] = None,
     limit: Optional[int] = None,
     include_roots: bool = True,
+    max_workers: int = BANKITALIA_BDS_MAX_WORKERS,
+    checkpoint: Optional[Union[str, os.PathLike]] = None,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
@@ -914,6 +1655,11 @@ def list_bankitalia_bds_catalogue(
     other Bank of Italy series. ``max_depth`` controls how far the taxonomy is
     expanded from the roots; pass ``None`` to walk until the remote service has
     no more child nodes. Use ``limit`` when exploring interactively.
+
+    Each level is expanded with up to ``max_workers`` concurrent requests.
+    Pass a file path as ``checkpoint`` for long walks: progress is saved there
+    as the crawl advances, an interrupted call resumes from it when repeated,
+    and the file is deleted when the walk completes.
     """
     rows = _bankitalia_bds_catalogue_rows(
         max_depth=max_depth,
@@ -921,6 +1667,8 @@ def list_bankitalia_bds_catalogue(
         limit=limit,
         include_roots=include_roots,
         node_type=None,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
         session=session,
         timeout=timeout,
     )
@@ -932,16 +1680,24 @@ def list_bankitalia_bds_cubes(
     max_depth: Optional[int] = None,
     query: Optional[str] = None,
     limit: Optional[int] = None,
+    max_workers: int = BANKITALIA_BDS_MAX_WORKERS,
+    checkpoint: Optional[Union[str, os.PathLike]] = None,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """List statistical cubes available from the Bank of Italy BDS catalogue."""
+    """List statistical cubes available from the Bank of Italy BDS catalogue.
+
+    ``max_workers`` and ``checkpoint`` behave as in
+    :func:`list_bankitalia_bds_catalogue`.
+    """
     rows = _bankitalia_bds_catalogue_rows(
         max_depth=max_depth,
         query=query,
         limit=limit,
         include_roots=False,
         node_type="CUBE",
+        max_workers=max_workers,
+        checkpoint=checkpoint,
         session=session,
         timeout=timeout,
     )
@@ -963,7 +1719,8 @@ def list_ameco_variables(
         session=session,
         timeout=timeout,
     )
-    frame = pd.read_excel(BytesIO(response.content))
+    content = BytesIO(response.content)
+    frame = timed_parse("read_excel", pd.read_excel, content, url=AMECO_VARIABLES_URL)
     frame = frame.rename(
         columns={
             "Unnamed: 0": "chapter_id",
@@ -1018,41 +1775,11 @@ def fetch_ameco_data(
     if years is not None:
         query["years"] = ",".join(str(item) for item in _as_list(years))
     response = get_response(AMECO_URL, params=query, session=session, timeout=timeout)
-    try:
-        tables = pd.read_html(StringIO(response.text))
-    except ValueError as exc:
-        raise DataSourceError("AMECO did not return a readable table") from exc
-    if not tables:
-        raise DataSourceError("AMECO did not return any data table")
-    frame = tables[0]
-    years_found = _year_columns(frame)
-    if not years_found:
-        return frame
-    id_columns = [column for column in frame.columns if column not in years_found]
-    melted = frame.melt(
-        id_vars=id_columns,
-        value_vars=years_found,
-        var_name="time_period",
-        value_name="value",
-    )
-    melted = melted.rename(
-        columns={
-            "Country": "country",
-            "Label": "indicator",
-            "Unit": "unit",
-        }
-    )
-    melted["full_variable"] = full_variable
-    melted["value"] = pd.to_numeric(melted["value"], errors="coerce")
-    columns = [
-        "full_variable",
-        "country",
-        "indicator",
-        "unit",
-        "time_period",
-        "value",
-    ]
-    return observations_frame(melted[[column for column in columns if column in melted.columns]])
+    names, body = timed_parse("ameco_table", _ameco_table_cells, response.content, url=AMECO_URL)
+    if not any(_is_year(name) for name in names):
+        # Without year columns there is nothing to reshape; keep pandas' typed table.
+        return pd.read_html(StringIO(response.text))[0]
+    return _ameco_frame(names, body, full_variable)
 
 
 def list_imf_indicators(
@@ -1157,24 +1884,24 @@ def list_un_population_indicators(
     page_size: int = 100,
     page_number: int = 1,
     fetch_all_pages: bool = False,
+    max_workers: int = UN_POPULATION_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """List indicators from the UN Population Data Portal."""
-    rows = []
-    current_page = page_number
-    while True:
-        payload = get_json(
-            f"{UN_POPULATION_URL}/indicators",
-            params={"pageSize": page_size, "pageNumber": current_page},
-            session=session,
-            timeout=timeout,
-        )
-        rows.extend(payload.get("data", []))
-        pages = int(payload.get("pages") or current_page)
-        if not fetch_all_pages or current_page >= pages:
-            break
-        current_page += 1
+    """List indicators from the UN Population Data Portal.
+
+    With ``fetch_all_pages`` the pages after ``page_number`` are fetched
+    concurrently on up to ``max_workers`` threads.
+    """
+    rows = _un_population_rows(
+        f"{UN_POPULATION_URL}/indicators",
+        {"pageSize": page_size},
+        page_number=page_number,
+        fetch_all_pages=fetch_all_pages,
+        max_workers=max_workers,
+        session=session,
+        timeout=timeout,
+    )
     frame = pd.json_normalize(rows)
     if frame.empty:
         return frame
@@ -1196,24 +1923,24 @@ def list_un_population_locations(
     page_size: int = 100,
     page_number: int = 1,
     fetch_all_pages: bool = False,
+    max_workers: int = UN_POPULATION_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """List locations from the UN Population Data Portal."""
-    rows = []
-    current_page = page_number
-    while True:
-        payload = get_json(
-            f"{UN_POPULATION_URL}/locations",
-            params={"pageSize": page_size, "pageNumber": current_page},
-            session=session,
-            timeout=timeout,
-        )
-        rows.extend(payload.get("data", []))
-        pages = int(payload.get("pages") or current_page)
-        if not fetch_all_pages or current_page >= pages:
-            break
-        current_page += 1
+    """List locations from the UN Population Data Portal.
+
+    With ``fetch_all_pages`` the pages after ``page_number`` are fetched
+    concurrently on up to ``max_workers`` threads.
+    """
+    rows = _un_population_rows(
+        f"{UN_POPULATION_URL}/locations",
+        {"pageSize": page_size},
+        page_number=page_number,
+        fetch_all_pages=fetch_all_pages,
+        max_workers=max_workers,
+        session=session,
+        timeout=timeout,
+    )
     frame = pd.json_normalize(rows)
     if frame.empty:
         return frame
@@ -1221,13 +1948,16 @@ def list_un_population_locations(
 
 
 def fetch_un_population_data(
-    indicator_id: int,
+    indicator_id: Any,
     *,
-    location_id: int = 380,
+    location_id: Any = 380,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
     auth_token: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    page_size: int = 100,
+    fetch_all_pages: bool = True,
+    max_workers: int = UN_POPULATION_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
@@ -1235,24 +1965,29 @@ def fetch_un_population_data(
 
     The public catalogue is open. The data endpoint can require a bearer token;
     pass ``auth_token`` or set ``UN_POPULATION_TOKEN`` when the portal enforces
-    authentication.
+    authentication. ``indicator_id`` and ``location_id`` accept one ID or a
+    list. Results are paginated: every page is retrieved, the ones after the
+    first concurrently on up to ``max_workers`` threads, unless
+    ``fetch_all_pages`` is false.
     """
     token = auth_token or os.getenv("UN_POPULATION_TOKEN")
     if not token:
         raise ValueError("auth_token or UN_POPULATION_TOKEN is required for UN population data")
     start = start_year if start_year is not None else 1950
     end = end_year if end_year is not None else 2100
-    query = dict(params or {})
-    headers = {"Authorization": f"Bearer {token}"}
-    payload = get_json(
-        f"{UN_POPULATION_URL}/data/indicators/{indicator_id}/locations/{location_id}"
+    indicators = ",".join(str(item) for item in _as_list(indicator_id))
+    locations = ",".join(str(item) for item in _as_list(location_id))
+    rows = _un_population_rows(
+        f"{UN_POPULATION_URL}/data/indicators/{indicators}/locations/{locations}"
         f"/start/{start}/end/{end}",
-        params=query or None,
-        headers=headers,
+        {"pageSize": page_size, **(params or {})},
+        fetch_all_pages=fetch_all_pages,
+        max_workers=max_workers,
+        headers={"Authorization": f"Bearer {token}"},
         session=session,
         timeout=timeout,
     )
-    frame = _normalise_portal_rows(payload)
+    frame = pd.json_normalize(rows)
     if frame.empty:
         return frame
     frame = frame.rename(
@@ -1303,10 +2038,19 @@ def fetch_bis_data(
     start_period: Optional[str] = None,
     end_period: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    compact: bool = True,
+    value_dtype: str = "float64",
+    result_format: str = "pandas",
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
-) -> pd.DataFrame:
-    """Retrieve observations from the BIS SDMX API."""
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Retrieve observations from the BIS SDMX API.
+
+    Pass ``chunksize`` to stream the CSV body and receive an iterator of
+    observation DataFrames with at most that many rows each. Repeated codes
+    are stored as categories unless ``compact=False``.
+    """
     url = f"{BIS_URL}/data/{quote(dataflow, safe=',._-')}"
     if key:
         url = f"{url}/{quote(key, safe='.+_-')}"
@@ -1316,8 +2060,16 @@ def fetch_bis_data(
         query["startPeriod"] = start_period
     if end_period is not None:
         query["endPeriod"] = end_period
-    response = get_response(url, params=query, session=session, timeout=timeout)
-    return observations_frame(csv_frame(response))
+    return _sdmx_csv_observations(
+        url,
+        params=query,
+        chunksize=chunksize,
+        compact=compact,
+        value_dtype=value_dtype,
+        result_format=result_format,
+        session=session,
+        timeout=timeout,
+    )
 
 
 def list_istat_dataflows(*, session: Any = None, timeout: int = DEFAULT_TIMEOUT) -> pd.DataFrame:
@@ -1338,14 +2090,24 @@ def fetch_istat_data(
     start_period: Optional[str] = None,
     end_period: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    compact: bool = True,
+    value_dtype: str = "float64",
+    result_format: str = "pandas",
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """Retrieve an ISTAT SDMX dataflow as observations.
 
     ``key`` is the ordered SDMX key for the dataflow, for example ``.......``
     selects every dimension value in a seven-dimension dataflow. Prefer
     filtered keys because ISTAT applies request limits and some flows are big.
+    Pass ``chunksize`` to stream a big flow as an iterator of DataFrames.
+    Dimension and attribute codes come back as categories and ``value`` as
+    ``value_dtype``; pass ``compact=False`` for plain string columns.
+    ``result_format="arrow"`` parses the CSV body straight into a
+    ``pyarrow.Table`` and ``"pandas_arrow"`` returns an Arrow-backed
+    DataFrame; both require pyarrow.
     """
     url = f"{ISTAT_URL}/{quote(dataflow_id, safe='_-')}"
     if key:
@@ -1355,14 +2117,17 @@ def fetch_istat_data(
         query["startPeriod"] = start_period
     if end_period is not None:
         query["endPeriod"] = end_period
-    response = get_response(
+    return _sdmx_csv_observations(
         url,
         params=query,
         headers={"Accept": "text/csv"},
+        chunksize=chunksize,
+        compact=compact,
+        value_dtype=value_dtype,
+        result_format=result_format,
         session=session,
         timeout=timeout,
     )
-    return observations_frame(csv_frame(response))
 
 
 def list_oecd_dataflows(
@@ -1393,14 +2158,20 @@ def fetch_oecd_data(
     start_period: Optional[str] = None,
     end_period: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    compact: bool = True,
+    value_dtype: str = "float64",
+    result_format: str = "pandas",
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """Retrieve a current OECD Data Explorer SDMX flow.
 
     ``dataflow`` is the full OECD flow reference, such as
     ``OECD.SDD.STES,DSD_STES@DF_FINMARK,``. ``key`` follows that flow's
-    ordered dimensions; use dots as wildcards.
+    ordered dimensions; use dots as wildcards. Pass ``chunksize`` to stream
+    a big flow as an iterator of DataFrames. Repeated codes are stored as
+    categories unless ``compact=False``.
     """
     url = f"{OECD_URL}/{quote(dataflow, safe=',@._-')}"
     if key:
@@ -1410,14 +2181,17 @@ def fetch_oecd_data(
         query["startPeriod"] = start_period
     if end_period is not None:
         query["endPeriod"] = end_period
-    response = get_response(
+    return _sdmx_csv_observations(
         url,
         params=query,
         headers={"Accept": "text/csv"},
+        chunksize=chunksize,
+        compact=compact,
+        value_dtype=value_dtype,
+        result_format=result_format,
         session=session,
         timeout=timeout,
     )
-    return observations_frame(csv_frame(response))
 
 
 def fetch_eurostat_data(
@@ -1427,23 +2201,43 @@ def fetch_eurostat_data(
     start_period: Optional[str] = None,
     end_period: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    compact: bool = True,
+    value_dtype: str = "float64",
+    result_format: str = "pandas",
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
-) -> pd.DataFrame:
-    """Retrieve a Eurostat dataset using its supported JSON-stat API."""
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Retrieve a Eurostat dataset using its supported JSON-stat API.
+
+    ``result_format="arrow"`` builds a ``pyarrow.Table`` directly from the
+    JSON-stat cube and ``"pandas_arrow"`` an Arrow-backed DataFrame. Pass
+    ``chunksize`` for unfiltered regional datasets: the response is parsed
+    incrementally and an iterator of DataFrames with at most that many rows
+    is returned, without holding the decoded JSON document in memory.
+    """
     query = dict(params or {})
     query.update(filters or {})
     if start_period is not None:
         query["sinceTimePeriod"] = start_period
     if end_period is not None:
         query["untilTimePeriod"] = end_period
-    payload = get_json(
-        f"{EUROSTAT_URL}/{quote(dataset, safe='_-')}",
-        params=query,
-        session=session,
-        timeout=timeout,
-    )
-    return jsonstat_frame(payload)
+    url = f"{EUROSTAT_URL}/{quote(dataset, safe='_-')}"
+    check_result_format(result_format)
+    if chunksize is not None:
+        response = get_response(url, params=query, session=session, timeout=timeout, stream=True)
+        return _jsonstat_chunks(
+            response,
+            chunksize,
+            result_format,
+            compact=compact,
+            value_dtype=value_dtype,
+        )
+    payload = get_json(url, params=query, session=session, timeout=timeout)
+    if result_format != "pandas":
+        table = jsonstat_table(payload, compact=compact, value_dtype=value_dtype)
+        return arrow_result(table, result_format)
+    return jsonstat_frame(payload, compact=compact, value_dtype=value_dtype)
 
 
 def list_ecb_dataflows(*, session: Any = None, timeout: int = DEFAULT_TIMEOUT) -> pd.DataFrame:
@@ -1464,10 +2258,19 @@ def fetch_ecb_data(
     start_period: Optional[str] = None,
     end_period: Optional[str] = None,
     params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    compact: bool = True,
+    value_dtype: str = "float64",
+    result_format: str = "pandas",
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
-) -> pd.DataFrame:
-    """Retrieve observations from the ECB Data Portal SDMX API."""
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Retrieve observations from the ECB Data Portal SDMX API.
+
+    Pass ``chunksize`` to stream the CSV body and receive an iterator of
+    observation DataFrames with at most that many rows each. Repeated codes
+    are stored as categories unless ``compact=False``.
+    """
     url = f"{ECB_URL}/{quote(dataset, safe='_-')}"
     if key:
         url = f"{url}/{quote(key, safe='.+_-')}"
@@ -1477,8 +2280,16 @@ def fetch_ecb_data(
         query["startPeriod"] = start_period
     if end_period is not None:
         query["endPeriod"] = end_period
-    response = get_response(url, params=query, session=session, timeout=timeout)
-    return observations_frame(csv_frame(response))
+    return _sdmx_csv_observations(
+        url,
+        params=query,
+        chunksize=chunksize,
+        compact=compact,
+        value_dtype=value_dtype,
+        result_format=result_format,
+        session=session,
+        timeout=timeout,
+    )
 
 
 def list_eurostat_dataflows(
@@ -1498,6 +2309,103 @@ def list_eurostat_dataflows(
     return _sdmx_xml_dataflows(response.content)
 
 
+def _world_bank_page(
+    url: str,
+    params: Mapping[str, Any],
+    *,
+    session: Any,
+    timeout: int,
+    attempts: int = 1,
+) -> tuple[Mapping[str, Any], list[Any]]:
+    """Return one page's metadata and items, retrying malformed pages.
+
+    Failed requests were already retried by the transport, so only pages
+    that arrive intact but unusable are requested again, after the host's
+    :class:`RetryPolicy` backoff.
+    """
+    attempt = 1
+    while True:
+        # A retry must not be answered from a cached copy of the bad page.
+        cache = False if attempt > 1 else None
+        try:
+            payload = get_json(url, params=params, session=session, timeout=timeout, cache=cache)
+            if not isinstance(payload, list) or len(payload) < 2:
+                raise DataSourceError("World Bank returned an unexpected payload")
+            return payload[0], payload[1] or []
+        except DataSourceError as exc:
+            if attempt >= attempts or isinstance(exc.__cause__, requests.RequestException):
+                raise
+        _, retry = host_limits(url)
+        time.sleep(retry.delay(attempt))
+        attempt += 1
+
+
+def _world_bank_params(start_year: Optional[int], end_year: Optional[int]) -> dict[str, Any]:
+    params: dict[str, Any] = {"format": "json", "per_page": 1000}
+    if start_year is not None or end_year is not None:
+        first = start_year if start_year is not None else end_year
+        last = end_year if end_year is not None else start_year
+        params["date"] = f"{first}:{last}"
+    return params
+
+
+def _world_bank_observations(
+    queries: list[tuple[str, Mapping[str, Any]]],
+    *,
+    fetch_all_pages: bool,
+    max_workers: int,
+    session: Any,
+    timeout: int,
+) -> list[Any]:
+    """Fetch every page of each query and return the items in query and page order.
+
+    The first pages run concurrently and report the page counts; all the
+    remaining pages then share one bounded pool.
+    """
+
+    def first_page(query: tuple[str, Mapping[str, Any]]) -> tuple[Mapping[str, Any], list[Any]]:
+        url, params = query
+        return _world_bank_page(url, {**params, "page": 1}, session=session, timeout=timeout)
+
+    def later_page(work: tuple[int, int]) -> list[Any]:
+        url, params = queries[work[0]]
+        return _world_bank_page(
+            url,
+            {**params, "page": work[1]},
+            session=session,
+            timeout=timeout,
+            attempts=WORLD_BANK_PAGE_ATTEMPTS,
+        )[1]
+
+    firsts = map_concurrently(first_page, queries, max_workers=max_workers)
+    remaining = [
+        (index, page)
+        for index, (metadata, _) in enumerate(firsts)
+        for page in range(2, (int(metadata.get("pages", 1)) if fetch_all_pages else 1) + 1)
+    ]
+    pages = [items for _, items in firsts]
+    for (index, _), items in zip(remaining, map_concurrently(later_page, remaining, max_workers=max_workers)):
+        pages[index].extend(items)
+    return [item for items in pages for item in items]
+
+
+def _world_bank_frame(observations: list[Any], indicator: Optional[str] = None) -> pd.DataFrame:
+    """Build the observation frame column by column from the page items."""
+    countries = [item.get("country") or {} for item in observations]
+    indicators = [item.get("indicator") or {} for item in observations]
+    frame = pd.DataFrame(
+        {
+            "country_id": [country.get("id") for country in countries],
+            "country": [country.get("value") for country in countries],
+            "indicator_id": [entry.get("id", indicator) for entry in indicators],
+            "indicator": [entry.get("value") for entry in indicators],
+            "time_period": [item.get("date") for item in observations],
+            "value": [item.get("value") for item in observations],
+        }
+    )
+    return observations_frame(frame)
+
+
 def fetch_world_bank_data(
     indicator: str,
     country: str = "ITA",
@@ -1505,47 +2413,100 @@ def fetch_world_bank_data(
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
     fetch_all_pages: bool = True,
+    max_workers: int = WORLD_BANK_MAX_WORKERS,
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """Retrieve one World Bank indicator; Italy is the default geography."""
+    """Retrieve one World Bank indicator; Italy is the default geography.
+
+    The first page reports how many pages there are; the rest are fetched
+    on up to ``max_workers`` threads and kept in page order. A page that
+    comes back malformed is requested again with the transport's backoff,
+    up to :data:`WORLD_BANK_PAGE_ATTEMPTS` times.
+    """
     url = (
         f"{WORLD_BANK_URL}/country/{quote(country, safe=';_-')}"
         f"/indicator/{quote(indicator, safe='._-')}"
     )
-    params: dict[str, Any] = {"format": "json", "per_page": 1000, "page": 1}
-    if start_year is not None or end_year is not None:
-        first = start_year if start_year is not None else end_year
-        last = end_year if end_year is not None else start_year
-        params["date"] = f"{first}:{last}"
+    observations = _world_bank_observations(
+        [(url, _world_bank_params(start_year, end_year))],
+        fetch_all_pages=fetch_all_pages,
+        max_workers=max_workers,
+        session=session,
+        timeout=timeout,
+    )
+    return _world_bank_frame(observations, indicator)
 
-    observations = []
-    payload = get_json(url, params=params, session=session, timeout=timeout)
-    if not isinstance(payload, list) or len(payload) < 2:
-        raise DataSourceError("World Bank returned an unexpected payload")
-    metadata, page_data = payload[0], payload[1] or []
-    observations.extend(page_data)
-    pages = int(metadata.get("pages", 1)) if fetch_all_pages else 1
-    for page in range(2, pages + 1):
-        params["page"] = page
-        next_payload = get_json(url, params=params, session=session, timeout=timeout)
-        observations.extend(next_payload[1] or [])
 
-    rows = []
-    for item in observations:
-        country_data = item.get("country", {})
-        indicator_data = item.get("indicator", {})
-        rows.append(
-            {
-                "country_id": country_data.get("id"),
-                "country": country_data.get("value"),
-                "indicator_id": indicator_data.get("id", indicator),
-                "indicator": indicator_data.get("value"),
-                "time_period": item.get("date"),
-                "value": item.get("value"),
-            }
-        )
-    return observations_frame(pd.DataFrame(rows))
+def _pack_codes(codes: list[str], budget: int, limit: Optional[int] = None) -> list[list[str]]:
+    """Group ``codes`` greedily so each ``;``-joined group fits in ``budget``."""
+    groups: list[list[str]] = []
+    length = 0
+    for code in codes:
+        if groups and length + 1 + len(code) <= budget and (limit is None or len(groups[-1]) < limit):
+            groups[-1].append(code)
+            length += 1 + len(code)
+        else:
+            groups.append([code])
+            length = len(code)
+    return groups
+
+
+def _world_bank_batches(
+    indicators: list[str],
+    countries: list[str],
+    params: Mapping[str, Any],
+    max_url_length: int,
+) -> list[str]:
+    """Return as few URLs as cover every indicator and country within the limits."""
+    template = f"{WORLD_BANK_URL}/country//indicator/?{urlencode({**params, 'page': 99999})}"
+    budget = max_url_length - len(template)
+    countries = [quote(country, safe="_-") for country in countries]
+    indicators = [quote(indicator, safe="._-") for indicator in indicators]
+    urls = []
+    for country_group in _pack_codes(countries, budget - max(map(len, indicators))):
+        country_path = ";".join(country_group)
+        indicator_budget = budget - len(country_path)
+        for indicator_group in _pack_codes(indicators, indicator_budget, WORLD_BANK_MAX_INDICATORS):
+            urls.append(f"{WORLD_BANK_URL}/country/{country_path}/indicator/{';'.join(indicator_group)}")
+    return urls
+
+
+def fetch_world_bank_batch(
+    indicators: Any,
+    countries: Any = "ITA",
+    *,
+    source: Union[int, str] = 2,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    max_url_length: int = WORLD_BANK_MAX_URL_LENGTH,
+    max_workers: int = WORLD_BANK_MAX_WORKERS,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> pd.DataFrame:
+    """Retrieve many World Bank indicators for many countries as one long frame.
+
+    Indicators and countries are sent as ``;``-separated lists, packed into
+    as few requests as fit in ``max_url_length`` characters and the API's
+    :data:`WORLD_BANK_MAX_INDICATORS` indicators per request. All indicators
+    must belong to the same World Bank ``source`` (2 is World Development
+    Indicators). Requests and their pages run on up to ``max_workers``
+    threads.
+    """
+    indicator_codes = list(dict.fromkeys(str(item) for item in _as_list(indicators)))
+    country_codes = list(dict.fromkeys(str(item) for item in _as_list(countries)))
+    if not indicator_codes or not country_codes:
+        raise ValueError("indicators and countries must not be empty")
+    params = {**_world_bank_params(start_year, end_year), "source": source}
+    urls = _world_bank_batches(indicator_codes, country_codes, params, max_url_length)
+    observations = _world_bank_observations(
+        [(url, params) for url in urls],
+        fetch_all_pages=True,
+        max_workers=max_workers,
+        session=session,
+        timeout=timeout,
+    )
+    return _world_bank_frame(observations)
 
 
 def list_world_bank_indicators(
@@ -1724,10 +2685,9 @@ def fetch_inps_data(
     response = get_response(resource["url"], session=session, timeout=timeout)
     file_format = str(resource.get("format", "")).lower()
     if file_format in {"xlsx", "xls"}:
-        return pd.read_excel(BytesIO(response.content), **read_kwargs)
-    options = {"sep": None, "engine": "python"}
-    options.update(read_kwargs)
-    return pd.read_csv(BytesIO(response.content), **options)
+        content = BytesIO(response.content)
+        return timed_parse("read_excel", pd.read_excel, content, url=resource["url"], **read_kwargs)
+    return delimited_frame(response.content, url=resource["url"], **read_kwargs)
 
 
 def list_pnrr_resources(*, session: Any = None, timeout: int = DEFAULT_TIMEOUT) -> pd.DataFrame:
@@ -1740,6 +2700,12 @@ def list_pnrr_resources(*, session: Any = None, timeout: int = DEFAULT_TIMEOUT)
     )
 
 
+def _pnrr_url(resource: str) -> str:
+    if "/" in resource:
+        raise ValueError("resource must be a resource name, such as 'missioni'")
+    return f"{PNRR_URL}/{quote(resource, safe='_-')}"
+
+
 def fetch_pnrr_data(
     resource: str,
     *,
@@ -1748,22 +2714,43 @@ def fetch_pnrr_data(
     session: Any = None,
     timeout: int = DEFAULT_TIMEOUT,
 ) -> pd.DataFrame:
-    """Retrieve one OpenPNRR resource, optionally following paginated results."""
-    if "/" in resource:
-        raise ValueError("resource must be a resource name, such as 'missioni'")
-    url: Optional[str] = f"{PNRR_URL}/{quote(resource, safe='_-')}"
-    rows: list[Any] = []
-    query = dict(params or {})
-    while url:
-        payload = get_json(url, params=query, session=session, timeout=timeout)
-        if isinstance(payload, dict) and "results" in payload:
-            rows.extend(payload["results"])
-            url = payload.get("next") if fetch_all_pages else None
-            query = {}
-        elif isinstance(payload, list):
-            rows.extend(payload)
-            url = None
-        else:
-            rows.append(payload)
-            url = None
-    return pd.json_normalize(rows)
+    """Retrieve one OpenPNRR resource, optionally following paginated results.
+
+    With ``fetch_all_pages`` the pages are parsed as they arrive, while the
+    next one downloads, and concatenated once at the end.
+    """
+    return _concat_pages(
+        _iter_result_pages(
+            _pnrr_url(resource),
+            params=params,
+            fetch_all_pages=fetch_all_pages,
+            chunksize=None,
+            session=session,
+            timeout=timeout,
+        )
+    )
+
+
+def iter_pnrr_data(
+    resource: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    chunksize: Optional[int] = None,
+    session: Any = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """Yield an OpenPNRR resource one page, or ``chunksize`` rows, at a time.
+
+    Every ``next`` page is followed and the following page is downloaded
+    while the caller processes the current frame.
+    """
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    return _iter_result_pages(
+        _pnrr_url(resource),
+        params=params,
+        fetch_all_pages=True,
+        chunksize=chunksize,
+        session=session,
+        timeout=timeout,
+    )
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import sys
-import time
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable
 
 import pandas as pd
 
@@ -13,7 +12,6 @@ if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from italian_our_world_data import (
-    DataSourceError,
     fetch_ameco_data,
     fetch_bankitalia_exchange_rates,
     fetch_bis_data,
@@ -36,26 +34,6 @@ from italian_our_world_data import (
 )
 
 
-def _retrieve_with_retries(
-    retrieve: Callable[[], pd.DataFrame],
-    *,
-    attempts: int = 3,
-    delay_seconds: float = 1.0,
-) -> pd.DataFrame:
-    """Retry transient provider failures during live verification."""
-    last_error: Optional[Exception] = None
-    for attempt in range(1, attempts + 1):
-        try:
-            return retrieve()
-        except DataSourceError as exc:
-            last_error = exc
-            if attempt == attempts:
-                break
-            time.sleep(delay_seconds)
-    assert last_error is not None
-    raise last_error
-
-
 def _checks() -> list[tuple[str, Callable[[], pd.DataFrame]]]:
     return [
         (
@@ -159,7 +137,8 @@ def main() -> int:
     print("Live provider verification")
     for name, retrieve in _checks():
         try:
-            frame = _retrieve_with_retries(retrieve)
+            # Transient failures are already retried by the transport.
+            frame = retrieve()
             if frame.empty:
                 raise RuntimeError("empty DataFrame returned")
             print(f"PASS  {name:<25} rows={len(frame):>5} columns={len(frame.columns):>2}")
@@ -0,0 +1,567 @@
+import gzip
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+import requests
+import urllib3
+
+from italian_our_world_data import (
+    RetryPolicy,
+    bypass_http_cache,
+    configure_connection_pool,
+    configure_host,
+    configure_http_cache,
+    configure_source,
+    default_session,
+    fetch_data,
+    fetch_eurostat_data,
+    fetch_oecd_data,
+    fetch_pnrr_data,
+)
+from italian_our_world_data import _common, _jsonstat
+from italian_our_world_data._cache import ResultCache
+from italian_our_world_data._common import (
+    DataSourceError,
+    csv_frame,
+    delimited_frame,
+    get_json,
+    get_response,
+    jsonstat_frame,
+    jsonstat_table,
+    to_result_format,
+)
+
+
+class Response:
+    def __init__(self, *, text="", payload=None, content=None, status=200, headers=None):
+        self.text = text
+        self._payload = payload
+        self.content = content if content is not None else text.encode()
+        self.status_code = status
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"status {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class Session:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append((url, params, headers, timeout))
+        return self.responses.pop(0)
+
+
+def streamed_response(body, *, status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    response.url = "https://data.test/stream"
+    return response
+
+
+class StreamingSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        self.calls.append((url, params, headers, timeout, stream))
+        return self.responses.pop(0)
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def tearDown(self):
+        configure_connection_pool(
+            pool_connections=_common.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=_common.DEFAULT_POOL_MAXSIZE,
+            pool_block=False,
+            host_pool_sizes={},
+        )
+
+    def test_default_session_shares_pools_between_threads(self):
+        configure_connection_pool(pool_maxsize=3, host_pool_sizes={"api.worldbank.org": 7})
+        session = default_session()
+        self.assertIs(default_session(), session)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(default_session()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], session)
+        self.assertIs(
+            other[0].get_adapter("https://esploradati.istat.it/x"),
+            session.get_adapter("https://esploradati.istat.it/x"),
+        )
+        self.assertEqual(session.get_adapter("https://esploradati.istat.it/x")._pool_maxsize, 3)
+        self.assertEqual(session.get_adapter("https://api.worldbank.org/v2")._pool_maxsize, 7)
+
+    def test_reconfiguring_rebuilds_the_thread_session(self):
+        session = default_session()
+        configure_connection_pool(pool_maxsize=2)
+        self.assertIsNot(default_session(), session)
+
+    def test_requests_without_session_use_the_shared_pool(self):
+        pooled = Session(
+            Response(payload={"results": [{"id": 1}], "next": "https://next"}),
+            Response(payload={"results": [{"id": 2}], "next": None}),
+        )
+        with mock.patch.object(_common, "default_session", return_value=pooled) as factory:
+            frame = fetch_pnrr_data("missioni", fetch_all_pages=True)
+        self.assertEqual(frame["id"].tolist(), [1, 2])
+        self.assertEqual(factory.call_count, 2)
+        self.assertEqual(len(pooled.calls), 2)
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_the_leader_outcome(self):
+        flight = _common.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait()
+            raise DataSourceError("down")
+
+        errors = []
+
+        def call():
+            try:
+                flight.do("key", work)
+            except DataSourceError as exc:
+                errors.append(exc)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(flight.do("key", lambda: "again"), ("again", True))
+
+    def test_concurrent_json_callers_receive_their_own_payload(self):
+        calls = []
+
+        class SlowSession:
+            def get(self, url, params=None, headers=None, timeout=None):
+                calls.append(url)
+                time.sleep(0.2)
+                return Response(text='{"value": [1]}')
+
+        session = SlowSession()
+        payloads = []
+        threads = [
+            threading.Thread(target=lambda: payloads.append(get_json("https://data.test/x", session=session)))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(payloads, [{"value": [1]}] * 3)
+        self.assertEqual(len({id(payload["value"]) for payload in payloads}), 3)
+
+
+class ResultCacheTests(unittest.TestCase):
+    def test_entries_expire_and_are_bounded_by_frame_memory(self):
+        frame = pd.DataFrame({"value": range(100)})
+        size = int(frame.memory_usage(deep=True).sum())
+        cache = ResultCache(ttl=60, max_bytes=size * 2)
+        for key in ("a", "b", "c"):
+            cache.put(key, frame)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 2)
+        with mock.patch("italian_our_world_data._cache.time.monotonic", return_value=1e12):
+            self.assertIsNone(cache.get("b"))
+
+
+class RateLimitTests(unittest.TestCase):
+    def tearDown(self):
+        _common._HOST_POLICIES.pop("data.test", None)
+        _common._HOST_POLICIES.pop("esploradati.istat.it", None)
+
+    def test_retryable_statuses_wait_for_retry_after(self):
+        session = Session(Response(status=503, headers={"Retry-After": "2"}), Response(text="ok"))
+        with mock.patch.object(_common.time, "sleep") as sleep:
+            response = get_response("https://data.test/slow", session=session)
+        self.assertEqual(response.text, "ok")
+        self.assertEqual(len(session.calls), 2)
+        self.assertGreaterEqual(sleep.call_args[0][0], 2)
+
+    def test_exhausted_retries_surface_as_source_errors(self):
+        configure_host("data.test", retry=RetryPolicy(attempts=2, jitter=0))
+        session = Session(Response(status=429), Response(status=429), Response(text="late"))
+        with mock.patch.object(_common.time, "sleep"):
+            with self.assertRaises(DataSourceError):
+                get_response("https://data.test/busy", session=session)
+        self.assertEqual(len(session.calls), 2)
+
+    def test_long_retry_after_is_not_waited_for(self):
+        session = Session(Response(status=429, headers={"Retry-After": "3600"}), Response(text="ok"))
+        with mock.patch.object(_common.time, "sleep") as sleep:
+            with self.assertRaises(DataSourceError):
+                get_response("https://data.test/quota", session=session)
+        sleep.assert_not_called()
+
+    def test_host_rate_limit_spaces_requests(self):
+        configure_host("data.test", requests_per_second=10, burst=2)
+        session = Session(*(Response(text=str(index)) for index in range(4)))
+        with mock.patch.object(_common.time, "sleep") as sleep:
+            for _ in range(4):
+                get_response("https://data.test/paced", session=session)
+        waits = [call[0][0] for call in sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertTrue(all(0 < wait <= 0.2 for wait in waits))
+
+    def test_source_default_limits_merge_with_user_settings(self):
+        istat = "https://esploradati.istat.it/SDMXWS/rest/data"
+        default = _common._host_policy(istat)
+        self.assertAlmostEqual(default.bucket.rate, 5 / 60)
+        self.assertIsNone(default.retry)
+
+        retry = RetryPolicy(attempts=2)
+        configure_source("istat", retry=retry)
+        self.assertIs(_common._host_policy(istat).bucket, default.bucket)
+        self.assertIs(_common._host_policy(istat).retry, retry)
+        configure_host("esploradati.istat.it", requests_per_second=0)
+        self.assertIsNone(_common._host_policy(istat).bucket)
+
+        _common._HOST_POLICIES.clear()
+        self.assertIs(_common._host_policy(istat).bucket, default.bucket)
+
+    def test_sources_without_fixed_hosts_cannot_be_configured(self):
+        with self.assertRaises(ValueError):
+            configure_source("ckan", requests_per_second=1)
+
+
+class HTTPCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        configure_http_cache(None)
+        self.directory.cleanup()
+
+    def test_stale_entries_are_revalidated_and_reused_on_not_modified(self):
+        configure_http_cache(self.directory.name, ttl=0)
+        session = Session(
+            Response(payload={"value": [1]}, text='{"value": [1]}', headers={"ETag": '"v1"'}),
+            Response(status=304),
+        )
+        first = get_json("https://data.test/cube", params={"b": 2, "a": 1}, session=session)
+        first["value"].append(2)
+        second = get_json("https://data.test/cube", params={"a": 1, "b": 2}, session=session)
+        self.assertEqual(second, {"value": [1]})
+        second["value"].clear()
+        self.assertEqual(_common._PARSED_JSON.popitem()[1], {"value": [1]})
+        self.assertIsNone(session.calls[0][2])
+        self.assertEqual(session.calls[1][2]["If-None-Match"], '"v1"')
+
+    def test_fresh_entries_skip_the_network_unless_bypassed(self):
+        configure_http_cache(self.directory.name, ttl=3600)
+        session = Session(Response(text="a,b\n1,2\n"), Response(text="a,b\n3,4\n"))
+        get_response("https://data.test/file.csv", session=session)
+        cached = get_response("https://data.test/file.csv", session=session)
+        self.assertIsNone(cached.raw)
+        self.assertEqual(cached.text, "a,b\n1,2\n")
+        self.assertEqual(len(session.calls), 1)
+
+        bypassed = get_response("https://data.test/file.csv", session=session, cache=False)
+        self.assertEqual(bypassed.text, "a,b\n3,4\n")
+        with bypass_http_cache():
+            self.assertIsNone(_common._active_cache(None))
+
+    def test_bodies_evicted_after_lookup_are_fetched_again(self):
+        store = configure_http_cache(self.directory.name, ttl=3600)
+        session = Session(
+            Response(text="a,b\n1,2\n", headers={"ETag": '"v1"'}),
+            Response(text="a,b\n3,4\n", headers={"ETag": '"v2"'}),
+            Response(status=304),
+            Response(text="a,b\n5,6\n"),
+        )
+        get_response("https://data.test/evicted.csv", session=session)
+        load = store.load
+
+        def load_then_evict(key):
+            entry = load(key)
+            entry.path.unlink()
+            return entry
+
+        with mock.patch.object(store, "load", load_then_evict):
+            fresh = get_response("https://data.test/evicted.csv", session=session)
+            self.assertEqual(fresh.text, "a,b\n3,4\n")
+            self.assertNotIn("If-None-Match", session.calls[1][2] or {})
+
+            store.ttl = 0
+            revalidated = get_response("https://data.test/evicted.csv", session=session)
+        self.assertEqual(revalidated.text, "a,b\n5,6\n")
+        self.assertEqual(session.calls[2][2]["If-None-Match"], '"v2"')
+        self.assertIsNone(session.calls[3][2])
+
+    def test_cache_evicts_least_recently_used_bodies(self):
+        store = configure_http_cache(self.directory.name, ttl=3600, max_bytes=10)
+        session = Session(Response(text="123456"), Response(text="abcdef"))
+        get_response("https://data.test/one", session=session)
+        for path in store.directory.glob("*.json"):
+            os.utime(path, (0, 0))
+        get_response("https://data.test/two", session=session)
+        self.assertEqual(len(list(store.directory.glob("*.body"))), 1)
+        self.assertEqual(get_response("https://data.test/two", session=session).text, "abcdef")
+
+
+class StreamingCsvTests(unittest.TestCase):
+    body = "TIME_PERIOD,OBS_VALUE,REF_AREA\n2021,1.5,IT\n2022,2.5,IT\n2023,3.5,FR\n".encode()
+
+    def test_csv_frame_parses_the_byte_stream_in_chunks(self):
+        chunks = list(csv_frame(streamed_response(self.body), chunksize=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[1].loc[2, "REF_AREA"], "FR")
+
+    def test_observation_fetchers_stream_chunks_when_requested(self):
+        session = StreamingSession(streamed_response(self.body))
+        chunks = fetch_oecd_data("OECD.TEST,FLOW,", chunksize=2, session=session)
+        frame = pd.concat(list(chunks), ignore_index=True)
+        self.assertEqual(frame["value"].tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual(frame["time_period"].tolist(), ["2021", "2022", "2023"])
+        self.assertTrue(session.calls[0][4])
+
+    def test_observation_frames_are_compact_unless_disabled(self):
+        body = self.body + b"2024,4.5,FR\n"
+        compact = fetch_oecd_data(
+            "OECD.TEST,FLOW,", value_dtype="float32", session=StreamingSession(streamed_response(body))
+        )
+        self.assertIsInstance(compact["ref_area"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(compact["time_period"].dtype, pd.CategoricalDtype)
+        self.assertEqual(compact["value"].dtype, "float32")
+        self.assertEqual(compact["time_period"].tolist(), ["2021", "2022", "2023", "2024"])
+
+        plain = fetch_oecd_data(
+            "OECD.TEST,FLOW,", compact=False, session=StreamingSession(streamed_response(body))
+        )
+        self.assertNotIsInstance(plain["ref_area"].dtype, pd.CategoricalDtype)
+        self.assertEqual(plain["value"].dtype, "float64")
+
+    def test_streamed_requests_report_bytes_once_fully_read(self):
+        events = []
+        _common.add_event_listener(events.append)
+        try:
+            session = StreamingSession(streamed_response(self.body))
+            list(fetch_oecd_data("OECD.TEST,FLOW,", chunksize=2, session=session))
+        finally:
+            _common.remove_event_listener(events.append)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].bytes, len(self.body))
+        self.assertFalse(events[0].from_cache)
+
+    def test_compressed_streams_report_transfer_and_decoded_bytes(self):
+        compressed = gzip.compress(self.body)
+        response = streamed_response(b"", headers={"Content-Encoding": "gzip"})
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(compressed),
+            headers={"Content-Encoding": "gzip"},
+            preload_content=False,
+        )
+        with _common.record_events() as events:
+            chunks = fetch_oecd_data("OECD.TEST,FLOW,", chunksize=2, session=StreamingSession(response))
+            frame = pd.concat(list(chunks), ignore_index=True)
+        self.assertEqual(frame["value"].tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual(events[0].bytes, len(self.body))
+        self.assertEqual(events[0].transfer_bytes, len(compressed))
+        self.assertEqual(events[0].content_encoding, "gzip")
+
+    def test_gzip_file_bodies_are_decompressed_while_streaming(self):
+        body = gzip.compress(self.body[:40]) + gzip.compress(self.body[40:])
+        chunks = list(csv_frame(streamed_response(body), chunksize=2))
+        self.assertEqual(pd.concat(chunks)["REF_AREA"].tolist(), ["IT", "IT", "FR"])
+        self.assertEqual(delimited_frame(gzip.compress(self.body))["OBS_VALUE"].tolist(), [1.5, 2.5, 3.5])
+        with self.assertRaises(DataSourceError):
+            delimited_frame(b"\x1f\x8b\x08\x00" + bytes(6) + b"\xff" * 8)
+
+    def test_streamed_bodies_are_cached_to_disk_and_served_back(self):
+        with tempfile.TemporaryDirectory() as directory:
+            configure_http_cache(directory, ttl=3600)
+            try:
+                session = StreamingSession(streamed_response(self.body))
+                first = get_response("https://data.test/flow", session=session, stream=True)
+                self.assertEqual(len(csv_frame(first)), 3)
+                first.close()
+                second = get_response("https://data.test/flow", session=session, stream=True)
+                self.assertEqual(len(csv_frame(second)), 3)
+                second.close()
+                self.assertTrue(second.raw.closed)
+                unread = get_response("https://data.test/flow", session=session, stream=True)
+                unread.close()
+                self.assertTrue(unread.raw.closed)
+                self.assertEqual(len(session.calls), 1)
+            finally:
+                configure_http_cache(None)
+
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class JsonDecodingTests(unittest.TestCase):
+    def decode(self, body):
+        session = StreamingSession(streamed_response(body))
+        return get_json("https://data.test/payload.json", session=session)
+
+    def test_payloads_decode_with_and_without_orjson(self):
+        body = '{"value": [1.5, null], "label": "Città", "nan": NaN}'.encode()
+        decoded = self.decode(body)
+        self.assertEqual(decoded["label"], "Città")
+        self.assertTrue(pd.isna(decoded["nan"]))
+        with mock.patch.object(_common, "orjson", None):
+            self.assertEqual(self.decode(body)["value"], [1.5, None])
+        self.assertEqual(self.decode('{"a": 1}'.encode("utf-16"))["a"], 1)
+
+    def test_invalid_json_is_a_source_error(self):
+        with self.assertRaisesRegex(DataSourceError, "Invalid JSON"):
+            self.decode(b"<html>maintenance</html>")
+
+
+class ArrowResultTests(unittest.TestCase):
+    body = b"TIME_PERIOD,OBS_VALUE,REF_AREA\n2021,1.5,IT\n2022,2.5,001\n"
+
+    def test_unknown_formats_are_rejected(self):
+        with self.assertRaises(ValueError):
+            fetch_oecd_data("OECD.TEST,FLOW,", result_format="polars", session=StreamingSession())
+
+    def test_missing_pyarrow_is_reported(self):
+        with mock.patch.dict(sys.modules, {"pyarrow": None}):
+            with self.assertRaisesRegex(ImportError, "pyarrow"):
+                jsonstat_table(JsonStatTests.payload)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_sdmx_csv_is_parsed_straight_into_arrow(self):
+        session = StreamingSession(streamed_response(self.body))
+        table = fetch_oecd_data("OECD.TEST,FLOW,", result_format="arrow", session=session)
+        self.assertEqual(table.column_names, ["time_period", "value", "ref_area"])
+        self.assertEqual(table.column("ref_area").to_pylist(), ["IT", "001"])
+        self.assertEqual(str(table.schema.field("value").type), "double")
+
+        session = StreamingSession(streamed_response(self.body))
+        frame = fetch_oecd_data("OECD.TEST,FLOW,", result_format="pandas_arrow", session=session)
+        self.assertIsInstance(frame["value"].dtype, pd.ArrowDtype)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_jsonstat_and_converted_sources_return_tables(self):
+        table = jsonstat_table({**JsonStatTests.payload, "value": {"0": 1.0, "5": 6.0}})
+        self.assertEqual(table.column("geo").to_pylist(), ["IT", "FR"])
+        self.assertEqual(table.column("time_period").to_pylist(), ["2021", "2023"])
+
+        session = Session(Response(payload={"results": [{"id": 1}], "next": None}))
+        with mock.patch.object(_common, "default_session", return_value=session):
+            converted = fetch_data("pnrr", "missioni", result_format="arrow", use_cache=False)
+        self.assertEqual(converted.column("id").to_pylist(), [1])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_geometry_columns_are_converted_to_wkb(self):
+        import geopandas
+        from shapely.geometry import Point
+
+        frame = geopandas.GeoDataFrame({"cod_reg": [3]}, geometry=[Point(9.0, 45.0)])
+        table = to_result_format(frame, "arrow")
+        self.assertEqual(str(table.schema.field("geometry").type), "binary")
+        self.assertEqual(table.column("geometry").to_pylist(), [Point(9.0, 45.0).wkb])
+
+
+class DelimitedCsvTests(unittest.TestCase):
+    def test_dialect_and_encoding_are_detected_from_the_prefix(self):
+        body = 'anno;comune;nota\n2023;"Forlì";"a;b"\n2024;Città;c\n'.encode("cp1252")
+        with mock.patch.object(pd, "read_csv", wraps=pd.read_csv) as read_csv:
+            frame = delimited_frame(body)
+        self.assertEqual(read_csv.call_args.kwargs["engine"], "c")
+        self.assertEqual(read_csv.call_args.kwargs["sep"], ";")
+        self.assertEqual(frame["comune"].tolist(), ["Forlì", "Città"])
+        self.assertEqual(frame.loc[0, "nota"], "a;b")
+
+    def test_invalid_utf8_after_the_sample_falls_back_to_latin1(self):
+        rows = "".join(f"{index},plain\n" for index in range(20000))
+        body = ("id,name\n" + rows).encode() + "20000,Forlì\n".encode("latin-1")
+        frame = delimited_frame(body)
+        self.assertEqual(frame["name"].iloc[-1], "Forlì")
+
+    def test_explicit_options_override_detection(self):
+        frame = delimited_frame(b"a|b\n1|2\n", sep="|", dtype=str)
+        self.assertEqual(frame.loc[0, "b"], "2")
+
+
+class JsonStatTests(unittest.TestCase):
+    payload = {
+        "id": ["geo", "unit", "time"],
+        "size": [2, 1, 3],
+        "dimension": {
+            "geo": {"category": {"index": {"IT": 0, "FR": 1}}},
+            "unit": {"category": {"index": ["EUR"]}},
+            "time": {"category": {"index": {"2021": 0, "2022": 1, "2023": 2}}},
+        },
+    }
+
+    def test_dense_and_sparse_values_decode_to_the_same_rows(self):
+        dense = jsonstat_frame({**self.payload, "value": [1.0, None, 3.0, None, 5.0, 6.0]})
+        sparse = jsonstat_frame({**self.payload, "value": {"0": 1.0, "2": 3.0, "4": 5.0, "5": 6.0}})
+        pd.testing.assert_frame_equal(dense, sparse)
+        self.assertEqual(dense["geo"].tolist(), ["IT", "IT", "FR", "FR"])
+        self.assertEqual(dense["time_period"].tolist(), ["2021", "2023", "2022", "2023"])
+        self.assertEqual(dense["value"].tolist(), [1.0, 3.0, 5.0, 6.0])
+        self.assertIsInstance(dense["geo"].dtype, pd.CategoricalDtype)
+
+    def test_streaming_parser_matches_the_in_memory_decoder(self):
+        dense = [1.0, None, 3.0, None, 5.0, 6.0]
+        sparse = {"0": 1.0, "2": 3.0, "4": 5.0, "5": 6.0}
+        status = {"2": "p"}
+        documents = [
+            {"version": "2.0", "value": sparse, "status": status, **self.payload},
+            {**self.payload, "status": status, "value": dense},
+        ]
+        expected = jsonstat_frame({**self.payload, "value": sparse})
+        for document in documents:
+            body = json.dumps(document, indent=1).encode()
+            with mock.patch.object(_jsonstat._Scanner.__init__, "__defaults__", (5,)):
+                chunks = list(_jsonstat.iter_jsonstat_frames(io.BytesIO(body), chunksize=3))
+            self.assertEqual([len(chunk) for chunk in chunks], [3, 1])
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+    def test_eurostat_chunks_stream_the_response(self):
+        body = json.dumps({**self.payload, "value": {"1": 2.0, "3": 4.0}}).encode()
+        session = StreamingSession(streamed_response(body))
+        chunks = list(fetch_eurostat_data("demo_r_test", chunksize=1, session=session))
+        self.assertEqual([chunk.loc[0, "value"] for chunk in chunks], [2.0, 4.0])
+        self.assertTrue(session.calls[0][4])
+
+    def test_positions_outside_the_cube_are_source_errors(self):
+        with self.assertRaises(DataSourceError):
+            jsonstat_frame({**self.payload, "value": {"6": 1.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
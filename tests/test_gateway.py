@@ -1,9 +1,13 @@
+import asyncio
 import io
 import json
 import sys
+import threading
+import time
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
@@ -11,15 +15,24 @@ import pandas as pd
 import requests
 
 from italian_our_world_data import (
+    CallSummary,
     DataSourceError,
+    ParseEvent,
+    RequestEvent,
+    async_discover_data,
+    async_fetch_data,
+    clear_result_cache,
     discover_data,
     fetch_data,
+    fetch_many,
     get_source_info,
     list_indicators,
     list_source_items,
     list_sources,
+    record_events,
     source_info,
 )
+from italian_our_world_data import _common, aio
 from italian_our_world_data.cli import main as cli_main
 
 
@@ -52,7 +65,30 @@ class Session:
         return self.responses.pop(0)
 
 
+class ConcurrentSession:
+    def __init__(self, payloads, delay=0.02):
+        self.payloads = payloads
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return Response(payload=self.payloads[url.rsplit("/", 1)[-1]])
+
+
 class GatewayTests(unittest.TestCase):
+    def setUp(self):
+        clear_result_cache()
+
     def test_sources_are_listed_with_gateway_functions(self):
         frame = list_sources()
         self.assertIn("istat", frame["source"].tolist())
@@ -147,6 +183,116 @@ class GatewayTests(unittest.TestCase):
         )
         self.assertEqual(frame.loc[0, "cube_id"], "BANKITALIA:DIFF:CUBE:TUFF0100")
 
+    def test_fetch_many_keeps_input_order_and_reports_failures(self):
+        session = ConcurrentSession(
+            {name: {"results": [{"name": name}], "next": None} for name in ("a", "b", "c")}
+        )
+        results = fetch_many(
+            [
+                ("pnrr", {"resource": "a", "session": session}),
+                ("not-a-source", {}),
+                ("openpnrr", {"resource": "c", "session": session}),
+                ("pnrr", {"resource": "b", "session": session}),
+            ],
+            max_workers=4,
+            max_per_host=1,
+        )
+        self.assertEqual([result.ok for result in results], [True, False, True, True])
+        self.assertEqual(results[0].data.loc[0, "name"], "a")
+        self.assertEqual(results[2].data.loc[0, "name"], "c")
+        self.assertEqual(results[3].data.loc[0, "name"], "b")
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(session.peak, 1)
+
+    def test_identical_concurrent_requests_share_one_download(self):
+        session = ConcurrentSession({"a": {"results": [{"name": "a"}], "next": None}}, delay=0.2)
+        frames = []
+
+        def fetch():
+            frames.append(fetch_data("pnrr", resource="a"))
+
+        with mock.patch.object(_common, "default_session", return_value=session):
+            threads = [threading.Thread(target=fetch) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(session.calls, 1)
+        self.assertEqual([frame.loc[0, "name"] for frame in frames], ["a"] * 4)
+        self.assertEqual(len({id(frame) for frame in frames}), 4)
+
+    def test_parsed_results_are_cached_as_copies(self):
+        session = ConcurrentSession({"a": {"results": [{"name": "a"}], "next": None}}, delay=0)
+        with mock.patch.object(_common, "default_session", return_value=session):
+            first = fetch_data("pnrr", resource="a")
+            first.loc[0, "name"] = "changed"
+            second = fetch_data("pnrr", "a")
+            self.assertEqual(second.loc[0, "name"], "a")
+            self.assertEqual(session.calls, 1)
+            fetch_data("pnrr", "a", use_cache=False)
+            self.assertEqual(session.calls, 2)
+
+    def test_gateway_calls_report_request_parse_and_summary_events(self):
+        session = ConcurrentSession({"a": {"results": [{"name": "a"}], "next": None}}, delay=0)
+        with mock.patch.object(_common, "default_session", return_value=session):
+            with record_events() as events:
+                fetch_data("pnrr", resource="a")
+                fetch_data("pnrr", resource="a")
+        request, parse, first, second = events
+        self.assertIsInstance(request, RequestEvent)
+        self.assertEqual((request.source, request.status, request.method), ("pnrr", 200, "GET"))
+        self.assertIsNotNone(request.bytes)
+        self.assertIsInstance(parse, ParseEvent)
+        self.assertEqual(parse.parser, "json")
+        self.assertIsInstance(first, CallSummary)
+        self.assertEqual((first.function, first.requests), ("fetch_pnrr_data", 1))
+        self.assertFalse(first.result_cache_hit)
+        self.assertEqual((second.requests, second.result_cache_hit), (0, True))
+
+    def test_async_gateway_and_generated_providers(self):
+        session = ConcurrentSession(
+            {
+                "a": {"results": [{"name": "a"}], "next": None},
+                "b": {"results": [{"name": "b"}], "next": None},
+                "": {"missioni": "https://openpnrr.it/api/v1/missioni"},
+            }
+        )
+
+        async def gather():
+            return await asyncio.gather(
+                async_fetch_data("pnrr", resource="a", session=session),
+                aio.async_fetch_pnrr_data("b", session=session),
+                async_discover_data("pnrr", session=session),
+            )
+
+        first, second, resources = asyncio.run(gather())
+        self.assertEqual(first.loc[0, "name"], "a")
+        self.assertEqual(second.loc[0, "name"], "b")
+        self.assertEqual(resources.loc[0, "resource"], "missioni")
+        self.assertIn("async_list_bankitalia_bds_cubes", aio.ASYNC_PROVIDERS)
+        self.assertNotIn("async_None", aio.ASYNC_PROVIDERS)
+
+    def test_async_transport_awaits_retries_without_threads(self):
+        class AsyncClient:
+            def __init__(self, *responses):
+                self.responses = list(responses)
+                self.calls = []
+
+            async def get(self, url, params=None, headers=None, timeout=None):
+                self.calls.append((url, params, threading.current_thread()))
+                return self.responses.pop(0)
+
+        client = AsyncClient(Response(status=503), Response(text='{"value": [1]}'))
+        with mock.patch.object(aio.asyncio, "sleep", new=mock.AsyncMock()) as sleep:
+            payload = asyncio.run(aio.async_get_json("https://data.test/x", params={"a": 1}, client=client))
+        self.assertEqual(payload, {"value": [1]})
+        self.assertEqual(len(client.calls), 2)
+        self.assertIs(client.calls[0][2], threading.main_thread())
+        self.assertGreater(sleep.await_args_list[-1].args[0], 0)
+
+        with self.assertRaises(DataSourceError):
+            asyncio.run(aio.async_get_response("https://data.test/x", client=AsyncClient(Response(status=404))))
+
     def test_unknown_source_has_clear_error(self):
         with self.assertRaisesRegex(ValueError, "Unknown source"):
             source_info("not-a-source")
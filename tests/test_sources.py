@@ -1,7 +1,11 @@
 import io
+import json
+import tempfile
+import threading
 import unittest
 import sys
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
@@ -30,6 +34,7 @@ from italian_our_world_data import (
     fetch_pnrr_data,
     fetch_socrata_data,
     fetch_un_population_data,
+    fetch_world_bank_batch,
     fetch_world_bank_data,
     fetch_administrative_boundaries,
     fetch_administrative_boundary_metadata,
@@ -40,6 +45,11 @@ from italian_our_world_data import (
     get_italian_open_data_dataset_metadata,
     get_lombardy_dataset_metadata,
     get_socrata_dataset_metadata,
+    iter_ckan_datastore,
+    iter_lombardy_data,
+    iter_opencoesione_data,
+    iter_pnrr_data,
+    iter_socrata_data,
     list_ameco_variables,
     list_administrative_boundary_divisions,
     list_bankitalia_bds_catalogue,
@@ -66,6 +76,7 @@ from italian_our_world_data import (
     search_fred_series,
 )
 
+
 class Response:
     def __init__(self, *, text="", payload=None, content=None, status=200):
         self.text = text
@@ -95,6 +106,39 @@ class Session:
         return self.responses.pop(0)
 
 
+class PagedSession:
+    """Answer concurrent requests by their ``page`` parameter."""
+
+    def __init__(self, pages):
+        self.pages = {page: list(responses) for page, responses in pages.items()}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((url, dict(params or {}), headers, timeout))
+            return self.pages[(params or {}).get("page", 1)].pop(0)
+
+
+class RoutingSession:
+    """Answer concurrent requests with ``route(url, params)``."""
+
+    def __init__(self, route):
+        self.route = route
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((url, dict(params or {}), headers, timeout))
+        return self.route(url, params or {})
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((url, dict(data or {}), headers, timeout))
+        return self.route(url, data or {})
+
+
 class SourceTests(unittest.TestCase):
     csv_text = "TIME_PERIOD,OBS_VALUE,FREQ\n2023,4.5,A\n"
     boundary_geojson = {
@@ -210,6 +254,24 @@ class SourceTests(unittest.TestCase):
         self.assertEqual(ecb.loc[0, "dataflow_id"], "EXR")
         self.assertEqual(estat.loc[0, "name"], "Rates")
 
+    def test_xml_catalogues_parse_incrementally(self):
+        flows = "".join(
+            f'<s:Dataflow agencyID="ESTAT" id="F{index}" version="1.0">'
+            f'<c:Annotations><c:Annotation><c:AnnotationTitle>x</c:AnnotationTitle>'
+            f'</c:Annotation></c:Annotations><c:Name xml:lang="en">Flow {index}</c:Name>'
+            "</s:Dataflow>"
+            for index in range(3)
+        )
+        xml = (
+            '<m:Structure xmlns:m="message" xmlns:s="structure" xmlns:c="common">'
+            f"<m:Structures><s:Dataflows>{flows}</s:Dataflows></m:Structures></m:Structure>"
+        ).encode()
+        catalogue = list_eurostat_dataflows(session=Session(Response(content=xml)))
+        self.assertEqual(catalogue["name"].tolist(), ["Flow 0", "Flow 1", "Flow 2"])
+        self.assertEqual(catalogue["dataflow_id"].tolist(), ["F0", "F1", "F2"])
+        with self.assertRaises(DataSourceError):
+            list_ecb_dataflows(session=Session(Response(content=b"<broken")))
+
     def test_ameco_lists_variables_and_fetches_annual_series(self):
         buffer = io.BytesIO()
         variables = pd.DataFrame(
@@ -240,6 +302,40 @@ class SourceTests(unittest.TestCase):
         self.assertEqual(session.calls[0][1]["fullVariable"], "1.0.0.0.NPTD")
         self.assertEqual(session.calls[0][1]["years"], "2022,2023")
 
+    def test_ameco_parser_walks_only_the_data_table(self):
+        html = """
+        <html><body>
+        <table><tr><td>AMECO</td><td>Menu</td></tr></table>
+        <table>
+          <tr><th>Country</th><th>Label</th><th>Unit</th><th>2022</th><th>2023</th></tr>
+          <tr><td>Italy</td><td>GDP</td><td>bn EUR</td><td>1,909.2</td><td>n.a.</td></tr>
+          <tr><td>France</td><td>GDP</td><td>bn EUR</td><td>2,639.1</td><td>2,803.0</td></tr>
+        </table>
+        </body></html>
+        """
+        frame = fetch_ameco_data("1.0.0.0.UVGD", countries=["ITA", "FRA"], session=Session(Response(text=html)))
+        self.assertEqual(frame["country"].tolist(), ["Italy", "France", "Italy", "France"])
+        self.assertEqual(frame["time_period"].tolist(), ["2022", "2022", "2023", "2023"])
+        self.assertEqual(frame["value"].tolist()[:2], [1909.2, 2639.1])
+        self.assertTrue(pd.isna(frame.loc[2, "value"]))
+        self.assertEqual(frame.loc[0, "full_variable"], "1.0.0.0.UVGD")
+        self.assertEqual(
+            frame.columns.tolist(),
+            ["full_variable", "country", "indicator", "unit", "time_period", "value"],
+        )
+        reordered = html.replace("<th>Country</th><th>Label</th><th>Unit</th>", "<th>Unit</th><th>Label</th><th>Country</th>")
+        reordered = reordered.replace("<td>Italy</td><td>GDP</td><td>bn EUR</td>", "<td>bn EUR</td><td>GDP</td><td>Italy</td>")
+        frame = fetch_ameco_data("1.0.0.0.UVGD", session=Session(Response(text=reordered)))
+        self.assertEqual(frame.columns.tolist()[1:4], ["country", "indicator", "unit"])
+        self.assertEqual(frame.loc[0, "country"], "Italy")
+
+        notice = "<table><tr><th>Code</th><th>Rows</th></tr><tr><td>UVGD</td><td>0</td></tr></table>"
+        frame = fetch_ameco_data("1.0.0.0.UVGD", session=Session(Response(text=notice)))
+        self.assertEqual(frame.columns.tolist(), ["Code", "Rows"])
+        self.assertEqual(frame.loc[0, "Rows"], 0)
+        with self.assertRaises(DataSourceError):
+            fetch_ameco_data("1.0.0.0.UVGD", session=Session(Response(text="<p>maintenance</p>")))
+
     def test_world_bank_reads_all_pages(self):
         item1 = {"country": {"id": "IT", "value": "Italy"}, "indicator": {"id": "X", "value": "X"}, "date": "2023", "value": 1}
         item2 = {"country": {"id": "IT", "value": "Italy"}, "indicator": {"id": "X", "value": "X"}, "date": "2022", "value": 2}
@@ -248,6 +344,76 @@ class SourceTests(unittest.TestCase):
         self.assertEqual(frame["value"].tolist(), [1, 2])
         self.assertEqual(len(session.calls), 2)
 
+    def test_world_bank_fetches_remaining_pages_concurrently_in_order(self):
+        def item(year):
+            return {"country": {"id": "IT", "value": "Italy"}, "indicator": {"id": "X"}, "date": str(year), "value": year}
+
+        session = PagedSession(
+            {
+                1: [Response(payload=[{"pages": 4}, [item(2023)]])],
+                2: [Response(payload=[{}, [item(2022)]])],
+                3: [Response(payload=[{"message": [{"id": "120"}]}]), Response(payload=[{}, [item(2021)]])],
+                4: [Response(payload=[{}, [item(2020), item(2019)]])],
+            }
+        )
+        with mock.patch("italian_our_world_data.sources.time.sleep") as sleep:
+            frame = fetch_world_bank_data("X", session=session)
+        sleep.assert_called_once()
+        self.assertGreaterEqual(sleep.call_args.args[0], 0.5)
+        self.assertLessEqual(sleep.call_args.args[0], 0.75)
+        self.assertEqual(frame["time_period"].tolist(), ["2023", "2022", "2021", "2020", "2019"])
+        self.assertEqual(frame["value"].tolist(), [2023, 2022, 2021, 2020, 2019])
+        self.assertEqual(frame["indicator_id"].unique().tolist(), ["X"])
+        self.assertEqual(sorted(call[1]["page"] for call in session.calls), [1, 2, 3, 3, 4])
+
+        broken = PagedSession({1: [Response(payload=[{"pages": 2}, []])], 2: [Response(payload={})] * 3})
+        with mock.patch("italian_our_world_data.sources.time.sleep") as sleep, self.assertRaises(DataSourceError):
+            fetch_world_bank_data("X", session=broken)
+        self.assertEqual(len(broken.calls), 4)
+        first, second = (call.args[0] for call in sleep.call_args_list)
+        self.assertTrue(0.5 <= first <= 0.75 and 1.0 <= second <= 1.5)
+
+        failing = PagedSession({1: [Response(payload=[{"pages": 2}, []])], 2: [Response(status=500)]})
+        with mock.patch("italian_our_world_data.sources.time.sleep") as sleep, self.assertRaises(DataSourceError):
+            fetch_world_bank_data("X", session=failing)
+        self.assertEqual(len(failing.calls), 2)
+        sleep.assert_not_called()
+
+    def test_world_bank_batch_packs_indicators_and_countries_into_few_requests(self):
+        indicators = [f"IND.{index:03d}.TOTAL" for index in range(130)]
+        countries = ["ITA", "FRA", "DEU", "ESP"]
+
+        def route(url, params):
+            path_countries = url.split("/country/")[1].split("/")[0].split(";")
+            path_indicators = url.split("/indicator/")[1].split(";")
+            self.assertLessEqual(len(path_indicators), 60)
+            self.assertEqual(params["source"], 2)
+            items = [
+                {"country": {"id": country, "value": country}, "indicator": {"id": indicator, "value": indicator}, "date": "2023", "value": 1.0}
+                for indicator in path_indicators
+                for country in path_countries
+            ]
+            page = params["page"]
+            return Response(payload=[{"pages": 2}, items[: len(items) // 2] if page == 1 else items[len(items) // 2 :]])
+
+        session = RoutingSession(route)
+        frame = fetch_world_bank_batch(indicators, "ITA;FRA;DEU;ESP", start_year=2023, session=session)
+        def full_length(call):
+            return len(requests.Request("GET", call[0], params=call[1]).prepare().url)
+
+        urls = {call[0] for call in session.calls}
+        self.assertEqual(len(urls), 3)
+        self.assertTrue(all(full_length(call) <= 2000 for call in session.calls))
+        self.assertEqual(len(session.calls), 6)
+        self.assertEqual(len(frame), len(indicators) * len(countries))
+        self.assertEqual(set(frame["indicator_id"]), set(indicators))
+        self.assertEqual(frame.loc[0, "indicator_id"], "IND.000.TOTAL")
+
+        short = RoutingSession(route)
+        fetch_world_bank_batch(indicators[:10], countries, max_url_length=200, session=short)
+        self.assertTrue(all(full_length(call) <= 200 for call in short.calls))
+        self.assertGreater(len({call[0] for call in short.calls}), 1)
+
     def test_world_bank_indicator_catalogue_is_listed(self):
         item = {"id": "NY.GDP", "name": "GDP", "unit": "USD", "source": {"value": "WDI"}}
         frame = list_world_bank_indicators(session=Session(Response(payload=[{}, [item]])))
@@ -331,6 +497,31 @@ class SourceTests(unittest.TestCase):
         self.assertIn("/indicators/46/locations/380/start/2023/end/2023", session.calls[0][0])
         self.assertEqual(session.calls[0][2]["Authorization"], "Bearer token")
 
+    def test_un_population_pages_after_the_first_are_fetched_concurrently(self):
+        def route(url, params):
+            number = params["pageNumber"]
+            if url.endswith("/locations"):
+                return Response(payload={"pages": 3, "data": [{"id": number, "name": f"L{number}"}]})
+            rows = [
+                {"location": {"id": location, "name": "x"}, "indicator": {"id": 46}, "timeLabel": str(2000 + number), "value": number}
+                for location in (380, 250)
+            ]
+            return Response(payload={"pageNumber": number, "pages": 4, "data": rows})
+
+        locations = list_un_population_locations(fetch_all_pages=True, session=RoutingSession(route))
+        self.assertEqual(locations["location_id"].tolist(), [1, 2, 3])
+
+        session = RoutingSession(route)
+        data = fetch_un_population_data(46, location_id=[380, 250], auth_token="token", session=session)
+        self.assertIn("/indicators/46/locations/380,250/start/1950/end/2100", session.calls[0][0])
+        self.assertEqual(data["time_period"].tolist(), ["2001", "2001", "2002", "2002", "2003", "2003", "2004", "2004"])
+        self.assertEqual(sorted(call[1]["pageNumber"] for call in session.calls), [1, 2, 3, 4])
+        self.assertTrue(all(call[2]["Authorization"] == "Bearer token" for call in session.calls))
+
+        single = RoutingSession(route)
+        fetch_un_population_data(46, auth_token="token", fetch_all_pages=False, session=single)
+        self.assertEqual(len(single.calls), 1)
+
     def test_bis_catalogue_and_data_are_normalised(self):
         payload = {
             "data": {
@@ -403,6 +594,34 @@ class SourceTests(unittest.TestCase):
         frame = fetch_pnrr_data("missioni", fetch_all_pages=True, session=session)
         self.assertEqual(frame["id"].tolist(), [1, 2])
 
+    def test_pnrr_iterator_prefetches_the_next_page(self):
+        second_requested = threading.Event()
+        pages = {
+            "https://openpnrr.it/api/v1/progetti": {"results": [{"id": 1}, {"id": 2}, {"id": 3}], "next": "https://p/2"},
+            "https://p/2": {"results": [{"id": 4}, {"id": 5}, {"id": 6}], "next": "https://p/3"},
+            "https://p/3": {"results": [{"id": 7}], "next": None},
+        }
+
+        def route(url, params):
+            if url == "https://p/2":
+                second_requested.set()
+            return Response(payload=pages[url])
+
+        session = RoutingSession(route)
+        frames = iter_pnrr_data("progetti", params={"page_size": 3}, session=session)
+        self.assertEqual(next(frames)["id"].tolist(), [1, 2, 3])
+        self.assertTrue(second_requested.wait(5))
+        self.assertEqual([frame["id"].tolist() for frame in frames], [[4, 5, 6], [7]])
+        self.assertEqual(session.calls[0][1], {"page_size": 3})
+        self.assertEqual(session.calls[1][1], {})
+
+        chunks = list(iter_pnrr_data("progetti", chunksize=2, session=RoutingSession(route)))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2, 1])
+        with self.assertRaises(ValueError):
+            iter_pnrr_data("progetti", chunksize=0, session=RoutingSession(route))
+        with self.assertRaises(ValueError):
+            iter_opencoesione_data("progetti", chunksize=0, session=RoutingSession(route))
+
     def test_ckan_lists_metadata_and_downloads_resources(self):
         dataset = {
             "name": "dataset-one",
@@ -505,6 +724,112 @@ class SourceTests(unittest.TestCase):
         self.assertEqual(data.loc[0, "valore"], "24.3")
         self.assertEqual(rows.calls[0][1]["$limit"], 2)
 
+    def test_ckan_datastore_reads_whole_tables_in_parallel_windows(self):
+        table = [{"_id": index, "anno": str(2000 + index % 3), "importo": index * 10} for index in range(1, 11)]
+
+        def route(url, params):
+            if url.endswith("datastore_search_sql"):
+                sql = params["sql"]
+                rows = [row for row in table if "\"anno\" = '2001'" not in sql or row["anno"] == "2001"]
+                if sql.startswith("SELECT count(*)"):
+                    return Response(payload={"success": True, "result": {"records": [{"total": len(rows)}]}})
+                limit, offset = (int(part) for part in sql.split("LIMIT ")[1].split(" OFFSET "))
+                records = [{"importo": row["importo"], "_full_text": "x"} for row in rows[offset : offset + limit]]
+                return Response(payload={"success": True, "result": {"records": records}})
+            self.assertEqual(params["sort"], "_id")
+            window = table[params["offset"] : params["offset"] + params["limit"]]
+            return Response(payload={"success": True, "result": {"records": window, "total": len(table)}})
+
+        session = RoutingSession(route)
+        frame = fetch_bdap_data(
+            resource_id="rid", datastore=True, fetch_all_rows=True, limit=3, max_workers=3, session=session
+        )
+        self.assertEqual(frame["_id"].tolist(), list(range(1, 11)))
+        self.assertEqual([call[1]["offset"] for call in session.calls], [0])
+        self.assertEqual(session.calls[0][1]["limit"], 32000)
+
+        windowed = RoutingSession(route)
+        windows = list(iter_ckan_datastore("https://ckan.test", "rid", chunksize=4, session=windowed))
+        self.assertEqual([len(window) for window in windows], [4, 4, 2])
+        self.assertEqual(sorted(call[1]["offset"] for call in windowed.calls), [0, 4, 8])
+
+        sql = RoutingSession(route)
+        chunks = list(
+            iter_ckan_datastore(
+                "https://ckan.test", "rid", columns=["importo"], filters={"anno": "2001"}, chunksize=2, session=sql
+            )
+        )
+        self.assertEqual(pd.concat(chunks)["importo"].tolist(), [10, 40, 70, 100])
+        self.assertNotIn("_full_text", chunks[0].columns)
+        self.assertIn('SELECT "importo" FROM "rid" WHERE "anno" = \'2001\'', sql.calls[1][1]["sql"])
+        with self.assertRaises(ValueError):
+            iter_ckan_datastore("https://ckan.test", "rid", filters={"importo": [1.5, float("nan")]}, session=sql)
+
+        def sql_disabled(url, params):
+            if url.endswith("datastore_search_sql"):
+                return Response(payload={"success": False, "error": {"message": "Not authorized"}})
+            return route(url, params)
+
+        fallback = RoutingSession(sql_disabled)
+        chunks = list(iter_ckan_datastore("https://ckan.test", "rid", filters={"anno": "2001"}, session=fallback))
+        self.assertEqual(fallback.calls[1][1]["filters"], '{"anno": "2001"}')
+        with self.assertRaises(DataSourceError):
+            list(iter_ckan_datastore("https://ckan.test", "rid", where="importo > 5", session=RoutingSession(sql_disabled)))
+
+    def test_socrata_full_extraction_by_keyset_or_parallel_slices(self):
+        table = [(f"row-{index:02d}", str(index), "A" if index % 2 else "B") for index in range(1, 8)]
+
+        def route(url, params):
+            rows = [row for row in table if "sensore = 'A'" not in params.get("$where", "") or row[2] == "A"]
+            if url.endswith(".json"):
+                return Response(payload=[{"row_count": str(len(rows))}])
+            self.assertEqual(params["$order"], ":id")
+            if ":id >" in params.get("$where", ""):
+                last = params["$where"].split(":id > '")[1].split("'")[0]
+                rows = [row for row in rows if row[0] > last]
+            offset = params.get("$offset", 0)
+            rows = rows[offset : offset + params["$limit"]]
+            if params.get("$select", "").startswith(":id"):
+                lines = [":id,valore,sensore"] + [",".join(row) for row in rows]
+            else:
+                lines = ["valore,sensore"] + [",".join(row[1:]) for row in rows]
+            return Response(text="\n".join(lines) + "\n")
+
+        keyset = RoutingSession(route)
+        chunks = list(iter_socrata_data("https://socrata.test", "abcd-1234", chunksize=3, session=keyset))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(pd.concat(chunks)["valore"].tolist(), [str(index) for index in range(1, 8)])
+        self.assertNotIn(":id", chunks[0].columns)
+        self.assertTrue(keyset.calls[0][0].endswith("/resource/abcd-1234.csv"))
+        self.assertEqual(keyset.calls[1][1]["$where"], "(:id > 'row-03')")
+
+        filtered = RoutingSession(route)
+        frame = fetch_lombardy_data(
+            "abcd-1234", params={"$where": "sensore = 'A'"}, fetch_all_rows=True, session=filtered
+        )
+        self.assertEqual(frame["valore"].tolist(), ["1", "3", "5", "7"])
+
+        sliced = RoutingSession(route)
+        chunks = list(iter_lombardy_data("abcd-1234", chunksize=2, max_workers=3, session=sliced))
+        self.assertEqual(pd.concat(chunks)["valore"].tolist(), [str(index) for index in range(1, 8)])
+        self.assertEqual(sorted(call[1].get("$offset") for call in sliced.calls[1:]), [0, 2, 4, 6])
+        self.assertIn("count(*)", sliced.calls[0][1]["$select"])
+
+        searched = RoutingSession(route)
+        params = {"$q": "A", "$select": "valore", "$where": "sensore = 'A'"}
+        list(iter_lombardy_data("abcd-1234", params=params, max_workers=2, session=searched))
+        count = searched.calls[0][1]
+        self.assertEqual((count["$q"], count["$where"]), ("A", "sensore = 'A'"))
+        self.assertEqual(count["$select"], "count(*) AS row_count")
+
+        def capped(url, params):
+            return route(url, {**params, "$limit": min(params.get("$limit", 2), 2)})
+
+        chunks = list(iter_socrata_data("https://socrata.test", "abcd-1234", chunksize=3, session=RoutingSession(capped)))
+        self.assertEqual(pd.concat(chunks)["valore"].tolist(), [str(index) for index in range(1, 8)])
+        with self.assertRaises(DataSourceError):
+            list(iter_socrata_data("https://socrata.test", "abcd-1234", chunksize=3, max_workers=2, session=RoutingSession(capped)))
+
     def test_lombardy_wrappers_use_socrata_portal(self):
         listing = Session(Response(payload=[{"id": "abcd-1234", "name": "Sensors"}]))
         self.assertEqual(list_lombardy_datasets(session=listing).loc[0, "dataset_id"], "abcd-1234")
@@ -529,6 +854,17 @@ class SourceTests(unittest.TestCase):
         frame = fetch_opencoesione_data("temi", fetch_all_pages=True, session=session)
         self.assertEqual(frame["codice"].tolist(), ["01", "02"])
 
+        session = Session(
+            Response(payload={"results": [{"codice": "01"}], "next": "https://next"}),
+            Response(payload={"results": [], "next": "https://last"}),
+            Response(payload={"results": [{"codice": "03", "tema": {"nome": "Ricerca"}}], "next": None}),
+        )
+        frames = list(iter_opencoesione_data("progetti", session=session))
+        self.assertEqual([len(frame) for frame in frames], [1, 0, 1])
+        self.assertEqual(frames[2].loc[0, "tema.nome"], "Ricerca")
+        with self.assertRaises(ValueError):
+            iter_opencoesione_data("progetti/extra")
+
     def test_bankitalia_currencies_and_exchange_rates(self):
         currencies_payload = {
             "currencies": [
@@ -618,6 +954,61 @@ class SourceTests(unittest.TestCase):
         self.assertEqual(cubes.loc[0, "survey_id"], "TUFF")
         self.assertEqual(cubes.loc[0, "last_update"], "21/05/2026")
 
+    def test_bankitalia_bds_crawl_expands_levels_concurrently_and_resumes(self):
+        def node(local_id, children=0, node_type="CUBESET", **extra):
+            return {
+                "id": f"BANKITALIA:DIFF:CUBE:{local_id}",
+                "localId": local_id,
+                "name": local_id,
+                "nodeType": node_type,
+                "childrenNumber": children,
+                "nodePath": f"BANKITALIA/DIFF/CUBE/{local_id}",
+                **extra,
+            }
+
+        roots = [node("A", 2), node("B", 1, cubes=[node("B1", node_type="CUBE")]), node("C", 1)]
+        subtrees = {
+            "BANKITALIA:DIFF:CUBE:A": [node("A1", node_type="CUBE"), node("A2", 1)],
+            "BANKITALIA:DIFF:CUBE:C": [node("C1", node_type="CUBE")],
+            "BANKITALIA:DIFF:CUBE:A2": [node("A21", node_type="CUBE")],
+        }
+        failing = {"BANKITALIA:DIFF:CUBE:A2"}
+
+        def route(url, data):
+            if "GETTAXOROOTS" in url:
+                return Response(payload=roots)
+            if data["id"] in failing:
+                return Response(status=500)
+            return Response(payload=subtrees[data["id"]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Path(directory) / "bds.json"
+            first = RoutingSession(route)
+            with self.assertRaises(DataSourceError):
+                list_bankitalia_bds_cubes(checkpoint=checkpoint, session=first)
+            self.assertEqual(len(first.calls), 4)
+            journal = checkpoint.read_text().splitlines()
+            self.assertEqual(len(journal), 3)
+            self.assertIn("roots", json.loads(journal[0]))
+            with checkpoint.open("a") as stream:
+                stream.write('{"node": "[\\"BANKITALIA')
+
+            failing.clear()
+            second = RoutingSession(route)
+            catalogue = list_bankitalia_bds_catalogue(
+                max_depth=None, checkpoint=checkpoint, session=second
+            )
+            self.assertEqual(
+                catalogue["local_id"].tolist(), ["A", "B", "C", "A1", "A2", "B1", "C1", "A21"]
+            )
+            self.assertEqual(catalogue.loc[7, "path"], "A > A2 > A21")
+            self.assertEqual(len(second.calls), 1)
+            self.assertEqual(second.calls[0][1]["id"], "BANKITALIA:DIFF:CUBE:A2")
+            self.assertFalse(checkpoint.exists())
+
+        cubes = list_bankitalia_bds_cubes(max_workers=1, limit=2, session=RoutingSession(route))
+        self.assertEqual(cubes["local_id"].tolist(), ["A1", "B1"])
+
     def test_http_failures_are_source_errors(self):
         with self.assertRaises(DataSourceError):
             fetch_ecb_data("EXR", session=Session(Response(status=500)))